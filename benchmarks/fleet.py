@@ -0,0 +1,203 @@
+"""Event loop lag and memory of a fleet of simulated chargers.
+
+Sets up N config entries of simulated chargers and lets them poll for a
+fixed time. Reports:
+    loop_lag: How late a task sleeping in a loop wakes up, a measure of how
+        long callbacks block the event loop (p50, p95, p99, max in seconds).
+    memory: Memory allocated by setting up the entries, measured with
+        tracemalloc, in total, per config entry and per entity, with the
+        files that allocated most of it.
+    state_writes_per_second: States written by the entities, changed or not.
+    state_changes_per_second: Written states that changed.
+
+tracemalloc only traces the setup of the entries, after the integration
+has been loaded, since tracing slows down every allocation and would
+inflate the loop lag. The simulated chargers share the process and event
+loop, so their work is included in the loop lag.
+
+Run with: python -m benchmarks.fleet --entries 1 10 50 [--duration SECONDS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+import gc
+import json
+import logging
+from pathlib import Path
+import platform
+import tracemalloc
+from typing import Any
+
+from custom_components.nrgkick.const import CONF_SCAN_INTERVAL, MIN_SCAN_INTERVAL
+from homeassistant.const import EVENT_STATE_CHANGED, EVENT_STATE_REPORTED
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .harness import (
+    add_entries,
+    async_setup_entries,
+    benchmark_hass,
+    entry_entities,
+    percentile,
+    simulated_fleet,
+)
+
+# Interval of the task measuring the loop lag in seconds.
+LAG_SAMPLE_INTERVAL = 0.05
+# Number of files listed as the largest allocators.
+TOP_ALLOCATORS = 10
+
+
+async def sample_loop_lag(samples: list[float]) -> None:
+    """Append how late each wake-up of a sleeping task is until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + LAG_SAMPLE_INTERVAL
+        await asyncio.sleep(LAG_SAMPLE_INTERVAL)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+def count_state_writes(hass: HomeAssistant, writes: Counter[str]) -> None:
+    """Count the state changed and state reported events in writes.
+
+    The events are counted by the event filter, which rejects them, so
+    counting does not schedule a listener for every write.
+    """
+
+    @callback
+    def _count(event_data: Any) -> bool:
+        writes["changed" if "old_state" in event_data else "reported"] += 1
+        return False
+
+    @callback
+    def _never_called(_event: Event[Any]) -> None:
+        """Never called, since the filter rejects all events."""
+
+    for event_type in (EVENT_STATE_CHANGED, EVENT_STATE_REPORTED):
+        hass.bus.async_listen(event_type, _never_called, event_filter=_count)
+
+
+async def run_fleet(count: int, duration: float, scan_interval: int) -> dict[str, Any]:
+    """Set up count entries, let them poll for duration seconds and report.
+
+    Args:
+        count: Number of simulated chargers and config entries.
+        duration: Seconds to poll after the setup.
+        scan_interval: Scan interval of the entries in seconds.
+
+    Returns:
+        Loop lag, memory, state write and poll statistics of the run.
+
+    """
+    async with simulated_fleet(count + 1) as simulators, benchmark_hass() as hass:
+        # Load the integration, its platforms and translations with an entry
+        # that is removed again, so only the cost of the entries is traced.
+        (warm_up,) = add_entries(hass, simulators[:1])
+        await async_setup_entries(hass)
+        await hass.config_entries.async_remove(warm_up.entry_id)
+
+        gc.collect()
+        tracemalloc.start()
+        baseline = tracemalloc.take_snapshot()
+        entries = add_entries(hass, simulators[1:], {CONF_SCAN_INTERVAL: scan_interval})
+        await asyncio.gather(
+            *(hass.config_entries.async_setup(entry.entry_id) for entry in entries)
+        )
+        await hass.async_block_till_done()
+        gc.collect()
+        allocated = tracemalloc.take_snapshot().compare_to(baseline, "filename")
+        tracemalloc.stop()
+
+        entities = sum(len(entry_entities(hass, entry)) for entry in entries)
+        memory = sum(stat.size_diff for stat in allocated)
+
+        writes: Counter[str] = Counter()
+        count_state_writes(hass, writes)
+        lag: list[float] = []
+        sampler = hass.async_create_background_task(
+            sample_loop_lag(lag), "loop lag sampler"
+        )
+        await asyncio.sleep(duration)
+        sampler.cancel()
+
+        polls = [entry.runtime_data.poll_stats for entry in entries]
+        reported = writes["reported"]
+        return {
+            "entries": count,
+            "entities": entities,
+            "duration": duration,
+            "scan_interval": scan_interval,
+            "loop_lag": {
+                "unit": "s",
+                "samples": len(lag),
+                "p50": percentile(lag, 0.5),
+                "p95": percentile(lag, 0.95),
+                "p99": percentile(lag, 0.99),
+                "max": max(lag),
+            },
+            "memory": {
+                "unit": "B",
+                "total": memory,
+                "per_entry": memory // count,
+                "per_entity": memory // entities if entities else None,
+                "top": [
+                    {"file": stat.traceback[0].filename, "size": stat.size_diff}
+                    for stat in allocated[:TOP_ALLOCATORS]
+                ],
+            },
+            "state_writes_per_second": (writes["changed"] + reported) / duration,
+            "state_changes_per_second": writes["changed"] / duration,
+            "polls": sum(stats.requests for stats in polls),
+            "poll_failures": sum(stats.failures for stats in polls),
+        }
+
+
+async def run_fleets(
+    counts: list[int], duration: float, scan_interval: int
+) -> dict[str, Any]:
+    """Run a fleet of each size in a fresh Home Assistant instance."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [
+            await run_fleet(count, duration, scan_interval) for count in counts
+        ],
+    }
+
+
+def main() -> None:
+    """Run the fleets, print a summary and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--entries", type=int, nargs="+", default=[10], help="fleet sizes to run"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=60, help="seconds to poll per fleet"
+    )
+    parser.add_argument(
+        "--scan-interval", type=int, default=MIN_SCAN_INTERVAL, help="seconds"
+    )
+    parser.add_argument("--output", type=Path, default=Path("fleet.json"))
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    report = asyncio.run(run_fleets(args.entries, args.duration, args.scan_interval))
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    for result in report["results"]:
+        lag = result["loop_lag"]
+        memory = result["memory"]
+        print(
+            f"{result['entries']:>4} entries, {result['entities']:>5} entities: "
+            f"lag p50 {lag['p50'] * 1e3:.1f} ms, p99 {lag['p99'] * 1e3:.1f} ms, "
+            f"max {lag['max'] * 1e3:.1f} ms; "
+            f"{memory['per_entry'] / 1024:.0f} KiB per entry, "
+            f"{memory['per_entity'] / 1024:.1f} KiB per entity; "
+            f"{result['state_writes_per_second']:.1f} state writes/s"
+        )
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
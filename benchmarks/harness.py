@@ -0,0 +1,125 @@
+"""Home Assistant instance with NRGkick entries of simulated chargers.
+
+Builds on the test helpers of pytest_homeassistant_custom_component, so the
+benchmarks run the integration exactly as the tests do, but outside pytest
+and against chargers served by tests.simulator over real HTTP.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+import math
+from typing import Any
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+    mock_storage,
+)
+
+# Importing the integration here, before Home Assistant looks for custom
+# integrations, keeps the custom_components package of the test helpers from
+# shadowing it.
+from custom_components.nrgkick.const import DOMAIN
+from homeassistant import loader
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_platform
+from homeassistant.helpers.entity import Entity
+from homeassistant.setup import async_setup_component
+from tests.simulator import NRGkickSimulator, start_fleet
+
+
+@asynccontextmanager
+async def benchmark_hass() -> AsyncIterator[HomeAssistant]:
+    """Yield a running Home Assistant instance that loads custom integrations.
+
+    Storage is kept in memory and the instance is stopped on exit.
+    """
+    with mock_storage():
+        async with async_test_home_assistant() as hass:
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+            try:
+                yield hass
+            finally:
+                # Unloading closes the HTTP sessions of the devices.
+                for entry in hass.config_entries.async_entries(DOMAIN):
+                    if entry.state is ConfigEntryState.LOADED:
+                        await hass.config_entries.async_unload(entry.entry_id)
+                await hass.async_stop(force=True)
+
+
+@asynccontextmanager
+async def simulated_fleet(
+    count: int, **options: Any
+) -> AsyncIterator[list[NRGkickSimulator]]:
+    """Yield count running simulated chargers and stop them on exit.
+
+    Args:
+        count: Number of chargers.
+        **options: Options passed to each NRGkickSimulator.
+
+    """
+    simulators = await start_fleet(count, **options)
+    try:
+        yield simulators
+    finally:
+        for simulator in simulators:
+            await simulator.stop()
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of values, which must not be empty."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def add_entries(
+    hass: HomeAssistant,
+    simulators: Sequence[NRGkickSimulator],
+    options: dict[str, Any] | None = None,
+) -> list[ConfigEntry]:
+    """Add a config entry for each simulated charger without setting it up."""
+    entries: list[ConfigEntry] = []
+    for simulator in simulators:
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=f"NRGkick {simulator.address}",
+            data={CONF_HOST: simulator.address},
+            options=options or {},
+            unique_id=simulator.charger.serial_number,
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+    return entries
+
+
+async def async_setup_entries(hass: HomeAssistant) -> None:
+    """Set up the integration with all of its config entries.
+
+    Raises:
+        RuntimeError: If the integration or one of its entries fails.
+
+    """
+    if not await async_setup_component(hass, DOMAIN, {}):
+        raise RuntimeError(f"Setting up {DOMAIN} failed")
+    await hass.async_block_till_done()
+    failed = [
+        entry.title
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is not ConfigEntryState.LOADED
+    ]
+    if failed:
+        raise RuntimeError(f"Config entries failed to load: {', '.join(failed)}")
+
+
+def entry_entities(hass: HomeAssistant, entry: ConfigEntry) -> list[Entity]:
+    """Return the entities of a config entry that were added to hass."""
+    return [
+        entity
+        for platform in entity_platform.async_get_platforms(hass, DOMAIN)
+        if platform.config_entry is entry
+        for entity in platform.entities.values()
+    ]
@@ -0,0 +1,106 @@
+"""Representative coordinator data of a charging NRGkick Gen2 SIM."""
+
+from __future__ import annotations
+
+from typing import Any
+
+INFO: dict[str, Any] = {
+    "general": {
+        "serial_number": "T2332500000000000S1D2",
+        "model_type": "NRGkick Gen2 SIM",
+        "device_name": "NRGkick",
+        "rated_current": 32,
+    },
+    "connector": {"phase_count": 3, "max_current": 32, "type": 1, "serial": "A1234567"},
+    "grid": {"voltage": 230, "frequency": 50, "phases": 7},
+    "network": {
+        "ip_address": "192.168.0.10",
+        "mac_address": "AB:CD:12:34:56:78",
+        "ssid": "My WiFi",
+        "rssi": -62,
+    },
+    "cellular": {
+        "imei": "123456789012345",
+        "imsi": "123456789012345",
+        "operator": "DiniTech",
+        "rssi": -60,
+        "mode": 3,
+    },
+    "gps": {
+        "latitude": 46.911354,
+        "longitude": 15.71225,
+        "altitude": 350.343333,
+        "accuracy": 15,
+    },
+    "versions": {
+        "sw_sm": "4.0.0.33",
+        "hw_sm": "1.0.0.3",
+        "sw_ma": "3.1.4.5",
+        "hw_ma": "1.0.0.0",
+        "sw_to": "1.4.1.0",
+        "hw_to": "1.1.0.0",
+        "sw_st": "1.4.4.0",
+        "hw_st": "1.1.0.0",
+        "sw_cm": "1951B15V01",
+    },
+}
+
+CONTROL: dict[str, Any] = {
+    "current_set": 16,
+    "charge_pause": 0,
+    "energy_limit": 0,
+    "phase_count": 3,
+}
+
+
+def _phase(voltage: float, current: float) -> dict[str, Any]:
+    """Return the power flow of a single phase."""
+    return {
+        "voltage": voltage,
+        "current": current,
+        "active_power": round(voltage * current * 0.99, 3),
+        "reactive_power": 120.5,
+        "apparent_power": round(voltage * current, 3),
+        "power_factor": 0.99,
+    }
+
+
+VALUES: dict[str, Any] = {
+    "energy": {"total_charged_energy": 14187000, "charged_energy": 12345},
+    "powerflow": {
+        "charging_voltage": 234.27,
+        "charging_current": 16,
+        "grid_frequency": 50.01,
+        "peak_power": 11100.5,
+        "total_active_power": 11040.5,
+        "total_reactive_power": 361.5,
+        "total_apparent_power": 11152.3,
+        "total_power_factor": 0.99,
+        "l1": _phase(237.88, 15.98),
+        "l2": _phase(237.13, 16.01),
+        "l3": _phase(227.79, 15.95),
+        "n": {"current": 0.12},
+    },
+    "general": {
+        "charging_rate": 62.5,
+        "vehicle_connect_time": 3600,
+        "vehicle_charging_time": 3400,
+        "status": 3,
+        "charge_permitted": 1,
+        "relay_state": 15,
+        "charge_count": 6120,
+        "rcd_trigger": 0,
+        "warning_code": 0,
+        "error_code": 0,
+    },
+    "temperatures": {
+        "housing": 28.33,
+        "connector_l1": 38.22,
+        "connector_l2": 25.97,
+        "connector_l3": 38.0,
+        "domestic_plug_1": 0,
+        "domestic_plug_2": 0,
+    },
+}
+
+DATA: dict[str, Any] = {"info": INFO, "control": CONTROL, "values": VALUES}
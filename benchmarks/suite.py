@@ -0,0 +1,199 @@
+"""Benchmark suite of the NRGkick integration against simulated chargers.
+
+Measures:
+    update_data: One full _async_update_data cycle (all endpoints over HTTP).
+    entity_fanout: Notifying all entities of an entry, which write their state
+        unless a sensor deadband suppresses it.
+    native_value: Evaluating native_value (is_on for binary entities) of all
+        entities of an entry.
+    setup_entry[N]: Setting up the integration with N config entries, each
+        in a fresh Home Assistant instance.
+
+The simulated chargers run in the same process and event loop, so request
+timings include the work of the simulator. Compare results of the same
+machine only.
+
+Results are written as JSON, one object per benchmark with the wall clock
+statistics in seconds and the mean CPU time of the process, so runs of
+different releases can be compared.
+
+Run with: python -m benchmarks.suite [--output FILE] [--rounds N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+import json
+import logging
+from pathlib import Path
+import platform
+import statistics
+import time
+from typing import Any
+
+from custom_components.nrgkick.coordinator import NRGkickDataUpdateCoordinator
+from homeassistant.const import __version__ as HA_VERSION
+
+from .harness import (
+    add_entries,
+    async_setup_entries,
+    benchmark_hass,
+    entry_entities,
+    percentile,
+    simulated_fleet,
+)
+
+MANIFEST = Path(__file__).parents[1] / "custom_components/nrgkick/manifest.json"
+SETUP_ENTRY_COUNTS = (1, 10, 100)
+
+type Round = Callable[[], Awaitable[None]]
+
+
+def summarize(
+    name: str, wall: list[float], cpu: list[float] | None = None, **info: Any
+) -> dict[str, Any]:
+    """Return the statistics of the rounds of a benchmark.
+
+    Args:
+        name: Name of the benchmark in the results.
+        wall: Wall clock time of each round in seconds.
+        cpu: CPU time of the process in each round, if measured.
+        **info: Additional values stored with the result, e.g. entity counts.
+
+    Returns:
+        The result object written to the output file.
+
+    """
+    return {
+        "name": name,
+        "unit": "s",
+        "rounds": len(wall),
+        "mean": statistics.fmean(wall),
+        "median": statistics.median(wall),
+        "p95": percentile(wall, 0.95),
+        "min": min(wall),
+        "max": max(wall),
+        "cpu_mean": statistics.fmean(cpu) if cpu else None,
+        **info,
+    }
+
+
+async def measure(name: str, rounds: int, run: Round, **info: Any) -> dict[str, Any]:
+    """Run a benchmark for rounds rounds after one warm-up round."""
+    await run()
+    wall: list[float] = []
+    cpu: list[float] = []
+    for _ in range(rounds):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        await run()
+        wall.append(time.perf_counter() - wall_start)
+        cpu.append(time.process_time() - cpu_start)
+    return summarize(name, wall, cpu, **info)
+
+
+async def bench_entry(rounds: int) -> list[dict[str, Any]]:
+    """Benchmark polling and entity updates of a single config entry."""
+    async with simulated_fleet(1) as simulators, benchmark_hass() as hass:
+        (entry,) = add_entries(hass, simulators)
+        await async_setup_entries(hass)
+        coordinator: NRGkickDataUpdateCoordinator = entry.runtime_data
+        entities = entry_entities(hass, entry)
+
+        async def update_data() -> None:
+            await coordinator._async_update_data()  # noqa: SLF001
+
+        async def entity_fanout() -> None:
+            # Forget the notified values so every entity counts as changed.
+            coordinator._notified = None  # noqa: SLF001
+            coordinator.async_update_listeners()
+            await hass.async_block_till_done()
+
+        value_properties = [
+            "native_value" if hasattr(entity, "native_value") else "is_on"
+            for entity in entities
+        ]
+        pairs = list(zip(value_properties, entities, strict=True))
+
+        async def native_value() -> None:
+            for value_property, entity in pairs:
+                getattr(entity, value_property)
+
+        return [
+            await measure("update_data", rounds, update_data),
+            await measure(
+                "entity_fanout",
+                rounds,
+                entity_fanout,
+                entities=len(coordinator._listeners),  # noqa: SLF001
+            ),
+            await measure(
+                "native_value", rounds * 10, native_value, entities=len(entities)
+            ),
+        ]
+
+
+async def bench_setup_entry(count: int, rounds: int) -> dict[str, Any]:
+    """Benchmark setting up the integration with count config entries.
+
+    Only the setup is timed, not starting Home Assistant and the chargers.
+    """
+    wall: list[float] = []
+    cpu: list[float] = []
+    entities = 0
+    # The first round imports the platforms and is not counted.
+    for _ in range(rounds + 1):
+        async with simulated_fleet(count) as simulators, benchmark_hass() as hass:
+            add_entries(hass, simulators)
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            await async_setup_entries(hass)
+            wall.append(time.perf_counter() - wall_start)
+            cpu.append(time.process_time() - cpu_start)
+            entities = len(hass.states.async_all())
+    return summarize(
+        f"setup_entry[{count}]", wall[1:], cpu[1:], entries=count, entities=entities
+    )
+
+
+async def run_suite(rounds: int, setup_rounds: int) -> dict[str, Any]:
+    """Run all benchmarks and return the results with the environment."""
+    results = await bench_entry(rounds)
+    for count in SETUP_ENTRY_COUNTS:
+        results.append(await bench_setup_entry(count, setup_rounds))
+    return {
+        "version": json.loads(MANIFEST.read_text(encoding="utf-8"))["version"],
+        "home_assistant": HA_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Run the suite, print a summary and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, default=Path("benchmark.json"))
+    parser.add_argument(
+        "--rounds", type=int, default=100, help="rounds of the per-entry benchmarks"
+    )
+    parser.add_argument(
+        "--setup-rounds", type=int, default=3, help="rounds of setup_entry[N]"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    report = asyncio.run(run_suite(args.rounds, args.setup_rounds))
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    for result in report["results"]:
+        print(
+            f"{result['name']:>16}: median {result['median'] * 1e3:9.3f} ms, "
+            f"p95 {result['p95'] * 1e3:9.3f} ms"
+        )
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Micro-benchmark of the entity value lookups per coordinator update.
+
+Compares two ways of serving the state reads of one update, each with the
+work the coordinator does once per update for change detection:
+
+- walk: flatten the data, and walk each entity's value path with dict.get
+  calls, as the entities did before the data was decoded.
+- decoded: decode the data, and look up each path in the decoded data. The
+  first update decodes every section; a poll replaces the /values section
+  and keeps the others, which are not decoded again.
+
+Run with: python -m benchmarks.value_access [--reads N] [--updates N]
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import timeit
+from typing import Any
+
+from custom_components.nrgkick.decoded import ValuePath, decode_data, flatten_data
+
+from .sample_data import DATA
+
+
+def leaf_paths(data: dict[str, Any], prefix: ValuePath = ()) -> list[ValuePath]:
+    """Return the paths of all leaf values, one per entity."""
+    paths: list[ValuePath] = []
+    for key, value in data.items():
+        if isinstance(value, dict):
+            paths.extend(leaf_paths(value, (*prefix, key)))
+        else:
+            paths.append((*prefix, key))
+    return paths
+
+
+def walk_path(data: Any, path: ValuePath) -> Any:
+    """Return the value at path by walking the nested data."""
+    for key in path:
+        if data is None:
+            return None
+        data = data.get(key)
+    return data
+
+
+def _copy(node: dict[str, Any]) -> dict[str, Any]:
+    """Return a deep copy of nested dicts, as a poll returns new ones."""
+    return {
+        key: _copy(value) if isinstance(value, dict) else value
+        for key, value in node.items()
+    }
+
+
+def _per_update(update: Callable[[], object], updates: int) -> float:
+    """Return the best time of update in microseconds."""
+    return min(timeit.repeat(update, number=updates, repeat=5)) / updates * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print the cost per coordinator update."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--reads", type=int, default=2, help="state reads per entity and update"
+    )
+    parser.add_argument("--updates", type=int, default=20000)
+    args = parser.parse_args()
+
+    paths = leaf_paths(DATA)
+    reads = range(args.reads)
+    previous = decode_data(DATA)
+    polled = {**DATA, "values": _copy(DATA["values"])}
+    decoded = decode_data(polled, previous)
+    get = decoded.get
+
+    def read_walk() -> None:
+        for _ in reads:
+            for path in paths:
+                walk_path(DATA, path)
+
+    def read_decoded() -> None:
+        for _ in reads:
+            for path in paths:
+                get(path)
+
+    timings = {
+        "flatten": _per_update(lambda: flatten_data(DATA), args.updates),
+        "walk reads": _per_update(read_walk, args.updates),
+        "decode all": _per_update(lambda: decode_data(DATA), args.updates),
+        "decode poll": _per_update(lambda: decode_data(polled, previous), args.updates),
+        "decoded reads": _per_update(read_decoded, args.updates),
+    }
+    print(f"{len(paths)} value paths, {args.reads} reads per entity and update")
+    for name, microseconds in timings.items():
+        print(f"{name:>14}: {microseconds:7.2f} µs")
+    print("per update:")
+    for name, parts in (
+        ("walk", ("flatten", "walk reads")),
+        ("decoded, first", ("decode all", "decoded reads")),
+        ("decoded, poll", ("decode poll", "decoded reads")),
+    ):
+        total = sum(timings[part] for part in parts)
+        print(f"{name:>14}: {total:7.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,28 @@
 
 from __future__ import annotations
 
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .api import NRGkickAPI
-from .coordinator import NRGkickConfigEntry, NRGkickDataUpdateCoordinator
+from .const import (
+    CONF_MODBUS_PORT,
+    CONF_TRANSPORT,
+    DEFAULT_MODBUS_PORT,
+    DEFAULT_TRANSPORT,
+    DOMAIN,
+    TRANSPORT_MODBUS,
+)
+from .coordinator import (
+    NRGkickConfigEntry,
+    NRGkickDataUpdateCoordinator,
+    snapshot_store,
+)
 from .entity import NRGkickEntity
+from .modbus import NRGkickModbusAPI
+from .services import async_setup_services
 
 # Re-export for backward compatibility with other modules.
 __all__ = [
@@ -24,18 +39,50 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
+    """Set up the NRGkick service actions."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: NRGkickConfigEntry) -> bool:
     """Set up NRGkick from a config entry."""
-    api = NRGkickAPI(
-        host=entry.data["host"],
-        username=entry.data.get("username"),
-        password=entry.data.get("password"),
-        session=async_get_clientsession(hass),
+    api: NRGkickAPI | NRGkickModbusAPI
+    if entry.options.get(CONF_TRANSPORT, DEFAULT_TRANSPORT) == TRANSPORT_MODBUS:
+        api = NRGkickModbusAPI(
+            host=entry.data["host"],
+            port=entry.options.get(CONF_MODBUS_PORT, DEFAULT_MODBUS_PORT),
+        )
+    else:
+        api = NRGkickAPI(
+            host=entry.data["host"],
+            username=entry.data.get("username"),
+            password=entry.data.get("password"),
+        )
+    # The API owns a session or connection dedicated to this device; close it
+    # on unload, when the setup fails and when Home Assistant stops, which does
+    # not unload the config entries.
+    entry.async_on_unload(api.close)
+
+    async def _async_close_api(_event: Event) -> None:
+        await api.close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_api)
     )
 
     coordinator = NRGkickDataUpdateCoordinator(hass, api, entry)
-    await coordinator.async_config_entry_first_refresh()
+    if await coordinator.async_restore_snapshot():
+        # Create the entities from the last known data right away and fetch
+        # live data in the background.
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} - first refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
 
@@ -57,3 +104,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: NRGkickConfigEntry) ->
     """Unload a config entry."""
     result: bool = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     return result
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: NRGkickConfigEntry) -> None:
+    """Remove the persisted data of a removed config entry."""
+    await snapshot_store(hass, entry.entry_id).async_remove()
@@ -6,21 +6,36 @@ adding Home Assistant-specific exception handling with translation support.
 
 from __future__ import annotations
 
+import asyncio
+import base64
+from collections.abc import Awaitable, Callable
 import logging
+from types import SimpleNamespace
 from typing import Any, TypeVar, cast
+from urllib.parse import urlsplit
 
 import aiohttp
+from aiohttp.hdrs import AUTHORIZATION, USER_AGENT
 
 # pylint: disable=import-error
 from nrgkick_api import (
+    ENDPOINT_CONTROL,
     NRGkickAPI as LibraryAPI,
     NRGkickAuthenticationError,
     NRGkickConnectionError,
 )
 
 from homeassistant.exceptions import HomeAssistantError
-
-from .const import DOMAIN
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+
+from .coalescer import ReadCoalescer
+from .const import (
+    DOMAIN,
+    HTTP_CONNECTION_LIMIT,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_REQUEST_TIMEOUT,
+)
 
 # pylint: enable=import-error
 
@@ -29,6 +44,9 @@ _LOGGER = logging.getLogger(__name__)
 
 _T = TypeVar("_T")
 
+# Identifies a read request: endpoint, requested sections and raw flag.
+type _ReadKey = tuple[str, tuple[str, ...] | None, bool]
+
 
 class NRGkickApiClientError(HomeAssistantError):
     """Base exception for NRGkick API client errors."""
@@ -51,6 +69,38 @@ class NRGkickApiClientAuthenticationError(NRGkickApiClientError):
     translation_key = "authentication_error"
 
 
+def _basic_auth_header(username: str, password: str) -> str:
+    """Return the Basic Auth header value, encoded like aiohttp does."""
+    credentials = f"{username}:{password}".encode("latin1")
+    return f"Basic {base64.b64encode(credentials).decode('ascii')}"
+
+
+def create_device_session(
+    trace_configs: list[aiohttp.TraceConfig] | None = None,
+) -> aiohttp.ClientSession:
+    """Create an HTTP session with a connection pool for a single device.
+
+    Connections are kept alive between polls, so requests skip the TCP
+    handshake, and aiohttp enables TCP_NODELAY on every connection. The pool
+    and the DNS cache are not shared with other integrations. Requests
+    identify as Home Assistant like those of its shared sessions.
+
+    Must be called from the event loop. The caller closes the session, also
+    when Home Assistant stops.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_CONNECTION_LIMIT,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        use_dns_cache=True,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={USER_AGENT: SERVER_SOFTWARE},
+        trace_configs=trace_configs,
+    )
+
+
 class NRGkickAPI:
     """Home Assistant wrapper for NRGkick API client.
 
@@ -71,10 +121,29 @@ class NRGkickAPI:
             host: IP address or hostname of the NRGkick device.
             username: Optional username for Basic Auth.
             password: Optional password for Basic Auth.
-            session: aiohttp ClientSession for requests.
+            session: aiohttp ClientSession for requests. If omitted, a
+                session dedicated to this device is created and closed by
+                close().
 
         """
         self.host = host
+        self._owned_session: aiohttp.ClientSession | None = None
+        # Shares reads in progress between all callers asking for the same data.
+        self._reads: ReadCoalescer[_ReadKey] = ReadCoalescer()
+        # Size in bytes of the last response body of each endpoint, e.g.
+        # "values". Only known if the client owns its session.
+        self.response_sizes: dict[str, int] = {}
+        if session is None:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_response_chunk_received.append(self._on_response_body)
+            session = self._owned_session = create_device_session([trace_config])
+        self._session = session
+        # Authorization header of the requests the wrapper sends itself.
+        self._auth_headers = (
+            {AUTHORIZATION: _basic_auth_header(username, password)}
+            if username and password
+            else {}
+        )
         self._api = LibraryAPI(
             host=host,
             username=username,
@@ -82,6 +151,25 @@ class NRGkickAPI:
             session=session,
         )
 
+    async def close(self) -> None:
+        """Close the session if it was created by this client."""
+        if self._owned_session is not None:
+            await self._owned_session.close()
+            self._owned_session = None
+
+    async def _on_response_body(
+        self,
+        _session: aiohttp.ClientSession,
+        _context: SimpleNamespace,
+        params: aiohttp.TraceResponseChunkReceivedParams,
+    ) -> None:
+        """Remember the size of a response body by endpoint.
+
+        The library reads whole bodies, which aiohttp reports as one chunk.
+        """
+        endpoint = urlsplit(str(params.url)).path.strip("/")
+        self.response_sizes[endpoint] = len(params.chunk)
+
     async def _wrap_call(
         self,
         coro: Any,
@@ -116,7 +204,9 @@ class NRGkickAPI:
                 translation_placeholders={"host": self.host},
             ) from err
         except NRGkickConnectionError as err:
-            _LOGGER.error(
+            # Reported once per outage by the coordinator and its circuit
+            # breaker instead of for every request.
+            _LOGGER.debug(
                 "Communication error with NRGkick device at %s: %s",
                 self.host,
                 err,
@@ -127,6 +217,26 @@ class NRGkickAPI:
                 translation_placeholders={"error": str(err)},
             ) from err
 
+    @property
+    def request_count(self) -> int:
+        """Return the number of reads sent to the device."""
+        return self._reads.reads
+
+    @property
+    def coalesced_count(self) -> int:
+        """Return the number of reads served by one already in progress."""
+        return self._reads.coalesced
+
+    async def _async_read(
+        self, key: _ReadKey, fetch: Callable[[], Awaitable[Any]]
+    ) -> dict[str, Any]:
+        """Read data from the device, sharing a request already in progress.
+
+        Concurrent reads of the same endpoint, sections and raw flag wait for
+        a single request and all receive its result or its error.
+        """
+        return await self._reads.async_read(key, lambda: self._wrap_call(fetch(), dict))
+
     async def get_info(
         self,
         sections: list[str] | None = None,
@@ -145,7 +255,10 @@ class NRGkickAPI:
             Device information dictionary.
 
         """
-        return await self._wrap_call(self._api.get_info(sections, raw=raw), dict)
+        return await self._async_read(
+            ("info", tuple(sections) if sections else None, raw),
+            lambda: self._api.get_info(sections, raw=raw),
+        )
 
     async def get_control(self) -> dict[str, Any]:
         """Get current control parameters.
@@ -154,7 +267,7 @@ class NRGkickAPI:
             Control parameters dictionary.
 
         """
-        return await self._wrap_call(self._api.get_control(), dict)
+        return await self._async_read(("control", None, False), self._api.get_control)
 
     async def get_values(
         self,
@@ -174,7 +287,10 @@ class NRGkickAPI:
             Current values dictionary.
 
         """
-        return await self._wrap_call(self._api.get_values(sections, raw=raw), dict)
+        return await self._async_read(
+            ("values", tuple(sections) if sections else None, raw),
+            lambda: self._api.get_values(sections, raw=raw),
+        )
 
     async def set_current(self, current: float) -> dict[str, Any]:
         """Set charging current.
@@ -224,6 +340,89 @@ class NRGkickAPI:
         """
         return await self._wrap_call(self._api.set_phase_count(phases), dict)
 
+    async def set_control(
+        self,
+        *,
+        current: float | None = None,
+        charge_pause: bool | None = None,
+        energy_limit: int | None = None,
+        phase_count: int | None = None,
+    ) -> dict[str, Any]:
+        """Set several control parameters with a single request.
+
+        Args:
+            current: Charging current in Amps (6.0-32.0).
+            charge_pause: True to pause charging, False to resume.
+            energy_limit: Energy limit in Watt-hours (0 = no limit).
+            phase_count: Number of phases to use (1, 2, or 3).
+
+        Returns:
+            Response dictionary with the confirmed values.
+
+        Raises:
+            ValueError: If no parameter is given or phase_count is not 1, 2, or 3.
+
+        """
+        params: dict[str, Any] = {}
+        if current is not None:
+            params["current_set"] = current
+        if charge_pause is not None:
+            params["charge_pause"] = "1" if charge_pause else "0"
+        if energy_limit is not None:
+            params["energy_limit"] = energy_limit
+        if phase_count is not None:
+            if phase_count not in (1, 2, 3):
+                raise ValueError("Phase count must be 1, 2, or 3")
+            params["phase_count"] = phase_count
+        if not params:
+            raise ValueError("At least one control parameter is required")
+        return await self._wrap_call(self._async_request_control(params), dict)
+
+    async def _async_request_control(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Send a /control request with several parameters.
+
+        The library only sets one parameter per request through its public
+        API, so the request is sent on the same session with the same
+        authentication. Errors are raised as the library's exceptions, which
+        _wrap_call translates. Unlike library requests, it is not retried;
+        the coordinator verifies commands instead.
+
+        Raises:
+            NRGkickAuthenticationError: If authentication fails.
+            NRGkickConnectionError: If communication fails.
+
+        """
+        url = f"http://{self.host}{ENDPOINT_CONTROL}"
+        try:
+            async with (
+                asyncio.timeout(HTTP_REQUEST_TIMEOUT),
+                self._session.get(
+                    url, params=params, headers=self._auth_headers
+                ) as response,
+            ):
+                if response.status in (401, 403):
+                    raise NRGkickAuthenticationError(
+                        f"Authentication failed with HTTP {response.status} for {url}"
+                    )
+                # Read the body before the status, which may carry the error
+                # message of the device.
+                try:
+                    data = await response.json(content_type=None)
+                except ValueError:
+                    response.raise_for_status()
+                    return {}
+                if response.status >= 400 and "Response" not in data:
+                    response.raise_for_status()
+                return data if data is not None else {}
+        except aiohttp.ClientResponseError as err:
+            raise NRGkickConnectionError(
+                f"HTTP error {err.status} ({err.message}) from {url}"
+            ) from err
+        except (aiohttp.ClientError, TimeoutError) as err:
+            raise NRGkickConnectionError(
+                f"Connection to {url} failed: {err or type(err).__name__}"
+            ) from err
+
     async def test_connection(self) -> bool:
         """Test if we can connect to the device.
 
@@ -0,0 +1,68 @@
+"""Ordering of the control commands and polls of an NRGkick device."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from enum import IntEnum
+import heapq
+import itertools
+
+
+class Priority(IntEnum):
+    """Priority of an operation, lower values are granted first."""
+
+    COMMAND = 0
+    POLL = 1
+
+
+class ControlArbiter:
+    """Grant the control settings of a device to one operation at a time.
+
+    Commands hold the arbiter while they are sent and confirmed, polls while
+    they read /control, so a poll never reads the control settings while a
+    command changes them. Waiting operations are granted by priority, and
+    in order of arrival within a priority, so user commands overtake polls
+    that are waiting.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an idle arbiter."""
+        self._busy = False
+        self._waiting: list[tuple[Priority, int, asyncio.Future[None]]] = []
+        self._arrival = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of operations waiting to be granted."""
+        return sum(not future.done() for _, _, future in self._waiting)
+
+    @asynccontextmanager
+    async def async_acquire(self, priority: Priority) -> AsyncIterator[None]:
+        """Wait until the operation is granted and hold it for the context."""
+        if self._busy:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiting, (priority, next(self._arrival), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                # Pass it on if it was granted before the cancellation.
+                if not future.cancelled():
+                    self._release()
+                raise
+        else:
+            self._busy = True
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        """Grant the next waiting operation, or become idle."""
+        while self._waiting:
+            _, _, future = heapq.heappop(self._waiting)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._busy = False
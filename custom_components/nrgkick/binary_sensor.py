@@ -2,23 +2,49 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any
+from dataclasses import dataclass
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
+    BinarySensorEntityDescription,
 )
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from . import NRGkickConfigEntry, NRGkickDataUpdateCoordinator, NRGkickEntity
-from .const import STATUS_CHARGING
+from .decoded import CHARGING_PATH, ValuePath
 
 PARALLEL_UPDATES = 0
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class NRGkickBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes an NRGkick binary sensor and where its value is read from."""
+
+    value_path: ValuePath
+
+
+BINARY_SENSORS: tuple[NRGkickBinarySensorEntityDescription, ...] = (
+    NRGkickBinarySensorEntityDescription(
+        key="charging",
+        device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
+        value_path=CHARGING_PATH,
+    ),
+    NRGkickBinarySensorEntityDescription(
+        key="charge_permitted",
+        device_class=BinarySensorDeviceClass.POWER,
+        value_path=("values", "general", "charge_permitted"),
+    ),
+    NRGkickBinarySensorEntityDescription(
+        key="charge_pause",
+        value_path=("control", "charge_pause"),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+
 async def async_setup_entry(
     _hass: HomeAssistant,
     entry: NRGkickConfigEntry,
@@ -27,63 +53,25 @@ async def async_setup_entry(
     """Set up NRGkick binary sensors based on a config entry."""
     coordinator: NRGkickDataUpdateCoordinator = entry.runtime_data
 
-    entities: list[NRGkickBinarySensor] = [
-        NRGkickBinarySensor(
-            coordinator,
-            key="charging",
-            device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
-            value_path=["values", "general", "status"],
-            value_fn=lambda x: (
-                x == STATUS_CHARGING if isinstance(x, int) else x == "CHARGING"
-            ),
-        ),
-        NRGkickBinarySensor(
-            coordinator,
-            key="charge_permitted",
-            device_class=BinarySensorDeviceClass.POWER,
-            value_path=["values", "general", "charge_permitted"],
-        ),
-        NRGkickBinarySensor(
-            coordinator,
-            key="charge_pause",
-            device_class=None,
-            value_path=["control", "charge_pause"],
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-    ]
-
-    async_add_entities(entities)
+    async_add_entities(
+        NRGkickBinarySensor(coordinator, description) for description in BINARY_SENSORS
+    )
 
 
 class NRGkickBinarySensor(NRGkickEntity, BinarySensorEntity):
     """Representation of a NRGkick binary sensor."""
 
+    entity_description: NRGkickBinarySensorEntityDescription
+
     def __init__(
         self,
         coordinator: NRGkickDataUpdateCoordinator,
-        *,
-        key: str,
-        device_class: BinarySensorDeviceClass | None,
-        value_path: list[str],
-        entity_category: EntityCategory | None = None,
-        value_fn: Callable[[Any], bool] | None = None,
+        description: NRGkickBinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator, key)
-        self._attr_device_class = device_class
-        self._value_path = value_path
-        self._attr_entity_category = entity_category
-        self._value_fn = value_fn
+        super().__init__(coordinator, description, [description.value_path])
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        data: Any = self.coordinator.data
-        for key in self._value_path:
-            if data is None:
-                return None
-            data = data.get(key)
-
-        if self._value_fn and data is not None:
-            return self._value_fn(data)
-        return bool(data)
+        return bool(self.coordinator.decoded.get(self.entity_description.value_path))
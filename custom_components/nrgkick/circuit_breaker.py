@@ -0,0 +1,111 @@
+"""Circuit breaker that stops polling an unreachable NRGkick device."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from enum import StrEnum
+import time
+
+from .const import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_INITIAL_BACKOFF,
+    CIRCUIT_BREAKER_MAX_BACKOFF,
+)
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Track consecutive poll failures of a device.
+
+    The circuit opens after failure_threshold consecutive failures. While it
+    is open, polls are skipped without a request. Once the backoff has
+    elapsed, a single probe is allowed (half open). A successful probe
+    closes the circuit, a failed one opens it again with twice the backoff,
+    up to max_backoff.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        initial_backoff: float = CIRCUIT_BREAKER_INITIAL_BACKOFF,
+        max_backoff: float = CIRCUIT_BREAKER_MAX_BACKOFF,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed circuit breaker."""
+        self.failure_threshold = failure_threshold
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        # Seconds to wait before the next probe and the clock time it is due.
+        self.backoff = 0.0
+        self._probe_at = 0.0
+
+    @property
+    def retry_in(self) -> float | None:
+        """Return the seconds until the next probe, None if not open."""
+        if self.state is not CircuitState.OPEN:
+            return None
+        return max(0.0, self._probe_at - self._clock())
+
+    def allow_request(self, *, force: bool = False) -> bool:
+        """Return if a poll may contact the device.
+
+        Args:
+            force: Probe an open circuit right away, e.g. for a refresh
+                requested by the user.
+
+        Returns:
+            False while the circuit is open. When the backoff has elapsed or
+            the probe is forced, the circuit becomes half open and True is
+            returned for the probe.
+
+        """
+        if self.state is CircuitState.OPEN:
+            if not force and self._clock() < self._probe_at:
+                return False
+            self.state = CircuitState.HALF_OPEN
+        return True
+
+    def record_success(self) -> bool:
+        """Record that the device answered.
+
+        Returns:
+            True if this closed the circuit.
+
+        """
+        reopened = self.state is not CircuitState.CLOSED
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.backoff = 0.0
+        return reopened
+
+    def record_failure(self) -> bool:
+        """Record that the device did not answer.
+
+        Returns:
+            True if this opened the circuit after it was closed.
+
+        """
+        self.consecutive_failures += 1
+        if self.state is CircuitState.HALF_OPEN:
+            self.backoff = min(self.backoff * 2, self.max_backoff)
+        elif (
+            self.state is CircuitState.CLOSED
+            and self.consecutive_failures >= self.failure_threshold
+        ):
+            self.backoff = self.initial_backoff
+        else:
+            return False
+        opened = self.state is CircuitState.CLOSED
+        self.state = CircuitState.OPEN
+        self._probe_at = self._clock() + self.backoff
+        return opened
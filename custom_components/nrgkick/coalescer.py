@@ -0,0 +1,195 @@
+"""Coalescing of concurrent NRGkick reads and of bursts of setting writes."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine, Hashable
+import contextlib
+import time
+from typing import Any
+
+
+class ReadCoalescer[K: Hashable]:
+    """Share reads in progress between callers asking for the same data.
+
+    Concurrent reads with the same key wait for a single request and all
+    receive its result or its error. A cancelled caller does not cancel the
+    request of the other callers; the request is only cancelled when no
+    caller waits for it anymore.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the coalescer."""
+        # Reads in progress by key.
+        self._in_flight: dict[K, asyncio.Task[dict[str, Any]]] = {}
+        # Number of callers waiting for each read in progress.
+        self._waiters: dict[asyncio.Task[dict[str, Any]], int] = {}
+        # Number of reads that were sent and that were served by one in progress.
+        self.reads = 0
+        self.coalesced = 0
+
+    async def async_read(
+        self, key: K, fetch: Callable[[], Coroutine[Any, Any, dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """Return the result of fetch, shared with the other reads of key."""
+        if (task := self._in_flight.get(key)) is not None:
+            self.coalesced += 1
+        else:
+            self.reads += 1
+            task = asyncio.create_task(fetch())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters[task] == 1:
+                task.cancel()
+            raise
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+
+
+class WriteCoalescer[T]:
+    """Send a burst of writes of one setting as at most one write per window.
+
+    The first write is sent immediately. Writes requested less than window
+    seconds after the start of the previous write, or while it is in flight,
+    wait until the window has passed and only the last requested value is
+    sent. Every caller waits for the write that sent its value or the value
+    that replaced it, and gets its error if it fails. A value that equals
+    the confirmed value of the device when it is due is not sent.
+
+    Writes are sent by a task started with start_task, so callers that are
+    cancelled don't cancel the write of the others.
+    """
+
+    def __init__(
+        self,
+        window: float,
+        write: Callable[[T], Awaitable[None]],
+        is_current: Callable[[T], bool],
+        start_task: Callable[[Coroutine[Any, Any, None]], asyncio.Task[None]],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            window: Minimum seconds between the starts of two writes.
+            write: Sends a value to the device and confirms it.
+            is_current: Returns if a value equals the confirmed value.
+            start_task: Starts the task sending the writes.
+            clock: Monotonic clock in seconds.
+
+        """
+        self.window = window
+        self._write = write
+        self._is_current = is_current
+        self._start_task = start_task
+        self._clock = clock
+        # Value waiting to be sent and the future of its callers.
+        self._pending: tuple[T, asyncio.Future[None]] | None = None
+        # Value being sent and the future of its callers.
+        self._in_flight: tuple[T, asyncio.Future[None]] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._last_write_at = float("-inf")
+        # Number of writes that were sent and that were replaced or skipped.
+        self.writes = 0
+        self.coalesced = 0
+
+    async def async_write(self, value: T) -> None:
+        """Write value, coalesced with the other writes of the window.
+
+        Raises:
+            Exception: The error of the write that sent value, or the value
+                that replaced it.
+
+        """
+        if self._pending is not None:
+            # Last value wins, its callers wait for the same write.
+            future = self._pending[1]
+            self._pending = (value, future)
+            self.coalesced += 1
+        elif self._in_flight is not None and self._in_flight[0] == value:
+            # The value is already being sent.
+            future = self._in_flight[1]
+            self.coalesced += 1
+        elif self._in_flight is None and self._is_current(value):
+            self.coalesced += 1
+            return
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._pending = (value, future)
+            if self._task is None or self._task.done():
+                task = self._start_task(self._async_send_pending())
+                if not task.done():
+                    self._task = task
+                    task.add_done_callback(self._task_done)
+        await asyncio.shield(future)
+
+    async def async_write_with(self, send: Callable[[], Awaitable[None]]) -> None:
+        """Write a value with send instead of the write function.
+
+        For values sent together with other settings. The pending value is
+        dropped; its callers wait for send like the callers of a replaced
+        value. A write in flight is awaited first, so it cannot be confirmed
+        after the value of send.
+
+        Raises:
+            Exception: The error of send.
+
+        """
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            self.coalesced += 1
+        if self._in_flight is not None:
+            with contextlib.suppress(Exception):
+                await asyncio.shield(self._in_flight[1])
+        self._last_write_at = self._clock()
+        self.writes += 1
+        try:
+            await send()
+        except Exception as err:
+            if pending is not None and not pending[1].done():
+                pending[1].set_exception(err)
+            raise
+        if pending is not None and not pending[1].done():
+            pending[1].set_result(None)
+
+    async def _async_send_pending(self) -> None:
+        """Send pending values until no value is pending."""
+        while self._pending is not None:
+            delay = self._last_write_at + self.window - self._clock()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self._pending is None:
+                # Dropped by async_write_with while waiting.
+                break
+            value, future = self._pending
+            self._pending = None
+            if self._is_current(value):
+                self.coalesced += 1
+                future.set_result(None)
+                continue
+            self._in_flight = (value, future)
+            self._last_write_at = self._clock()
+            self.writes += 1
+            try:
+                await self._write(value)
+            except Exception as err:  # noqa: BLE001
+                future.set_exception(err)
+            else:
+                future.set_result(None)
+            self._in_flight = None
+
+    def _task_done(self, task: asyncio.Task[None]) -> None:
+        """Cancel the waiting callers if the task was cancelled, e.g. on unload."""
+        if task is not self._task:
+            return
+        for waiting in (self._pending, self._in_flight):
+            if waiting is not None and not waiting[1].done():
+                waiting[1].cancel()
+        self._pending = self._in_flight = self._task = None
@@ -12,7 +12,13 @@ from homeassistant import config_entries
 from homeassistant.config_entries import ConfigFlowResult
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import section
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import (
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
 from .api import (
@@ -21,13 +27,45 @@ from .api import (
     NRGkickApiClientCommunicationError,
 )
 from .const import (
+    CONF_CONTROL_INTERVAL,
+    CONF_CURRENT_WRITE_WINDOW,
+    CONF_DEADBANDS,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_INFO_INTERVAL,
+    CONF_MAX_STATE_AGE,
+    CONF_MODBUS_PORT,
     CONF_SCAN_INTERVAL,
+    CONF_TRANSPORT,
+    DEFAULT_CONTROL_INTERVAL,
+    DEFAULT_CURRENT_WRITE_WINDOW,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_INFO_INTERVAL,
+    DEFAULT_MAX_STATE_AGE,
+    DEFAULT_MODBUS_PORT,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TRANSPORT,
     DOMAIN,
+    MAX_CONTROL_INTERVAL,
+    MAX_CURRENT_WRITE_WINDOW,
+    MAX_IDLE_SCAN_INTERVAL,
+    MAX_INFO_INTERVAL,
+    MAX_MAX_STATE_AGE,
+    MAX_MODBUS_PORT,
     MAX_SCAN_INTERVAL,
+    MIN_CONTROL_INTERVAL,
+    MIN_CURRENT_WRITE_WINDOW,
+    MIN_IDLE_SCAN_INTERVAL,
+    MIN_INFO_INTERVAL,
+    MIN_MAX_STATE_AGE,
+    MIN_MODBUS_PORT,
+    MIN_MODBUS_SCAN_INTERVAL,
     MIN_SCAN_INTERVAL,
+    TRANSPORT_MODBUS,
+    TRANSPORT_REST,
 )
 from .coordinator import NRGkickConfigEntry
+from .modbus import NRGkickModbusAPI
+from .sensor import DEFAULT_DEADBANDS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -63,6 +101,15 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     }
 
 
+async def validate_modbus(host: str, port: int) -> None:
+    """Validate the Modbus TCP interface of the device answers."""
+    api = NRGkickModbusAPI(host=host, port=port)
+    try:
+        await api.test_connection()
+    finally:
+        await api.close()
+
+
 # pylint: disable=abstract-method  # is_matching is not required for HA config flows
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for NRGkick."""
@@ -311,27 +358,142 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Manage the options."""
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(
-                title="",
-                data={CONF_SCAN_INTERVAL: user_input[CONF_SCAN_INTERVAL]},
-            )
+            transport = user_input[CONF_TRANSPORT]
+            modbus_port = user_input[CONF_MODBUS_PORT]
+            # Only Modbus allows scan intervals below the REST API minimum.
+            if (
+                transport == TRANSPORT_REST
+                and user_input[CONF_SCAN_INTERVAL] < MIN_SCAN_INTERVAL
+            ):
+                errors[CONF_SCAN_INTERVAL] = "scan_interval_too_short"
+            elif transport == TRANSPORT_MODBUS:
+                try:
+                    await validate_modbus(
+                        self.config_entry.data[CONF_HOST], modbus_port
+                    )
+                except NRGkickApiClientCommunicationError:
+                    errors["base"] = "modbus_cannot_connect"
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Unexpected exception during Modbus validation")
+                    errors["base"] = "unknown"
+            if not errors:
+                return self.async_create_entry(
+                    title="",
+                    data={
+                        CONF_SCAN_INTERVAL: user_input[CONF_SCAN_INTERVAL],
+                        CONF_IDLE_SCAN_INTERVAL: user_input[CONF_IDLE_SCAN_INTERVAL],
+                        CONF_INFO_INTERVAL: user_input[CONF_INFO_INTERVAL],
+                        CONF_CONTROL_INTERVAL: user_input[CONF_CONTROL_INTERVAL],
+                        CONF_MAX_STATE_AGE: user_input[CONF_MAX_STATE_AGE],
+                        CONF_CURRENT_WRITE_WINDOW: user_input[
+                            CONF_CURRENT_WRITE_WINDOW
+                        ],
+                        CONF_TRANSPORT: transport,
+                        CONF_MODBUS_PORT: modbus_port,
+                        CONF_DEADBANDS: user_input[CONF_DEADBANDS],
+                    },
+                )
 
-        scan_interval = self.config_entry.options.get(
-            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+        # Show the submitted values again if they were rejected.
+        options = {**self.config_entry.options, **(user_input or {})}
+        scan_interval = options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        idle_scan_interval = options.get(
+            CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL
         )
+        info_interval = options.get(CONF_INFO_INTERVAL, DEFAULT_INFO_INTERVAL)
+        control_interval = options.get(CONF_CONTROL_INTERVAL, DEFAULT_CONTROL_INTERVAL)
+        max_state_age = options.get(CONF_MAX_STATE_AGE, DEFAULT_MAX_STATE_AGE)
+        current_write_window = options.get(
+            CONF_CURRENT_WRITE_WINDOW, DEFAULT_CURRENT_WRITE_WINDOW
+        )
+        transport = options.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
+        modbus_port = options.get(CONF_MODBUS_PORT, DEFAULT_MODBUS_PORT)
+        deadbands = options.get(CONF_DEADBANDS, {})
 
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
                 {
+                    vol.Optional(
+                        CONF_TRANSPORT,
+                        default=transport,
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=[TRANSPORT_REST, TRANSPORT_MODBUS],
+                            mode=SelectSelectorMode.DROPDOWN,
+                            translation_key=CONF_TRANSPORT,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_MODBUS_PORT,
+                        default=modbus_port,
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=MIN_MODBUS_PORT, max=MAX_MODBUS_PORT),
+                    ),
                     vol.Optional(
                         CONF_SCAN_INTERVAL,
                         default=scan_interval,
                     ): vol.All(
                         vol.Coerce(int),
-                        vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
+                        vol.Range(min=MIN_MODBUS_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
+                    ),
+                    vol.Optional(
+                        CONF_IDLE_SCAN_INTERVAL,
+                        default=idle_scan_interval,
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(
+                            min=MIN_IDLE_SCAN_INTERVAL, max=MAX_IDLE_SCAN_INTERVAL
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_INFO_INTERVAL,
+                        default=info_interval,
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=MIN_INFO_INTERVAL, max=MAX_INFO_INTERVAL),
+                    ),
+                    vol.Optional(
+                        CONF_CONTROL_INTERVAL,
+                        default=control_interval,
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=MIN_CONTROL_INTERVAL, max=MAX_CONTROL_INTERVAL),
+                    ),
+                    vol.Optional(
+                        CONF_MAX_STATE_AGE,
+                        default=max_state_age,
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=MIN_MAX_STATE_AGE, max=MAX_MAX_STATE_AGE),
+                    ),
+                    vol.Optional(
+                        CONF_CURRENT_WRITE_WINDOW,
+                        default=current_write_window,
+                    ): vol.All(
+                        vol.Coerce(float),
+                        vol.Range(
+                            min=MIN_CURRENT_WRITE_WINDOW, max=MAX_CURRENT_WRITE_WINDOW
+                        ),
+                    ),
+                    vol.Optional(CONF_DEADBANDS, default={}): section(
+                        vol.Schema(
+                            {
+                                vol.Optional(
+                                    device_class.value,
+                                    default=deadbands.get(
+                                        device_class.value, deadband.absolute
+                                    ),
+                                ): vol.All(vol.Coerce(float), vol.Range(min=0))
+                                for device_class, deadband in DEFAULT_DEADBANDS.items()
+                            }
+                        ),
+                        {"collapsed": True},
                     ),
                 }
             ),
+            errors=errors,
         )
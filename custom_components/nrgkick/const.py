@@ -6,12 +6,130 @@ DOMAIN: Final = "nrgkick"
 
 # Configuration.
 CONF_SCAN_INTERVAL: Final = "scan_interval"
+CONF_INFO_INTERVAL: Final = "info_interval"
+CONF_CONTROL_INTERVAL: Final = "control_interval"
+CONF_MAX_STATE_AGE: Final = "max_state_age"
+CONF_DEADBANDS: Final = "deadbands"
+CONF_IDLE_SCAN_INTERVAL: Final = "idle_scan_interval"
+CONF_CURRENT_WRITE_WINDOW: Final = "current_write_window"
+CONF_TRANSPORT: Final = "transport"
+CONF_MODBUS_PORT: Final = "modbus_port"
 
 # Default values.
 DEFAULT_SCAN_INTERVAL: Final = 30
 MIN_SCAN_INTERVAL: Final = 10
 MAX_SCAN_INTERVAL: Final = 300
 
+# Scan interval in seconds while the charger is idle, i.e. in standby or with
+# charging not permitted. The scan interval applies while it is active.
+DEFAULT_IDLE_SCAN_INTERVAL: Final = 300
+MIN_IDLE_SCAN_INTERVAL: Final = 10
+MAX_IDLE_SCAN_INTERVAL: Final = 3600
+# Seconds after a command during which the charger counts as active.
+COMMAND_ACTIVITY_WINDOW: Final = 120
+
+# Refresh intervals of the rarely changing endpoints in seconds.
+# /values is fetched on every scan interval tick.
+DEFAULT_INFO_INTERVAL: Final = 600
+MIN_INFO_INTERVAL: Final = 60
+MAX_INFO_INTERVAL: Final = 86400
+DEFAULT_CONTROL_INTERVAL: Final = 60
+MIN_CONTROL_INTERVAL: Final = 10
+MAX_CONTROL_INTERVAL: Final = 3600
+
+# Measurement sensors hold back insignificant changes for at most this many
+# seconds. 0 publishes every change.
+DEFAULT_MAX_STATE_AGE: Final = 300
+MIN_MAX_STATE_AGE: Final = 0
+MAX_MAX_STATE_AGE: Final = 3600
+# The deadbands themselves default per device class (see sensor.py). The
+# options override their absolute part, in the unit of the sensors, by the
+# device class as key.
+
+# Writes of the charging current are sent at most once per window in seconds.
+# Changes within the window, e.g. while dragging the slider, are coalesced
+# and only the last value is sent. 0 only coalesces writes that are requested
+# while another one is in flight.
+DEFAULT_CURRENT_WRITE_WINDOW: Final = 1.0
+MIN_CURRENT_WRITE_WINDOW: Final = 0.0
+MAX_CURRENT_WRITE_WINDOW: Final = 10.0
+
+# Time budget in seconds for a single endpoint request during a poll.
+# The endpoints are polled concurrently, so this also bounds the poll duration.
+REQUEST_TIMEOUT: Final = 20
+
+# Polls are skipped after this many consecutive polls without an answer. The
+# device is probed again after the backoff in seconds, which doubles after
+# every failed probe.
+CIRCUIT_BREAKER_FAILURE_THRESHOLD: Final = 3
+CIRCUIT_BREAKER_INITIAL_BACKOFF: Final = 30
+CIRCUIT_BREAKER_MAX_BACKOFF: Final = 900
+
+# Number of latest requests the latency percentiles of the request statistics
+# are computed from.
+STATS_SAMPLE_SIZE: Final = 100
+
+# Last known device data, persisted to start without waiting for the device.
+# It is written at most once per this many seconds, with the latest data.
+SNAPSHOT_STORAGE_VERSION: Final = 1
+SNAPSHOT_SAVE_DELAY: Final = 300
+
+# Polls of all NRGkick devices that may run at the same time. Further due
+# polls wait for a free slot.
+FLEET_MAX_CONCURRENT_POLLS: Final = 4
+
+# Confirmation of commands whose response lacks the new value. /control is
+# polled with exponential backoff, starting at the initial delay and capped at
+# the maximum delay, until the value appears or the timeout in seconds passes.
+COMMAND_CONFIRM_INITIAL_DELAY: Final = 0.1
+COMMAND_CONFIRM_MAX_DELAY: Final = 2.0
+COMMAND_CONFIRM_TIMEOUT: Final = 10.0
+
+# Connection pool of the HTTP session dedicated to each device. Three endpoints
+# are polled concurrently and a command may be sent at the same time.
+HTTP_CONNECTION_LIMIT: Final = 4
+# Seconds an idle connection is kept open. Longer than the default scan
+# interval so that every poll reuses the connections of the previous one.
+HTTP_KEEPALIVE_TIMEOUT: Final = 60
+# Seconds a resolved device address is cached.
+HTTP_DNS_CACHE_TTL: Final = 300
+# Seconds to wait for the response of a /control request sent by the
+# integration itself, like the per-attempt timeout of nrgkick-api.
+HTTP_REQUEST_TIMEOUT: Final = 10
+
+# Interface the device is polled and controlled through. The REST API is
+# always used to set up the config entry.
+TRANSPORT_REST: Final = "rest"
+TRANSPORT_MODBUS: Final = "modbus"
+DEFAULT_TRANSPORT: Final = TRANSPORT_REST
+
+# Modbus TCP interface. All registers are read with unit ID 1.
+DEFAULT_MODBUS_PORT: Final = 502
+MIN_MODBUS_PORT: Final = 1
+MAX_MODBUS_PORT: Final = 65535
+# A poll over Modbus is two small register reads on an open connection, so
+# the scan interval may be lower than with the REST API.
+MIN_MODBUS_SCAN_INTERVAL: Final = 1
+MODBUS_UNIT_ID: Final = 1
+# Time budget in seconds for a single Modbus transaction.
+MODBUS_TIMEOUT: Final = 5
+
+# Service actions and their fields.
+SERVICE_SET_CONTROL: Final = "set_control"
+ATTR_CONFIG_ENTRY: Final = "config_entry"
+ATTR_CURRENT_SET: Final = "current_set"
+ATTR_CHARGE_PAUSE: Final = "charge_pause"
+ATTR_ENERGY_LIMIT: Final = "energy_limit"
+ATTR_PHASE_COUNT: Final = "phase_count"
+
+# State attribute of entities showing restored values not fetched live since.
+ATTR_STALE: Final = "stale"
+
+# Ranges of the control parameters accepted by the device.
+MIN_CURRENT_SET: Final = 6.0
+MAX_CURRENT_SET: Final = 32.0
+MAX_ENERGY_LIMIT: Final = 100000
+
 # Note: API Endpoints are in the nrgkick-api library.
 # Import from nrgkick_api if needed: from nrgkick_api import ENDPOINT_INFO, ...
 
@@ -3,14 +3,20 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
-from datetime import timedelta
+from collections.abc import Awaitable, Callable, Mapping
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from functools import partial
 import logging
-from typing import Any
+import time
+from typing import Any, NamedTuple
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import (
@@ -19,13 +25,113 @@ from .api import (
     NRGkickApiClientCommunicationError,
     NRGkickApiClientError,
 )
-from .const import CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .arbiter import ControlArbiter, Priority
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .coalescer import WriteCoalescer
+from .const import (
+    COMMAND_ACTIVITY_WINDOW,
+    COMMAND_CONFIRM_INITIAL_DELAY,
+    COMMAND_CONFIRM_MAX_DELAY,
+    COMMAND_CONFIRM_TIMEOUT,
+    CONF_CONTROL_INTERVAL,
+    CONF_CURRENT_WRITE_WINDOW,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_INFO_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_CONTROL_INTERVAL,
+    DEFAULT_CURRENT_WRITE_WINDOW,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_INFO_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    MAX_CURRENT_SET,
+    MIN_CURRENT_SET,
+    REQUEST_TIMEOUT,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_VERSION,
+    STATUS_CONNECTED,
+    STATUS_STANDBY,
+)
+from .decoded import (
+    CURRENT_LIMIT_PATH,
+    EMPTY_DATA,
+    DecodedData,
+    ValuePath,
+    changed_paths,
+    decode_data,
+    flatten_data,
+)
+from .modbus import NRGkickModbusAPI
+from .scheduler import async_get_scheduler
+from .stats import RequestStats
 
 _LOGGER = logging.getLogger(__name__)
 
 # Type alias for typed config entry with runtime_data.
 type NRGkickConfigEntry = ConfigEntry[NRGkickDataUpdateCoordinator]
 
+# First key of the value paths of the request statistics, which are not part
+# of the device data, e.g. ("stats", "values", "latency_p95").
+STATS_KEY = "stats"
+
+# True in the task of a poll started by the shared scheduler. Only scheduled
+# polls skip endpoints that are not due and wait for the circuit breaker;
+# manual refreshes (e.g., the update_entity action) always fetch everything.
+# A context variable rather than an attribute, so a manual refresh running
+# while a scheduled poll is in flight is not taken for a scheduled one.
+_scheduled_poll: ContextVar[bool] = ContextVar("nrgkick_scheduled_poll", default=False)
+
+# Endpoints of the local JSON API polled by the coordinator.
+ENDPOINTS = ("info", "control", "values")
+# Endpoints that support fetching a subset of their sections.
+_SECTIONED_ENDPOINTS = ("info", "values")
+# Sections that are fetched even if no entity reads them. The charger state
+# drives the scan interval, the general info and versions describe the device.
+_REQUIRED_SECTIONS: dict[str, frozenset[str]] = {
+    "info": frozenset({"general", "versions"}),
+    "values": frozenset({"general"}),
+}
+
+
+class DeviceIdentity(NamedTuple):
+    """Fields of /info that describe the device in the device registry."""
+
+    serial_number: str
+    name: str
+    model: str
+    sw_version: str | None
+
+
+def device_identity(data: Mapping[str, Any] | None) -> DeviceIdentity:
+    """Return the identity of the device described by coordinator data."""
+    info: Mapping[str, Any] = data.get("info", {}) if data else {}
+    general: Mapping[str, Any] = info.get("general", {})
+    return DeviceIdentity(
+        serial_number=general.get("serial_number", "unknown"),
+        name=general.get("device_name") or "NRGkick",
+        model=general.get("model_type", "NRGkick Gen2"),
+        sw_version=info.get("versions", {}).get("sw_sm"),
+    )
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store of the last known data of a config entry."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+def _update_failed(err: NRGkickApiClientCommunicationError) -> UpdateFailed:
+    """Return the UpdateFailed error to raise for a communication error."""
+    return UpdateFailed(
+        translation_domain=err.translation_domain,
+        translation_key=err.translation_key,
+        translation_placeholders=err.translation_placeholders,
+    )
+
+
+def _sorted_or_none(sections: frozenset[str] | None) -> list[str] | None:
+    """Return the sections in a stable order for the request."""
+    return None if sections is None else sorted(sections)
+
 
 class NRGkickDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching NRGkick data from the API."""
@@ -33,14 +139,83 @@ class NRGkickDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     config_entry: NRGkickConfigEntry
 
     def __init__(
-        self, hass: HomeAssistant, api: NRGkickAPI, entry: NRGkickConfigEntry
+        self,
+        hass: HomeAssistant,
+        api: NRGkickAPI | NRGkickModbusAPI,
+        entry: NRGkickConfigEntry,
     ) -> None:
         """Initialize."""
         self.api = api
         self.entry = entry
 
-        # Get scan interval from options or use default.
+        # Get scan intervals from options or use defaults. The scan interval
+        # applies while the charger is active, the idle scan interval while
+        # nothing is expected to change.
         scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        self._active_scan_interval = timedelta(seconds=scan_interval)
+        self._idle_scan_interval = timedelta(
+            seconds=max(
+                scan_interval,
+                entry.options.get(CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL),
+            )
+        )
+        # Monotonic time of the last command sent to the charger.
+        self._last_command_at = float("-inf")
+        # Seconds from sending the last command that lacked the new value in
+        # its response until /control confirmed it.
+        self.last_confirmation_latency: float | None = None
+
+        # Refresh interval per endpoint in seconds. Values are fetched on every
+        # scan tick, info and control only when their own interval is due.
+        self._endpoint_intervals: dict[str, float] = {
+            "info": entry.options.get(CONF_INFO_INTERVAL, DEFAULT_INFO_INTERVAL),
+            "control": entry.options.get(
+                CONF_CONTROL_INTERVAL, DEFAULT_CONTROL_INTERVAL
+            ),
+            "values": 0,
+        }
+        # Monotonic start time of the last successful poll of each endpoint.
+        self._endpoint_fetched_at: dict[str, float] = {}
+        # Sections requested in the last successful poll of each endpoint,
+        # None if all sections were requested.
+        self._endpoint_sections: dict[str, frozenset[str] | None] = {}
+        # Decoded data, request statistics and availability the listeners were
+        # last notified about. None until the listeners were first notified.
+        self._notified: tuple[DecodedData, dict[ValuePath, Any]] | None = None
+        self._notified_success = True
+        # Restored endpoints the listeners were last notified about.
+        self._notified_restored: frozenset[str] = frozenset()
+        # Decoded view of data and the data it was decoded from.
+        self._decoded: tuple[dict[str, Any] | None, DecodedData] = (None, EMPTY_DATA)
+        # Identity and device info shared by all entities of the device. None
+        # until first requested or updated.
+        self._device: tuple[DeviceIdentity, DeviceInfo] | None = None
+        # Skips polls while the device does not answer.
+        self.breaker = CircuitBreaker()
+        # Orders commands and /control reads of polls, commands first.
+        self.arbiter = ControlArbiter()
+        # Incremented whenever a command confirmed new control settings.
+        self._control_version = 0
+        # /control reads of polls that reused settings confirmed by a command.
+        self.control_reads_saved = 0
+        # Request statistics of each endpoint and of whole polls.
+        self.endpoint_stats = {endpoint: RequestStats() for endpoint in ENDPOINTS}
+        self.poll_stats = RequestStats()
+        # Listeners reading request statistics. The statistics sensors are
+        # disabled by default, so without them the statistics are not built
+        # and compared on every update.
+        self._stats_listeners = 0
+        # Coalesces bursts of charging current changes, e.g. from the slider.
+        self.current_writer: WriteCoalescer[float] = WriteCoalescer(
+            entry.options.get(CONF_CURRENT_WRITE_WINDOW, DEFAULT_CURRENT_WRITE_WINDOW),
+            self._async_write_current,
+            self._is_current_set,
+            partial(
+                entry.async_create_background_task,
+                hass,
+                name=f"{DOMAIN} - {entry.title} - current write",
+            ),
+        )
 
         super().__init__(
             hass,
@@ -50,35 +225,528 @@ class NRGkickDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             config_entry=entry,
             # Data is a dict that supports __eq__ comparison.
             # Avoid unnecessary entity updates when data hasn't changed.
+            # Sections kept from the previous data compare by identity.
             always_update=False,
         )
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Update data via library."""
+        self._snapshot_store = snapshot_store(hass, entry.entry_id)
+        # Whether a scheduled snapshot save has not read the data yet.
+        self._snapshot_save_pending = False
+
+        # Scheduled polls are timed by the scheduler shared by all devices
+        # instead of a timer per coordinator.
+        self._scheduler = async_get_scheduler(hass)
+        entry.async_on_unload(self._scheduler.async_register(self))
+
+    @property
+    def request_stats(self) -> dict[str, dict[str, Any]]:
+        """Return the statistics of the endpoints and of whole polls."""
+        stats = {
+            endpoint: endpoint_stats.as_dict()
+            for endpoint, endpoint_stats in self.endpoint_stats.items()
+        }
+        stats["poll"] = self.poll_stats.as_dict()
+        return stats
+
+    @property
+    def device_identity(self) -> DeviceIdentity:
+        """Return serial number, name, model and firmware of the device."""
+        return (self._device or self._async_update_device())[0]
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info shared by all entities of the device."""
+        return (self._device or self._async_update_device())[1]
+
+    @property
+    def decoded(self) -> DecodedData:
+        """Return the decoded values of data, decoded once per data object.
+
+        Data is never changed in place: updates replace the changed sections
+        and keep the others, so only replaced sections are decoded again.
+        """
+        source, decoded = self._decoded
+        if source is not self.data:
+            decoded = decode_data(self.data, decoded)
+            self._decoded = (self.data, decoded)
+        return decoded
+
+    @callback
+    def _async_update_device(self) -> tuple[DeviceIdentity, DeviceInfo]:
+        """Update the device info and registry if the identity changed.
+
+        The device registry is updated when the name, model or firmware
+        version of a known device changes at runtime. On setup, the entities
+        create or update the device from the shared device info.
+        """
+        identity = device_identity(self.data)
+        if self._device is not None:
+            previous = self._device[0]
+            if identity == previous:
+                return self._device
+            if identity.serial_number == previous.serial_number:
+                registry = dr.async_get(self.hass)
+                if device := registry.async_get_device(
+                    identifiers={(DOMAIN, identity.serial_number)}
+                ):
+                    registry.async_update_device(
+                        device.id,
+                        name=identity.name,
+                        model=identity.model,
+                        sw_version=identity.sw_version,
+                    )
+        self._device = (
+            identity,
+            DeviceInfo(
+                identifiers={(DOMAIN, identity.serial_number)},
+                name=identity.name,
+                manufacturer="DiniTech",
+                model=identity.model,
+                sw_version=identity.sw_version,
+            ),
+        )
+        return self._device
+
+    @property
+    def restored_endpoints(self) -> frozenset[str]:
+        """Return the endpoints whose data was restored and not fetched since."""
+        if self.data is None:
+            return frozenset()
+        return frozenset(
+            endpoint
+            for endpoint in self._endpoint_intervals
+            if endpoint not in self._endpoint_fetched_at
+        )
+
+    @property
+    def is_stale(self) -> bool:
+        """Return if the data contains restored values not fetched since."""
+        return bool(self.restored_endpoints)
+
+    async def async_restore_snapshot(self) -> bool:
+        """Restore the last known data of the device from storage.
+
+        Returns:
+            True if data of this device was restored.
+
+        """
+        snapshot = await self._snapshot_store.async_load()
+        if not snapshot or any(
+            not isinstance(snapshot.get(endpoint), dict)
+            for endpoint in self._endpoint_intervals
+        ):
+            return False
+        serial = snapshot["info"].get("general", {}).get("serial_number")
+        if self.entry.unique_id is not None and serial != self.entry.unique_id:
+            return False
+        self.data = snapshot
+        return True
+
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the data to persist.
+
+        Called by the store when it writes, which may be in an executor
+        thread. Later changes need a new save from then on.
+        """
+        self._snapshot_save_pending = False
+        return self.data
+
+    @callback
+    def _async_save_snapshot_later(self) -> None:
+        """Persist the data within SNAPSHOT_SAVE_DELAY seconds.
+
+        Store.async_delay_save restarts the delay with every call, so polls
+        more frequent than the delay would postpone the write until Home
+        Assistant stops. A pending save is kept instead; it writes the data
+        current at that time. No saves are scheduled after the shutdown.
+        """
+        if self._shutdown_requested or self._snapshot_save_pending:
+            return
+        self._snapshot_save_pending = True
+        self._snapshot_store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+
+    async def async_shutdown(self) -> None:
+        """Stop polling and write a pending snapshot save right away.
+
+        The store would otherwise keep the pending save of this coordinator
+        and, when Home Assistant stops, write its data over the snapshot of
+        the coordinator of a reloaded entry.
+        """
+        await super().async_shutdown()
+        if self._snapshot_save_pending:
+            self._snapshot_save_pending = False
+            await self._snapshot_store.async_save(self.data)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, counting listeners of the statistics."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        if not isinstance(context, frozenset) or all(
+            path[0] != STATS_KEY for path in context
+        ):
+            return remove_listener
+        self._stats_listeners += 1
+
+        @callback
+        def _remove_stats_listener() -> None:
+            remove_listener()
+            self._stats_listeners -= 1
+
+        return _remove_stats_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners whose values changed since the last update.
+
+        Entities register the frozenset of value paths they read as listener
+        context. Listeners without such a context, and all listeners when the
+        availability changed or restored data was first fetched live, are
+        always updated. The request statistics are only compared while a
+        listener reads them.
+        """
+        self._async_update_device()
+        decoded = self.decoded
+        stats = (
+            flatten_data({STATS_KEY: self.request_stats})
+            if self._stats_listeners
+            else {}
+        )
+        restored = self.restored_endpoints
+        changed: set[ValuePath] | None = None
+        if (
+            self._notified is not None
+            and self.last_update_success == self._notified_success
+            and restored == self._notified_restored
+        ):
+            notified, notified_stats = self._notified
+            # Sections that are the same object as before are not compared.
+            changed = decoded.changed_paths(notified)
+            changed |= changed_paths(stats, notified_stats)
+        self._notified = (decoded, stats)
+        self._notified_success = self.last_update_success
+        self._notified_restored = restored
+
+        for update_callback, context in list(self._listeners.values()):
+            if (
+                changed is None
+                or not isinstance(context, frozenset)
+                or not changed.isdisjoint(context)
+            ):
+                update_callback()
+
+    async def _async_fetch_endpoint(
+        self, endpoint: str, fetch: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """Fetch a single endpoint within the per-request time budget.
+
+        The latency, outcome and response size, as read by the client, are
+        recorded in the statistics of the endpoint.
+
+        Raises:
+            NRGkickApiClientCommunicationError: If the request times out.
+
+        """
+        stats = self.endpoint_stats[endpoint]
+        started = time.monotonic()
         try:
-            info = await self.api.get_info()
-            control = await self.api.get_control()
-            values = await self.api.get_values()
-        except NRGkickApiClientAuthenticationError as err:
-            raise ConfigEntryAuthFailed from err
-        except NRGkickApiClientCommunicationError as err:
-            raise UpdateFailed(
-                translation_domain=err.translation_domain,
-                translation_key=err.translation_key,
-                translation_placeholders=err.translation_placeholders,
+            async with asyncio.timeout(REQUEST_TIMEOUT):
+                result = await fetch()
+        except NRGkickApiClientError:
+            stats.record_failure(time.monotonic() - started)
+            raise
+        except TimeoutError as err:
+            stats.record_failure(time.monotonic() - started)
+            raise NRGkickApiClientCommunicationError(
+                translation_domain=DOMAIN,
+                translation_key="communication_error",
+                translation_placeholders={
+                    "error": f"No response within {REQUEST_TIMEOUT} seconds"
+                },
             ) from err
+        stats.record(time.monotonic() - started, self.api.response_sizes.get(endpoint))
+        return result
+
+    async def _async_fetch_control(self, control_version: int) -> dict[str, Any]:
+        """Read /control for a poll once no command changes the settings.
+
+        If a command confirmed new settings since the poll started, they
+        are returned instead of reading /control again.
+
+        Args:
+            control_version: Control version at the start of the poll.
+
+        Returns:
+            The control settings.
+
+        """
+        async with self.arbiter.async_acquire(Priority.POLL):
+            if self._control_version != control_version:
+                self.control_reads_saved += 1
+                control: dict[str, Any] = self.data["control"]
+                return control
+            return await self._async_fetch_endpoint("control", self.api.get_control)
+
+    @callback
+    def _async_set_confirmed_control(
+        self, control: dict[str, Any], confirmed_at: float
+    ) -> None:
+        """Replace the control settings with ones confirmed by a command.
+
+        Polls that read /control before keep them, and scheduled polls only
+        read /control again once its interval has passed since. The settings
+        are persisted with the snapshot, so a restart does not restore the
+        ones from before the command.
+        """
+        self._control_version += 1
+        self._endpoint_fetched_at["control"] = confirmed_at
+        self.async_set_updated_data({**self.data, "control": control})
+        self._async_save_snapshot_later()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next poll with the shared scheduler."""
+        if self.update_interval is None or self.config_entry.pref_disable_polling:
+            return
+        self._async_unsub_refresh()
+        self._unsub_refresh = self._scheduler.async_schedule(self)
+
+    async def async_scheduled_refresh(self) -> None:
+        """Run a scheduled poll, which only fetches due endpoints."""
+        await self._handle_refresh_interval()
+
+    async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
+        """Handle a scheduled refresh, which only fetches due endpoints."""
+        token = _scheduled_poll.set(True)
+        try:
+            await super()._handle_refresh_interval(_now)
+        finally:
+            _scheduled_poll.reset(token)
+
+    def _sections_needed(self, endpoint: str) -> frozenset[str] | None:
+        """Return the sections of an endpoint that the entities read.
+
+        Disabled entities are not added to Home Assistant, so only enabled
+        entities register their value paths as listener context. Returns
+        None, i.e. all sections, before the entities are added or if a
+        listener does not tell which values it reads.
+        """
+        if not self._listeners:
+            return None
+        sections = set(_REQUIRED_SECTIONS[endpoint])
+        for _, context in self._listeners.values():
+            if not isinstance(context, frozenset):
+                return None
+            sections.update(
+                path[1] for path in context if len(path) > 1 and path[0] == endpoint
+            )
+        return frozenset(sections)
+
+    def _endpoints_due(
+        self,
+        now: float,
+        sections: Mapping[str, frozenset[str] | None],
+        *,
+        scheduled: bool,
+    ) -> list[str]:
+        """Return the endpoints that need to be fetched in this poll.
+
+        Manual polls fetch all endpoints. For scheduled polls, an endpoint is
+        due if it has never been fetched, if sections are needed that were
+        not fetched last time (e.g., after enabling an entity), or if its
+        interval elapses before the middle of the next scan tick. This keeps
+        the schedule stable even if scan ticks drift by a fraction of a
+        second.
+        """
+        if not scheduled:
+            return list(self._endpoint_intervals)
+
+        tolerance = (
+            self.update_interval.total_seconds() / 2 if self.update_interval else 0
+        )
+        previous: dict[str, Any] = self.data or {}
+        return [
+            endpoint
+            for endpoint, interval in self._endpoint_intervals.items()
+            if endpoint not in previous
+            or endpoint not in self._endpoint_fetched_at
+            or not self._sections_fetched(endpoint, sections.get(endpoint))
+            or now - self._endpoint_fetched_at[endpoint] + tolerance >= interval
+        ]
+
+    def _sections_fetched(self, endpoint: str, needed: frozenset[str] | None) -> bool:
+        """Return if the last poll of an endpoint fetched the needed sections."""
+        fetched = self._endpoint_sections.get(endpoint)
+        if fetched is None:
+            return True
+        return needed is not None and needed <= fetched
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Update data via library, as a scheduled poll if the scheduler runs it."""
+        return await self._async_update(scheduled=_scheduled_poll.get())
+
+    async def _async_update(self, *, scheduled: bool) -> dict[str, Any]:
+        """Poll the device and record the duration of the poll.
+
+        Args:
+            scheduled: If the poll was started by the scheduler, and not
+                requested by the user.
+
+        """
+        # Polls requested by the user probe an unreachable device right away.
+        if not self.breaker.allow_request(force=not scheduled):
+            raise UpdateFailed(
+                translation_domain=DOMAIN,
+                translation_key="device_unreachable",
+                translation_placeholders={
+                    "retry_in": f"{self.breaker.retry_in or 0:.0f}"
+                },
+            )
+
+        started = time.monotonic()
+        try:
+            result = await self._async_poll(started, scheduled=scheduled)
+        except (UpdateFailed, ConfigEntryAuthFailed):
+            self.poll_stats.record_failure(time.monotonic() - started)
+            raise
+        self.poll_stats.record(time.monotonic() - started)
+        return result
+
+    async def _async_poll(self, started: float, *, scheduled: bool) -> dict[str, Any]:
+        """Fetch the due endpoints of the device.
+
+        Due endpoints are requested concurrently, so a poll takes as long as
+        the slowest endpoint instead of the sum of all of them. Endpoints
+        that are not due and endpoints that fail while other endpoints
+        succeed keep their last known data.
+        """
+        sections = {
+            endpoint: self._sections_needed(endpoint)
+            for endpoint in _SECTIONED_ENDPOINTS
+        }
+        # Control settings read before a command confirms new ones are stale.
+        control_version = self._control_version
+        fetchers: dict[str, Callable[[], Awaitable[dict[str, Any]]]] = {
+            "info": partial(
+                self._async_fetch_endpoint,
+                "info",
+                partial(self.api.get_info, _sorted_or_none(sections["info"])),
+            ),
+            "control": partial(self._async_fetch_control, control_version),
+            "values": partial(
+                self._async_fetch_endpoint,
+                "values",
+                partial(self.api.get_values, _sorted_or_none(sections["values"])),
+            ),
+        }
+        data: dict[str, Any] = {}
+        if self.breaker.state is CircuitState.HALF_OPEN:
+            # Probe with the smallest endpoint before requesting the others.
+            try:
+                data["control"] = await fetchers["control"]()
+            except NRGkickApiClientCommunicationError as probe_err:
+                self._record_poll_failure()
+                raise _update_failed(probe_err) from probe_err
+            except NRGkickApiClientAuthenticationError as probe_err:
+                self._record_poll_success()
+                raise ConfigEntryAuthFailed from probe_err
+
+        due = [
+            endpoint
+            for endpoint in self._endpoints_due(started, sections, scheduled=scheduled)
+            if endpoint not in data
+        ]
+        results = await asyncio.gather(
+            *(fetchers[endpoint]() for endpoint in due), return_exceptions=True
+        )
+
+        failures: dict[str, NRGkickApiClientCommunicationError] = {}
+        for section, result in zip(due, results, strict=True):
+            if isinstance(result, NRGkickApiClientAuthenticationError):
+                self._record_poll_success()
+                raise ConfigEntryAuthFailed from result
+            if isinstance(result, NRGkickApiClientCommunicationError):
+                failures[section] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                data[section] = result
+
+        previous: dict[str, Any] = self.data or {}
+        if failures and not data:
+            self._record_poll_failure()
+        else:
+            self._record_poll_success()
+        if failures and (
+            not data or any(section not in previous for section in failures)
+        ):
+            err = next(iter(failures.values()))
+            raise _update_failed(err) from err
 
-        return {
-            "info": info,
-            "control": control,
-            "values": values,
+        if "control" in data and self._control_version != control_version:
+            # A command confirmed new settings after /control was read.
+            del data["control"]
+        for section, fetched in data.items():
+            self._endpoint_fetched_at[section] = started
+            if section in sections:
+                requested = self._endpoint_sections[section] = sections[section]
+                # Sections that are no longer fetched keep their last data.
+                if requested is not None and section in previous:
+                    data[section] = {**previous[section], **fetched}
+        for section, err in failures.items():
+            _LOGGER.debug("Keeping last known %s data after error: %s", section, err)
+
+        result = {
+            section: data[section] if section in data else previous[section]
+            for section in fetchers
         }
+        self.update_interval = self._scan_interval_for(result)
+        self._async_save_snapshot_later()
+        return result
+
+    def _record_poll_failure(self) -> None:
+        """Record a poll without any answer and log if polls are paused."""
+        if self.breaker.record_failure():
+            _LOGGER.warning(
+                "NRGkick device at %s is unreachable, pausing polls for %.0f seconds",
+                self.api.host,
+                self.breaker.backoff,
+            )
+        elif self.breaker.state is CircuitState.OPEN:
+            _LOGGER.debug(
+                "NRGkick device at %s is still unreachable, next attempt in %.0f "
+                "seconds",
+                self.api.host,
+                self.breaker.backoff,
+            )
+
+    def _record_poll_success(self) -> None:
+        """Record a poll with an answer and log if polls are resumed."""
+        if self.breaker.record_success():
+            _LOGGER.info("NRGkick device at %s is reachable again", self.api.host)
+
+    def _scan_interval_for(self, data: Mapping[str, Any]) -> timedelta:
+        """Return the scan interval that suits the state of the charger.
+
+        The charger is idle in standby and while a vehicle is connected but
+        not permitted to charge, unless a command was sent recently. All other
+        states, including unknown ones, use the (shorter) active interval.
+        """
+        if time.monotonic() - self._last_command_at < COMMAND_ACTIVITY_WINDOW:
+            return self._active_scan_interval
+        general = data.get("values", {}).get("general", {})
+        status = general.get("status")
+        if status == STATUS_STANDBY or (
+            status == STATUS_CONNECTED and not general.get("charge_permitted")
+        ):
+            return self._idle_scan_interval
+        return self._active_scan_interval
 
     async def _async_execute_command_with_verification(
         self,
         command_func: Callable[[], Awaitable[dict[str, Any]]],
-        expected_value: Any,
-        control_key: str,
+        expected: Mapping[str, Any],
         *,
         target: str,
         value: str,
@@ -87,11 +755,36 @@ class NRGkickDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         Args:
             command_func: Async function to execute the command
-            expected_value: Expected value after command execution
-            control_key: Key in control data to verify (e.g., "charge_pause")
-            error_message: Error message to show if verification fails
+            expected: Expected control values after the command, by key in
+                the control data (e.g., "charge_pause")
+            target: Name of the changed settings for error messages
+            value: Requested value(s) for error messages
 
         """
+        # Commands are sent one at a time, before waiting polls, and polls
+        # don't read /control until the command is confirmed or failed.
+        async with self.arbiter.async_acquire(Priority.COMMAND):
+            await self._async_send_command(
+                command_func, expected, target=target, value=value
+            )
+
+    async def _async_send_command(
+        self,
+        command_func: Callable[[], Awaitable[dict[str, Any]]],
+        expected: Mapping[str, Any],
+        *,
+        target: str,
+        value: str,
+    ) -> None:
+        """Send a command and confirm its values while holding the arbiter."""
+        # Poll at the active interval while the charger reacts to the command.
+        # The next refresh is scheduled with it right away, so it also follows
+        # a command that fails instead of waiting for an idle interval.
+        self._last_command_at = time.monotonic()
+        self.update_interval = self._active_scan_interval
+        if self._listeners:
+            self._schedule_refresh()
+
         # Execute command and get response.
         try:
             response = await command_func()
@@ -119,56 +812,168 @@ class NRGkickDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 },
             )
 
-        # Check if response contains the expected key with the new value.
-        if control_key in response:
-            actual_value = response[control_key]
+        # Check if response contains the expected keys with the new values.
+        if all(control_key in response for control_key in expected):
+            for control_key, expected_value in expected.items():
+                self._verify_control_value(
+                    response[control_key], expected_value, target=target, value=value
+                )
+
+            # Replace the control section with the new values, keeping the
+            # other sections, and notify the entities of the new data.
+            self._async_set_confirmed_control(
+                {
+                    **self.data.get("control", {}),
+                    **{control_key: response[control_key] for control_key in expected},
+                },
+                time.monotonic(),
+            )
+
+        else:
+            # Response doesn't contain the expected keys - poll /control.
+            await self._async_confirm_control(expected, target=target, value=value)
 
-            # Convert both values to float for comparison to handle type differences.
+    async def _async_confirm_control(
+        self, expected: Mapping[str, Any], *, target: str, value: str
+    ) -> None:
+        """Poll /control until it reports the expected values.
+
+        The delay between polls starts short and doubles up to a maximum, so
+        fast devices are confirmed quickly without flooding slow ones.
+
+        Raises:
+            HomeAssistantError: If the values are not confirmed in time.
+
+        """
+        started = self._last_command_at
+        deadline = started + COMMAND_CONFIRM_TIMEOUT
+        delay = COMMAND_CONFIRM_INITIAL_DELAY
+        control: dict[str, Any] | None = None
+        error = ""
+        while time.monotonic() + delay <= deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, COMMAND_CONFIRM_MAX_DELAY)
+            polled_at = time.monotonic()
             try:
-                actual_float = float(actual_value) if actual_value is not None else None
-                expected_float = (
-                    float(expected_value) if expected_value is not None else None
+                control = await self._async_fetch_endpoint(
+                    "control", self.api.get_control
+                )
+            except NRGkickApiClientError as err:
+                error = str(err)
+                continue
+            if all(
+                control_key in control
+                and self._control_value_matches(control[control_key], expected_value)
+                for control_key, expected_value in expected.items()
+            ):
+                self.last_confirmation_latency = time.monotonic() - started
+                _LOGGER.debug(
+                    "Confirmed %s after %.2f seconds",
+                    target,
+                    self.last_confirmation_latency,
                 )
-                if actual_float != expected_float:
-                    raise HomeAssistantError(
-                        translation_domain=DOMAIN,
-                        translation_key="set_failed_unexpected_value",
-                        translation_placeholders={
-                            "target": target,
-                            "value": value,
-                            "actual": str(actual_value),
-                            "expected": str(expected_value),
-                        },
+                self._async_set_confirmed_control(control, polled_at)
+                return
+
+        # Report a value that the device settled on instead of the expected one.
+        if control is not None:
+            for control_key, expected_value in expected.items():
+                if control_key in control:
+                    self._verify_control_value(
+                        control[control_key],
+                        expected_value,
+                        target=target,
+                        value=value,
                     )
-            except (ValueError, TypeError) as err:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="set_failed",
+            translation_placeholders={
+                "target": target,
+                "value": value,
+                "error": error
+                or f"Not confirmed within {COMMAND_CONFIRM_TIMEOUT} seconds",
+            },
+        )
+
+    @staticmethod
+    def _control_value_matches(actual_value: Any, expected_value: Any) -> bool:
+        """Return if a control value equals the expected value."""
+        try:
+            return float(actual_value) == float(expected_value)
+        except (ValueError, TypeError):
+            return False
+
+    @staticmethod
+    def _verify_control_value(
+        actual_value: Any, expected_value: Any, *, target: str, value: str
+    ) -> None:
+        """Raise if the device confirmed a different value than requested."""
+        # Convert both values to float for comparison to handle type differences.
+        try:
+            actual_float = float(actual_value) if actual_value is not None else None
+            expected_float = (
+                float(expected_value) if expected_value is not None else None
+            )
+            if actual_float != expected_float:
                 raise HomeAssistantError(
                     translation_domain=DOMAIN,
-                    translation_key="set_failed_invalid_value",
+                    translation_key="set_failed_unexpected_value",
                     translation_placeholders={
                         "target": target,
                         "value": value,
+                        "actual": str(actual_value),
+                        "expected": str(expected_value),
                     },
-                ) from err
-
-            # Update coordinator data immediately with the new value.
-            if "control" not in self.data:
-                self.data["control"] = {}
-            self.data["control"][control_key] = actual_value
+                )
+        except (ValueError, TypeError) as err:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="set_failed_invalid_value",
+                translation_placeholders={
+                    "target": target,
+                    "value": value,
+                },
+            ) from err
 
-            # Notify all entities that coordinator data has been updated.
-            self.async_set_updated_data(self.data)
+    @property
+    def max_current(self) -> float:
+        """Return the maximum charging current in A.
 
-        else:
-            # Response doesn't contain expected key - refresh to get current state.
-            await asyncio.sleep(2)
-            await self.async_request_refresh()
+        Like the charging current number, this is the rated current of the
+        device, further limited by the connector max current.
+        """
+        rated_current = float(
+            (self.data or {})
+            .get("info", {})
+            .get("general", {})
+            .get("rated_current", MAX_CURRENT_SET)
+        )
+        connector_max: float | None = self.decoded.get(CURRENT_LIMIT_PATH)
+        if connector_max is None:
+            return rated_current
+        return max(MIN_CURRENT_SET, min(rated_current, connector_max))
 
     async def async_set_current(self, current: float) -> None:
-        """Set the charging current."""
+        """Set the charging current, coalesced with other changes of it.
+
+        Raises:
+            HomeAssistantError: If the current that was sent, which may be a
+                later requested one, was not confirmed.
+
+        """
+        await self.current_writer.async_write(current)
+
+    def _is_current_set(self, current: float) -> bool:
+        """Return if the device confirmed current as charging current."""
+        confirmed = (self.data or {}).get("control", {}).get("current_set")
+        return confirmed is not None and self._control_value_matches(confirmed, current)
+
+    async def _async_write_current(self, current: float) -> None:
+        """Send the charging current to the device and verify it."""
         await self._async_execute_command_with_verification(
             lambda: self.api.set_current(current),
-            current,
-            "current_set",
+            {"current_set": current},
             target="current_set",
             value=str(current),
         )
@@ -178,8 +983,7 @@ class NRGkickDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         expected_state = 1 if pause else 0
         await self._async_execute_command_with_verification(
             lambda: self.api.set_charge_pause(pause),
-            expected_state,
-            "charge_pause",
+            {"charge_pause": expected_state},
             target="charge_pause",
             value="on" if pause else "off",
         )
@@ -188,8 +992,7 @@ class NRGkickDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Set the energy limit."""
         await self._async_execute_command_with_verification(
             lambda: self.api.set_energy_limit(energy_limit),
-            energy_limit,
-            "energy_limit",
+            {"energy_limit": energy_limit},
             target="energy_limit",
             value=str(energy_limit),
         )
@@ -198,8 +1001,51 @@ class NRGkickDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Set the phase count."""
         await self._async_execute_command_with_verification(
             lambda: self.api.set_phase_count(phase_count),
-            phase_count,
-            "phase_count",
+            {"phase_count": phase_count},
             target="phase_count",
             value=str(phase_count),
         )
+
+    async def async_set_control(
+        self,
+        *,
+        current: float | None = None,
+        charge_pause: bool | None = None,
+        energy_limit: int | None = None,
+        phase_count: int | None = None,
+    ) -> None:
+        """Set several control parameters with a single command.
+
+        The values are sent together, verified together and pushed to the
+        entities with a single coordinator update. A charging current
+        replaces a change of it still waiting in the current writer, so the
+        older value cannot be sent after the command.
+        """
+        expected: dict[str, Any] = {}
+        if current is not None:
+            expected["current_set"] = current
+        if charge_pause is not None:
+            expected["charge_pause"] = 1 if charge_pause else 0
+        if energy_limit is not None:
+            expected["energy_limit"] = energy_limit
+        if phase_count is not None:
+            expected["phase_count"] = phase_count
+
+        send = partial(
+            self._async_execute_command_with_verification,
+            lambda: self.api.set_control(
+                current=current,
+                charge_pause=charge_pause,
+                energy_limit=energy_limit,
+                phase_count=phase_count,
+            ),
+            expected,
+            target=", ".join(expected),
+            value=", ".join(
+                str(expected_value) for expected_value in expected.values()
+            ),
+        )
+        if current is None:
+            await send()
+        else:
+            await self.current_writer.async_write_with(send)
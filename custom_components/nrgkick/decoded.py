@@ -0,0 +1,227 @@
+"""Decoded, immutable view of the NRGkick coordinator data.
+
+The coordinator decodes its data once per update: enum values are mapped to
+translation keys, and values derived from other values, such as whether the
+vehicle is charging, are computed. Entities only look up their value in the
+decoded data, so decoding scales with the number of updates rather than with
+the number of entities and state reads.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from .const import (
+    CELLULAR_MODE_MAP,
+    CONNECTOR_TYPE_MAP,
+    ERROR_CODE_MAP,
+    GRID_PHASES_MAP,
+    RCD_TRIGGER_MAP,
+    RELAY_STATE_MAP,
+    STATUS_MAP,
+    WARNING_CODE_MAP,
+)
+
+# Keys leading from the coordinator data to a value, e.g.
+# ("values", "powerflow", "l1", "voltage").
+type ValuePath = tuple[str, ...]
+
+# First key of the paths of derived values, which are not part of the device
+# data, e.g. ("derived", "charging").
+DERIVED_KEY = "derived"
+
+STATUS_PATH: ValuePath = ("values", "general", "status")
+CONNECTOR_MAX_CURRENT_PATH: ValuePath = ("info", "connector", "max_current")
+
+
+def flatten_data(data: Mapping[str, Any] | None) -> dict[ValuePath, Any]:
+    """Return the leaf values of nested coordinator data keyed by their path."""
+    flat: dict[ValuePath, Any] = {}
+
+    def _flatten(node: Mapping[str, Any], prefix: ValuePath) -> None:
+        for key, value in node.items():
+            path = (*prefix, key)
+            if isinstance(value, dict):
+                _flatten(value, path)
+            else:
+                flat[path] = value
+
+    if data:
+        _flatten(data, ())
+    return flat
+
+
+def decode_enum(
+    mapping: Mapping[int, str], *, words: bool = False
+) -> Callable[[Any], str]:
+    """Return a function that maps an enum value to its translation key.
+
+    Raw values are looked up in mapping. Text values, returned by devices
+    without raw mode, are lowercased and, with words, spaces and commas
+    are replaced by underscores (e.g., "L1, L2" becomes "l1_l2").
+    """
+
+    def _decode(value: Any) -> str:
+        if isinstance(value, int):
+            return mapping.get(value, "unknown")
+        text = str(value).lower()
+        if words:
+            return text.replace(", ", "_").replace(" ", "_")
+        return text
+
+    return _decode
+
+
+def _to_float(value: Any) -> float | None:
+    """Return value as float, None if it is not a number."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# Decoders of device values that entities don't publish as returned.
+DECODERS: dict[ValuePath, Callable[[Any], Any]] = {
+    ("info", "connector", "type"): decode_enum(CONNECTOR_TYPE_MAP),
+    ("info", "grid", "phases"): decode_enum(GRID_PHASES_MAP, words=True),
+    ("info", "cellular", "mode"): decode_enum(CELLULAR_MODE_MAP),
+    STATUS_PATH: decode_enum(STATUS_MAP),
+    ("values", "general", "relay_state"): decode_enum(RELAY_STATE_MAP, words=True),
+    ("values", "general", "rcd_trigger"): decode_enum(RCD_TRIGGER_MAP),
+    ("values", "general", "warning_code"): decode_enum(WARNING_CODE_MAP),
+    ("values", "general", "error_code"): decode_enum(ERROR_CODE_MAP),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class DerivedValue:
+    """A value computed from the decoded value at source.
+
+    The derived value is missing if the source value is missing.
+    """
+
+    source: ValuePath
+    compute: Callable[[Any], Any]
+
+
+# Whether the vehicle is charging, from the decoded status.
+CHARGING_PATH: ValuePath = (DERIVED_KEY, "charging")
+# Connector max current in A, the upper limit of the charging current.
+CURRENT_LIMIT_PATH: ValuePath = (DERIVED_KEY, "current_limit")
+
+DERIVED: dict[ValuePath, DerivedValue] = {
+    CHARGING_PATH: DerivedValue(STATUS_PATH, lambda status: status == "charging"),
+    CURRENT_LIMIT_PATH: DerivedValue(CONNECTOR_MAX_CURRENT_PATH, _to_float),
+}
+
+
+# Decoders by the top-level section of the paths they decode.
+_SECTION_DECODERS: dict[str, tuple[tuple[ValuePath, Callable[[Any], Any]], ...]] = {
+    section: tuple(item for item in DECODERS.items() if item[0][0] == section)
+    for section in {path[0] for path in DECODERS}
+}
+
+
+def source_paths(path: ValuePath) -> tuple[ValuePath, ...]:
+    """Return path and, for a derived value, the path it is computed from."""
+    if (derived := DERIVED.get(path)) is not None:
+        return (path, derived.source)
+    return (path,)
+
+
+# Marks a missing value when comparing values, which may be None.
+_MISSING = object()
+
+
+def changed_paths(
+    new: Mapping[ValuePath, Any], old: Mapping[ValuePath, Any]
+) -> set[ValuePath]:
+    """Return the paths whose value was added, removed or changed."""
+    return {
+        path
+        for path in new.keys() | old.keys()
+        if new.get(path, _MISSING) != old.get(path, _MISSING)
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class DecodedData:
+    """Decoded leaf values and derived values of coordinator data by path.
+
+    The values are also kept per top-level section of the data, along with
+    the section they were decoded from. The coordinator replaces changed
+    sections instead of updating them in place, so a section that is the
+    same object in the next data is neither decoded nor compared again.
+    """
+
+    values: Mapping[ValuePath, Any]
+    sections: Mapping[str, Mapping[ValuePath, Any]]
+    sources: Mapping[str, Any]
+    # Returns the value at a path, None if it is missing. The get method of
+    # the dict behind values, so a state read is a single dict lookup.
+    get: Callable[[ValuePath], Any]
+
+    def changed_paths(self, previous: DecodedData) -> set[ValuePath]:
+        """Return the paths whose value differs from the one in previous."""
+        changed: set[ValuePath] = set()
+        for key in self.sections.keys() | previous.sections.keys():
+            new = self.sections.get(key, _EMPTY_VALUES)
+            old = previous.sections.get(key, _EMPTY_VALUES)
+            if new is not old:
+                changed |= changed_paths(new, old)
+        return changed
+
+
+_EMPTY: dict[ValuePath, Any] = {}
+_EMPTY_VALUES: Mapping[ValuePath, Any] = MappingProxyType(_EMPTY)
+EMPTY_DATA = DecodedData(
+    _EMPTY_VALUES, MappingProxyType({}), MappingProxyType({}), _EMPTY.get
+)
+
+
+def _decode_section(key: str, node: Any) -> Mapping[ValuePath, Any]:
+    """Return the decoded leaf values of a top-level section by path."""
+    values = flatten_data({key: node})
+    for path, decode in _SECTION_DECODERS.get(key, ()):
+        if (value := values.get(path)) is not None:
+            values[path] = decode(value)
+    return MappingProxyType(values)
+
+
+def decode_data(
+    data: Mapping[str, Any] | None, previous: DecodedData | None = None
+) -> DecodedData:
+    """Return the decoded view of nested coordinator data.
+
+    Args:
+        data: Coordinator data, nested dicts by endpoint and section.
+        previous: View of earlier data. Its decoded values are reused for
+            sections that are the same object in data.
+
+    Returns:
+        The decoded leaf values and the derived values.
+
+    """
+    sources = MappingProxyType(dict(data or {}))
+    sections: dict[str, Mapping[ValuePath, Any]] = {}
+    for key, node in sources.items():
+        if previous is not None and previous.sources.get(key) is node:
+            sections[key] = previous.sections[key]
+        else:
+            sections[key] = _decode_section(key, node)
+    values: dict[ValuePath, Any] = {}
+    for section in sections.values():
+        values.update(section)
+    derived = {
+        path: derived.compute(value)
+        for path, derived in DERIVED.items()
+        if (value := values.get(derived.source)) is not None
+    }
+    values.update(derived)
+    sections[DERIVED_KEY] = MappingProxyType(derived)
+    return DecodedData(
+        MappingProxyType(values), MappingProxyType(sections), sources, values.get
+    )
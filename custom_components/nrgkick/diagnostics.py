@@ -7,14 +7,16 @@ from typing import Any
 from homeassistant.core import HomeAssistant
 
 from . import NRGkickConfigEntry, NRGkickDataUpdateCoordinator
+from .scheduler import async_get_scheduler
 
 
 async def async_get_config_entry_diagnostics(
-    _hass: HomeAssistant,
+    hass: HomeAssistant,
     entry: NRGkickConfigEntry,
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator: NRGkickDataUpdateCoordinator = entry.runtime_data
+    scheduler = async_get_scheduler(hass)
 
     return {
         "entry": {
@@ -33,6 +35,31 @@ async def async_get_config_entry_diagnostics(
                 if coordinator.update_interval is not None
                 else None
             ),
+            "last_confirmation_latency": coordinator.last_confirmation_latency,
+            "control_reads_saved": coordinator.control_reads_saved,
+            "waiting_control_operations": coordinator.arbiter.waiting,
+            "stale": coordinator.is_stale,
+        },
+        "request_stats": coordinator.request_stats,
+        "circuit_breaker": {
+            "state": coordinator.breaker.state,
+            "consecutive_failures": coordinator.breaker.consecutive_failures,
+            "retry_in": coordinator.breaker.retry_in,
+        },
+        "api": {
+            "requests": coordinator.api.request_count,
+            "coalesced_requests": coordinator.api.coalesced_count,
+        },
+        "current_writes": {
+            "window": coordinator.current_writer.window,
+            "sent": coordinator.current_writer.writes,
+            "coalesced": coordinator.current_writer.coalesced,
+        },
+        "scheduler": {
+            "devices": scheduler.device_count,
+            "max_concurrent_polls": scheduler.max_concurrent_polls,
+            "last_cycle_duration": scheduler.last_cycle_duration,
+            "last_cycle_polls": scheduler.last_cycle_polls,
         },
         "data": coordinator.data,
     }
@@ -2,26 +2,73 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
 from typing import Any
 
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import ATTR_STALE
 from .coordinator import NRGkickDataUpdateCoordinator
+from .decoded import ValuePath, source_paths
 
 
 class NRGkickEntity(CoordinatorEntity[NRGkickDataUpdateCoordinator]):
-    """Base class for NRGkick entities with common device info setup."""
+    """Base class for NRGkick entities sharing the device info of the coordinator."""
 
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: NRGkickDataUpdateCoordinator, key: str) -> None:
-        """Initialize the entity."""
-        super().__init__(coordinator)
-        self._key = key
-        self._attr_translation_key = key
-        self._setup_device_info()
+    def __init__(
+        self,
+        coordinator: NRGkickDataUpdateCoordinator,
+        description: EntityDescription,
+        value_paths: Iterable[ValuePath] | None = None,
+    ) -> None:
+        """Initialize the entity.
+
+        Args:
+            coordinator: The data update coordinator.
+            description: Description shared by the entities of all devices.
+                Its key is used for the unique ID and, unless the description
+                has a translation key, for translations.
+            value_paths: Paths of the values the state depends on. The entity
+                is only updated when one of them changes. If None, it is
+                updated on every coordinator update. Derived values also
+                register their source, so its section is fetched.
+
+        """
+        context = (
+            None
+            if value_paths is None
+            else frozenset(
+                source for path in value_paths for source in source_paths(path)
+            )
+        )
+        super().__init__(coordinator, context)
+        # Endpoints the state is read from, None if unknown.
+        self._endpoints = (
+            None if context is None else frozenset(path[0] for path in context)
+        )
+        self.entity_description = description
+        if description.translation_key is None:
+            self._attr_translation_key = description.key
+        self._attr_unique_id = (
+            f"{coordinator.device_identity.serial_number}_{description.key}"
+        )
+        self._attr_device_info = coordinator.device_info
+
+    @property
+    def is_stale(self) -> bool:
+        """Return if the state is read from restored data not fetched since."""
+        restored = self.coordinator.restored_endpoints
+        return bool(restored) and (
+            self._endpoints is None or not restored.isdisjoint(self._endpoints)
+        )
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        """Mark states that show restored values until they are fetched live."""
+        return {ATTR_STALE: True} if self.is_stale else None
 
     @property
     def suggested_object_id(self) -> str | None:
@@ -33,25 +80,4 @@ class NRGkickEntity(CoordinatorEntity[NRGkickDataUpdateCoordinator]):
         in the UI via translation_key.
 
         """
-        return self._key
-
-    def _setup_device_info(self) -> None:
-        """Set up device info and unique ID."""
-        data = self.coordinator.data
-        info_data: dict[str, Any] = data.get("info", {}) if data else {}
-        device_info: dict[str, Any] = info_data.get("general", {})
-        serial: str = device_info.get("serial_number", "unknown")
-
-        device_name: str | None = device_info.get("device_name")
-        if not device_name:
-            device_name = "NRGkick"
-
-        versions: dict[str, Any] = info_data.get("versions", {})
-        self._attr_unique_id = f"{serial}_{self._key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, serial)},
-            name=device_name,
-            manufacturer="DiniTech",
-            model=device_info.get("model_type", "NRGkick Gen2"),
-            sw_version=versions.get("sw_sm"),
-        )
+        return self.entity_description.key
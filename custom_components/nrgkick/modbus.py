@@ -0,0 +1,684 @@
+"""NRGkick Modbus TCP client for Home Assistant.
+
+This module provides an alternative transport to the JSON REST API. It reads
+the same info, control and values data from the Modbus TCP interface of the
+device and decodes it into the dictionaries returned by the REST API in raw
+mode, so the coordinator and the entities can use either client.
+
+A single TCP connection is kept open and every section is read with one or a
+few contiguous block reads instead of an HTTP request per endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+import logging
+import struct
+from typing import Any
+
+from .api import NRGkickApiClientCommunicationError
+from .coalescer import ReadCoalescer
+from .const import DEFAULT_MODBUS_PORT, DOMAIN, MODBUS_TIMEOUT, MODBUS_UNIT_ID
+
+_LOGGER = logging.getLogger(__name__)
+
+# Modbus function codes.
+_READ_HOLDING_REGISTERS = 0x03
+_WRITE_SINGLE_REGISTER = 0x06
+_WRITE_MULTIPLE_REGISTERS = 0x10
+
+# Modbus exception code for registers the device does not provide.
+_ILLEGAL_DATA_ADDRESS = 0x02
+
+# MBAP header: transaction ID, protocol ID, length, unit ID.
+_MBAP_HEADER = struct.Struct(">HHHB")
+
+# Register data types of the NRGkick Modbus API and their little-endian
+# layout in the byte stream of a block read.
+_FORMATS: dict[str, str] = {
+    "uint16": "<H",
+    "int16": "<h",
+    "uint32": "<I",
+    "int32": "<i",
+    "uint64": "<Q",
+    "float": "<f",
+}
+
+# Control registers.
+_REG_CURRENT_SET = 194
+_REG_CHARGE_PAUSE = 195
+_REG_ENERGY_LIMIT = 196
+_REG_PHASE_COUNT = 198
+
+
+@dataclass(frozen=True, slots=True)
+class _Field:
+    """A value stored in one or more consecutive registers."""
+
+    path: tuple[str, ...]
+    address: int
+    unpacker: struct.Struct
+    factor: int = 1
+
+
+@dataclass(frozen=True, slots=True)
+class _Block:
+    """Registers that are read together with a single request."""
+
+    start: int
+    count: int
+    fields: tuple[_Field, ...]
+    optional: bool = False
+
+
+def _value(
+    path: tuple[str, ...], address: int, data_type: str, factor: int = 1
+) -> _Field:
+    """Return a numeric field, scaled down by factor."""
+    return _Field(path, address, struct.Struct(_FORMATS[data_type]), factor)
+
+
+def _string(path: tuple[str, ...], address: int, count: int) -> _Field:
+    """Return a NUL padded UTF-8 string16 field of count registers."""
+    return _Field(path, address, struct.Struct(f"{count * 2}s"))
+
+
+def _phase_fields(
+    name: str, address: int, data_type: str, factor: int, stride: int
+) -> tuple[_Field, ...]:
+    """Return the L1, L2 and L3 fields of a per-phase power flow value."""
+    return tuple(
+        _value(("powerflow", phase, name), address + index * stride, data_type, factor)
+        for index, phase in enumerate(("l1", "l2", "l3"))
+    )
+
+
+# Register map of the /info data. Cellular, GPS and the cellular module
+# version are only readable on devices with a cellular module.
+_INFO_BLOCKS: dict[str, _Block] = {
+    "base": _Block(
+        0,
+        80,
+        (
+            _string(("general", "serial_number"), 0, 11),
+            _string(("general", "model_type"), 11, 16),
+            _string(("general", "device_name"), 27, 8),
+            _value(("general", "rated_current"), 35, "uint16"),
+            _value(("connector", "phase_count"), 36, "uint16"),
+            _value(("connector", "max_current"), 37, "uint16", 10),
+            _value(("connector", "type"), 38, "uint16"),
+            _string(("connector", "serial"), 39, 4),
+            _value(("grid", "voltage"), 43, "uint16"),
+            _value(("grid", "frequency"), 44, "uint16"),
+            _value(("grid", "phases"), 45, "uint16"),
+            _string(("network", "ip_address"), 46, 8),
+            _string(("network", "mac_address"), 54, 9),
+            _string(("network", "ssid"), 63, 16),
+            _value(("network", "rssi"), 79, "int16"),
+        ),
+    ),
+    "cellular": _Block(
+        80,
+        34,
+        (
+            _string(("cellular", "imei"), 80, 8),
+            _string(("cellular", "imsi"), 88, 8),
+            _string(("cellular", "operator"), 96, 16),
+            _value(("cellular", "rssi"), 112, "int16"),
+            _value(("cellular", "mode"), 113, "uint16"),
+        ),
+        optional=True,
+    ),
+    "gps": _Block(
+        114,
+        8,
+        (
+            _value(("gps", "latitude"), 114, "float"),
+            _value(("gps", "longitude"), 116, "float"),
+            _value(("gps", "altitude"), 118, "float"),
+            _value(("gps", "accuracy"), 120, "float"),
+        ),
+        optional=True,
+    ),
+    "versions": _Block(
+        122,
+        64,
+        tuple(
+            _string(("versions", key), 122 + index * 8, 8)
+            for index, key in enumerate(
+                ("sw_sm", "hw_sm", "sw_ma", "hw_ma", "sw_to", "hw_to", "sw_st", "hw_st")
+            )
+        ),
+    ),
+    "sw_cm": _Block(186, 8, (_string(("versions", "sw_cm"), 186, 8),), optional=True),
+}
+
+# Blocks to read for each /info section.
+_INFO_SECTION_BLOCKS: dict[str, tuple[str, ...]] = {
+    "general": ("base",),
+    "connector": ("base",),
+    "grid": ("base",),
+    "network": ("base",),
+    "cellular": ("cellular",),
+    "gps": ("gps",),
+    "versions": ("versions", "sw_cm"),
+}
+
+_CONTROL_BLOCK = _Block(
+    194,
+    5,
+    (
+        _value(("current_set",), _REG_CURRENT_SET, "uint16", 10),
+        _value(("charge_pause",), _REG_CHARGE_PAUSE, "uint16"),
+        _value(("energy_limit",), _REG_ENERGY_LIMIT, "uint32"),
+        _value(("phase_count",), _REG_PHASE_COUNT, "uint16"),
+    ),
+)
+
+_VALUES_BLOCK = _Block(
+    199,
+    65,
+    (
+        _value(("energy", "total_charged_energy"), 199, "uint64"),
+        _value(("energy", "charged_energy"), 203, "uint32"),
+        _value(("powerflow", "charging_voltage"), 205, "uint16", 100),
+        _value(("powerflow", "charging_current"), 206, "uint16", 10),
+        _value(("powerflow", "grid_frequency"), 207, "uint16", 100),
+        _value(("powerflow", "peak_power"), 208, "int32", 1000),
+        _value(("powerflow", "total_active_power"), 210, "int32", 1000),
+        _value(("powerflow", "total_reactive_power"), 212, "int32", 1000),
+        _value(("powerflow", "total_apparent_power"), 214, "uint32", 1000),
+        _value(("powerflow", "total_power_factor"), 216, "int16", 1000),
+        *_phase_fields("voltage", 217, "uint16", 100, 1),
+        *_phase_fields("current", 220, "uint16", 1000, 1),
+        _value(("powerflow", "n", "current"), 223, "uint16", 1000),
+        *_phase_fields("active_power", 224, "int32", 1000, 2),
+        *_phase_fields("reactive_power", 230, "int32", 1000, 2),
+        *_phase_fields("apparent_power", 236, "uint32", 1000, 2),
+        *_phase_fields("power_factor", 242, "int16", 1000, 1),
+        _value(("general", "charging_rate"), 245, "float"),
+        _value(("general", "vehicle_connect_time"), 247, "uint32"),
+        _value(("general", "vehicle_charging_time"), 249, "uint32"),
+        _value(("general", "status"), 251, "uint16"),
+        _value(("general", "charge_permitted"), 252, "uint16"),
+        _value(("general", "relay_state"), 253, "uint16"),
+        _value(("general", "charge_count"), 254, "uint16"),
+        _value(("general", "rcd_trigger"), 255, "uint16"),
+        _value(("general", "warning_code"), 256, "uint16"),
+        _value(("general", "error_code"), 257, "uint16"),
+        _value(("temperatures", "housing"), 258, "int16", 100),
+        _value(("temperatures", "connector_l1"), 259, "int16", 100),
+        _value(("temperatures", "connector_l2"), 260, "int16", 100),
+        _value(("temperatures", "connector_l3"), 261, "int16", 100),
+        _value(("temperatures", "domestic_plug_1"), 262, "int16", 100),
+        _value(("temperatures", "domestic_plug_2"), 263, "int16", 100),
+    ),
+)
+
+
+def registers_to_bytes(registers: list[int]) -> bytes:
+    """Return the little-endian byte stream of a register block."""
+    return struct.pack(f"<{len(registers)}H", *registers)
+
+
+def bytes_to_registers(data: bytes) -> list[int]:
+    """Return the registers of a little-endian byte stream."""
+    return list(struct.unpack(f"<{len(data) // 2}H", data))
+
+
+def _merge_register_writes(
+    writes: dict[int, list[int]],
+) -> list[tuple[int, list[int]]]:
+    """Merge register writes at adjacent addresses into single writes."""
+    merged: list[tuple[int, list[int]]] = []
+    for address in sorted(writes):
+        if merged and merged[-1][0] + len(merged[-1][1]) == address:
+            merged[-1][1].extend(writes[address])
+        else:
+            merged.append((address, list(writes[address])))
+    return merged
+
+
+def _decode_block(block: _Block, registers: list[int], target: dict[str, Any]) -> None:
+    """Decode the fields of a block read into a nested dictionary."""
+    data = registers_to_bytes(registers)
+    for field in block.fields:
+        (value,) = field.unpacker.unpack_from(data, (field.address - block.start) * 2)
+        if isinstance(value, bytes):
+            value = value.split(b"\0", 1)[0].decode("utf-8", errors="replace")
+        elif field.factor != 1:
+            value = round(value / field.factor, len(str(field.factor)) - 1)
+        node = target
+        for key in field.path[:-1]:
+            node = node.setdefault(key, {})
+        node[field.path[-1]] = value
+
+
+class ModbusError(Exception):
+    """Exception response of a Modbus device."""
+
+    def __init__(self, function: int, code: int) -> None:
+        """Initialize the exception."""
+        super().__init__(f"Modbus exception code {code} for function {function:#04x}")
+        self.code = code
+
+
+class NRGkickModbusAPI:
+    """Home Assistant client for the NRGkick Modbus TCP interface.
+
+    The public methods mirror the NRGkickAPI wrapper. Enum fields are always
+    returned as raw numeric values, which is what the integration requests
+    from the REST API as well.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = DEFAULT_MODBUS_PORT,
+        unit_id: int = MODBUS_UNIT_ID,
+    ) -> None:
+        """Initialize the Modbus client.
+
+        Args:
+            host: IP address or hostname of the NRGkick device.
+            port: Modbus TCP port of the device.
+            unit_id: Modbus unit ID of the device.
+
+        """
+        self.host = host
+        self.port = port
+        self.unit_id = unit_id
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+        self._transaction_id = 0
+        # Optional blocks the device rejected; they are not requested again.
+        self._unavailable_blocks: set[str] = set()
+        # Bytes of register data of the last read of each endpoint, e.g.
+        # "values", like the response sizes of the REST API client.
+        self.response_sizes: dict[str, int] = {}
+        # Shares block reads in progress, like the REST API client does.
+        self._reads: ReadCoalescer[tuple[str, ...]] = ReadCoalescer()
+
+    @property
+    def request_count(self) -> int:
+        """Return the number of reads sent to the device."""
+        return self._reads.reads
+
+    @property
+    def coalesced_count(self) -> int:
+        """Return the number of reads served by one already in progress."""
+        return self._reads.coalesced
+
+    async def close(self) -> None:
+        """Close the connection to the device."""
+        async with self._lock:
+            await self._async_disconnect()
+
+    async def _async_disconnect(self) -> None:
+        """Close the current connection, if any."""
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            with contextlib.suppress(OSError):
+                await writer.wait_closed()
+
+    async def _async_transaction(self, function: int, payload: bytes) -> bytes:
+        """Send a request and return the data of the response.
+
+        A connection that was closed by the device since the previous request
+        is reopened once before giving up.
+
+        Raises:
+            ModbusError: If the device answers with an exception response.
+            NRGkickApiClientCommunicationError: If communication fails.
+
+        """
+        async with self._lock:
+            for attempt in range(2):
+                reused = self._writer is not None
+                try:
+                    async with asyncio.timeout(MODBUS_TIMEOUT):
+                        return await self._async_exchange(function, payload)
+                except ModbusError:
+                    raise
+                except (OSError, asyncio.IncompleteReadError, TimeoutError) as err:
+                    await self._async_disconnect()
+                    if reused and attempt == 0 and not isinstance(err, TimeoutError):
+                        continue
+                    _LOGGER.debug(
+                        "Communication error with NRGkick device at %s:%s: %s",
+                        self.host,
+                        self.port,
+                        err,
+                    )
+                    raise NRGkickApiClientCommunicationError(
+                        translation_domain=DOMAIN,
+                        translation_key="communication_error",
+                        translation_placeholders={"error": str(err) or repr(err)},
+                    ) from err
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def _async_exchange(self, function: int, payload: bytes) -> bytes:
+        """Exchange a single request and response frame on the connection."""
+        if self._writer is None or self._reader is None:
+            self._reader, self._writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+        self._transaction_id = (self._transaction_id + 1) & 0xFFFF
+        self._writer.write(
+            _MBAP_HEADER.pack(self._transaction_id, 0, len(payload) + 2, self.unit_id)
+            + bytes((function,))
+            + payload
+        )
+        await self._writer.drain()
+
+        while True:
+            transaction_id, _, length, _ = _MBAP_HEADER.unpack(
+                await self._reader.readexactly(_MBAP_HEADER.size)
+            )
+            pdu = await self._reader.readexactly(length - 1)
+            # Skip late responses of requests that timed out earlier.
+            if transaction_id == self._transaction_id:
+                break
+
+        if pdu[0] == function | 0x80:
+            raise ModbusError(function, pdu[1])
+        if pdu[0] != function:
+            raise OSError(f"Unexpected Modbus function code {pdu[0]:#04x}")
+        return pdu[1:]
+
+    async def _async_read_registers(self, start: int, count: int) -> list[int]:
+        """Read a contiguous range of holding registers."""
+        data = await self._async_transaction(
+            _READ_HOLDING_REGISTERS, struct.pack(">HH", start, count)
+        )
+        if data[0] != count * 2 or len(data) != count * 2 + 1:
+            raise NRGkickApiClientCommunicationError(
+                translation_domain=DOMAIN,
+                translation_key="communication_error",
+                translation_placeholders={
+                    "error": f"Expected {count} registers from address {start}"
+                },
+            )
+        return list(struct.unpack(f">{count}H", data[1:]))
+
+    async def _async_write_registers(self, start: int, registers: list[int]) -> None:
+        """Write one or more consecutive holding registers."""
+        if len(registers) == 1:
+            await self._async_transaction(
+                _WRITE_SINGLE_REGISTER, struct.pack(">HH", start, registers[0])
+            )
+            return
+        await self._async_transaction(
+            _WRITE_MULTIPLE_REGISTERS,
+            struct.pack(
+                f">HHB{len(registers)}H",
+                start,
+                len(registers),
+                len(registers) * 2,
+                *registers,
+            ),
+        )
+
+    async def _async_read_block(
+        self, name: str, block: _Block, target: dict[str, Any]
+    ) -> int:
+        """Read a block and decode it into target.
+
+        Optional blocks the device does not provide are skipped.
+
+        Returns:
+            The number of bytes of register data read.
+
+        """
+        if name in self._unavailable_blocks:
+            return 0
+        try:
+            registers = await self._async_read_registers(block.start, block.count)
+        except ModbusError as err:
+            if block.optional and err.code == _ILLEGAL_DATA_ADDRESS:
+                _LOGGER.debug("NRGkick device does not provide %s registers", name)
+                self._unavailable_blocks.add(name)
+                return 0
+            raise NRGkickApiClientCommunicationError(
+                translation_domain=DOMAIN,
+                translation_key="communication_error",
+                translation_placeholders={"error": str(err)},
+            ) from err
+        _decode_block(block, registers, target)
+        return block.count * 2
+
+    async def get_info(
+        self,
+        sections: list[str] | None = None,
+        *,
+        raw: bool = True,  # pylint: disable=unused-argument
+    ) -> dict[str, Any]:
+        """Get device information.
+
+        Args:
+            sections: Optional list of sections to retrieve.
+            raw: Accepted for compatibility; values are always raw.
+
+        Returns:
+            Device information dictionary.
+
+        """
+        wanted = sections or list(_INFO_SECTION_BLOCKS)
+        blocks = tuple(
+            dict.fromkeys(
+                block
+                for section in wanted
+                for block in _INFO_SECTION_BLOCKS.get(section, ())
+            )
+        )
+        info = await self._reads.async_read(
+            ("info", *blocks), lambda: self._async_read_info(blocks)
+        )
+        return {section: data for section, data in info.items() if section in wanted}
+
+    async def _async_read_info(self, blocks: tuple[str, ...]) -> dict[str, Any]:
+        """Read the given info blocks."""
+        info: dict[str, Any] = {}
+        size = 0
+        for name in blocks:
+            size += await self._async_read_block(name, _INFO_BLOCKS[name], info)
+        self.response_sizes["info"] = size
+        return info
+
+    async def get_control(self) -> dict[str, Any]:
+        """Get current control parameters.
+
+        Returns:
+            Control parameters dictionary.
+
+        """
+        return await self._reads.async_read(("control",), self._async_read_control)
+
+    async def _async_read_control(self) -> dict[str, Any]:
+        """Read the control block."""
+        control: dict[str, Any] = {}
+        self.response_sizes["control"] = await self._async_read_block(
+            "control", _CONTROL_BLOCK, control
+        )
+        return control
+
+    async def get_values(
+        self,
+        sections: list[str] | None = None,
+        *,
+        raw: bool = True,  # pylint: disable=unused-argument
+    ) -> dict[str, Any]:
+        """Get current values.
+
+        All sections are read with one block read, which reads of other
+        sections in progress share.
+
+        Args:
+            sections: Optional list of sections to retrieve.
+            raw: Accepted for compatibility; values are always raw.
+
+        Returns:
+            Current values dictionary.
+
+        """
+        values = await self._reads.async_read(("values",), self._async_read_values)
+        if sections:
+            return {key: data for key, data in values.items() if key in sections}
+        return values
+
+    async def _async_read_values(self) -> dict[str, Any]:
+        """Read the values block."""
+        values: dict[str, Any] = {}
+        self.response_sizes["values"] = await self._async_read_block(
+            "values", _VALUES_BLOCK, values
+        )
+        return values
+
+    async def _async_write_control(
+        self, key: str, address: int, registers: list[int]
+    ) -> dict[str, Any]:
+        """Write a control value and return the value read back from the device.
+
+        The device rejects values out of range with an exception response,
+        which is returned in the "Response" key like the REST API does.
+        """
+        try:
+            await self._async_write_registers(address, registers)
+        except ModbusError as err:
+            return {"Response": str(err)}
+        # Not shared with a read in progress, which may predate the write.
+        control = await self._async_read_control()
+        return {key: control[key]}
+
+    async def set_current(self, current: float) -> dict[str, Any]:
+        """Set charging current.
+
+        Args:
+            current: Charging current in Amps (6.0-32.0).
+
+        Returns:
+            Response dictionary with confirmed value.
+
+        """
+        return await self._async_write_control(
+            "current_set", _REG_CURRENT_SET, [round(current * 10)]
+        )
+
+    async def set_charge_pause(self, pause: bool) -> dict[str, Any]:
+        """Set charge pause state.
+
+        Args:
+            pause: True to pause charging, False to resume.
+
+        Returns:
+            Response dictionary with confirmed value.
+
+        """
+        return await self._async_write_control(
+            "charge_pause", _REG_CHARGE_PAUSE, [1 if pause else 0]
+        )
+
+    async def set_energy_limit(self, limit: int) -> dict[str, Any]:
+        """Set energy limit in Wh (0 = no limit).
+
+        Args:
+            limit: Energy limit in Watt-hours.
+
+        Returns:
+            Response dictionary with confirmed value.
+
+        """
+        return await self._async_write_control(
+            "energy_limit",
+            _REG_ENERGY_LIMIT,
+            bytes_to_registers(struct.pack("<I", limit)),
+        )
+
+    async def set_phase_count(self, phases: int) -> dict[str, Any]:
+        """Set phase count (1-3).
+
+        Args:
+            phases: Number of phases to use (1, 2, or 3).
+
+        Returns:
+            Response dictionary with confirmed value.
+
+        Raises:
+            ValueError: If phases is not 1, 2, or 3.
+
+        """
+        if phases not in (1, 2, 3):
+            raise ValueError("Phase count must be 1, 2, or 3")
+        return await self._async_write_control(
+            "phase_count", _REG_PHASE_COUNT, [phases]
+        )
+
+    async def set_control(
+        self,
+        *,
+        current: float | None = None,
+        charge_pause: bool | None = None,
+        energy_limit: int | None = None,
+        phase_count: int | None = None,
+    ) -> dict[str, Any]:
+        """Set several control parameters with as few requests as possible.
+
+        Values in adjacent registers are written with a single request, e.g.
+        current and charge pause. All values are read back with one request.
+
+        Args:
+            current: Charging current in Amps (6.0-32.0).
+            charge_pause: True to pause charging, False to resume.
+            energy_limit: Energy limit in Watt-hours (0 = no limit).
+            phase_count: Number of phases to use (1, 2, or 3).
+
+        Returns:
+            Response dictionary with the confirmed values.
+
+        Raises:
+            ValueError: If no parameter is given or phase_count is not 1, 2, or 3.
+
+        """
+        writes: dict[int, list[int]] = {}
+        keys: list[str] = []
+        if current is not None:
+            writes[_REG_CURRENT_SET] = [round(current * 10)]
+            keys.append("current_set")
+        if charge_pause is not None:
+            writes[_REG_CHARGE_PAUSE] = [1 if charge_pause else 0]
+            keys.append("charge_pause")
+        if energy_limit is not None:
+            writes[_REG_ENERGY_LIMIT] = bytes_to_registers(
+                struct.pack("<I", energy_limit)
+            )
+            keys.append("energy_limit")
+        if phase_count is not None:
+            if phase_count not in (1, 2, 3):
+                raise ValueError("Phase count must be 1, 2, or 3")
+            writes[_REG_PHASE_COUNT] = [phase_count]
+            keys.append("phase_count")
+        if not writes:
+            raise ValueError("At least one control parameter is required")
+
+        try:
+            for address, registers in _merge_register_writes(writes):
+                await self._async_write_registers(address, registers)
+        except ModbusError as err:
+            return {"Response": str(err)}
+        # Not shared with a read in progress, which may predate the writes.
+        control = await self._async_read_control()
+        return {key: control[key] for key in keys}
+
+    async def test_connection(self) -> bool:
+        """Test if we can connect to the device.
+
+        Returns:
+            True if connection successful.
+
+        """
+        await self.get_info(["general"])
+        return True
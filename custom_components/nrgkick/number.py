@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 import logging
-from typing import Any
 
-from homeassistant.components.number import NumberEntity, NumberMode
-from homeassistant.const import EntityCategory, UnitOfElectricCurrent
+from homeassistant.components.number import (
+    DEFAULT_MAX_VALUE,
+    NumberEntity,
+    NumberEntityDescription,
+    NumberMode,
+)
+from homeassistant.const import UnitOfElectricCurrent, UnitOfEnergy
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from . import NRGkickConfigEntry, NRGkickDataUpdateCoordinator, NRGkickEntity
+from .decoded import CURRENT_LIMIT_PATH, ValuePath
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,6 +25,76 @@ _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = 0
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class NRGkickNumberEntityDescription(NumberEntityDescription):
+    """Describes an NRGkick number, where it is read from and how it is set.
+
+    If max_value_path is set, the maximum is further limited by the decoded
+    value at that path, a float which can change at runtime.
+    """
+
+    value_path: ValuePath
+    set_fn: Callable[[NRGkickDataUpdateCoordinator, float], Awaitable[None]]
+    max_value_path: ValuePath | None = None
+
+
+async def _set_current(coordinator: NRGkickDataUpdateCoordinator, value: float) -> None:
+    """Set the charging current in A."""
+    await coordinator.async_set_current(value)
+
+
+async def _set_energy_limit(
+    coordinator: NRGkickDataUpdateCoordinator, value: float
+) -> None:
+    """Set the energy limit in Wh."""
+    await coordinator.async_set_energy_limit(int(value))
+
+
+async def _set_phase_count(
+    coordinator: NRGkickDataUpdateCoordinator, value: float
+) -> None:
+    """Set the number of phases."""
+    await coordinator.async_set_phase_count(int(value))
+
+
+CURRENT_SET = NRGkickNumberEntityDescription(
+    key="current_set",
+    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+    native_min_value=6.0,
+    # Replaced by the rated current of the device.
+    native_max_value=32.0,
+    native_step=0.1,
+    mode=NumberMode.SLIDER,
+    value_path=("control", "current_set"),
+    set_fn=_set_current,
+    # The maximum follows the connector max current.
+    max_value_path=CURRENT_LIMIT_PATH,
+)
+
+NUMBERS: tuple[NRGkickNumberEntityDescription, ...] = (
+    CURRENT_SET,
+    NRGkickNumberEntityDescription(
+        key="energy_limit",
+        native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+        native_min_value=0,
+        native_max_value=100000,
+        native_step=100,
+        mode=NumberMode.BOX,
+        value_path=("control", "energy_limit"),
+        set_fn=_set_energy_limit,
+    ),
+    NRGkickNumberEntityDescription(
+        key="phase_count",
+        native_min_value=1,
+        native_max_value=3,
+        native_step=1,
+        mode=NumberMode.SLIDER,
+        value_path=("control", "phase_count"),
+        set_fn=_set_phase_count,
+    ),
+)
+
+
 async def async_setup_entry(
     _hass: HomeAssistant,
     entry: NRGkickConfigEntry,
@@ -31,92 +108,45 @@ async def async_setup_entry(
         coordinator.data.get("info", {}).get("general", {}).get("rated_current", 32)
     )
 
-    entities: list[NRGkickNumber] = [
+    async_add_entities(
         NRGkickNumber(
             coordinator,
-            key="current_set",
-            unit=UnitOfElectricCurrent.AMPERE,
-            min_value=6.0,
-            max_value=float(rated_current),
-            step=0.1,
-            value_path=["control", "current_set"],
-            mode=NumberMode.SLIDER,
-        ),
-        NRGkickNumber(
-            coordinator,
-            key="energy_limit",
-            unit="Wh",
-            min_value=0,
-            max_value=100000,
-            step=100,
-            value_path=["control", "energy_limit"],
-            mode=NumberMode.BOX,
-        ),
-        NRGkickNumber(
-            coordinator,
-            key="phase_count",
-            unit=None,
-            min_value=1,
-            max_value=3,
-            step=1,
-            value_path=["control", "phase_count"],
-            mode=NumberMode.SLIDER,
-        ),
-    ]
-
-    async_add_entities(entities)
+            description,
+            max_value=float(rated_current) if description is CURRENT_SET else None,
+        )
+        for description in NUMBERS
+    )
 
 
 class NRGkickNumber(NRGkickEntity, NumberEntity):
     """Representation of a NRGkick number entity."""
 
+    entity_description: NRGkickNumberEntityDescription
+
     def __init__(
         self,
         coordinator: NRGkickDataUpdateCoordinator,
+        description: NRGkickNumberEntityDescription,
         *,
-        key: str,
-        unit: str | None,
-        min_value: float,
-        max_value: float,
-        step: float,
-        value_path: list[str],
-        mode: NumberMode = NumberMode.BOX,
-        entity_category: EntityCategory | None = None,
+        max_value: float | None = None,
     ) -> None:
-        """Initialize the number entity."""
-        super().__init__(coordinator, key)
-        self._attr_native_unit_of_measurement = unit
-        self._attr_native_min_value = min_value
-        self._static_native_max_value = max_value
-        self._attr_native_max_value = max_value
-        self._attr_native_step = step
-        self._attr_mode = mode
-        self._value_path = value_path
-        self._attr_entity_category = entity_category
-
-    def _connector_max_current(self) -> float | None:
-        """Return connector max current in A if available.
-
-        Returns:
-            The connector max current in A, or None if not available.
-
-        """
-        info = self.coordinator.data.get("info")
-        if not isinstance(info, dict):
-            return None
+        """Initialize the number entity.
 
-        connector = info.get("connector")
-        if not isinstance(connector, dict):
-            return None
+        Args:
+            coordinator: The data update coordinator.
+            description: Description of the number.
+            max_value: Maximum of this device, if it differs from the
+                maximum of the description.
 
-        max_current = connector.get("max_current")
-        if max_current is None:
-            return None
-
-        try:
-            return float(max_current)
-        except (TypeError, ValueError):
-            return None
+        """
+        value_paths = [description.value_path]
+        if description.max_value_path is not None:
+            value_paths.append(description.max_value_path)
+        super().__init__(coordinator, description, value_paths)
+        if max_value is None:
+            max_value = description.native_max_value or DEFAULT_MAX_VALUE
+        # Maximum before the device value at max_value_path limits it.
+        self._static_max_value = max_value
 
     @property
     def native_max_value(self) -> float:
@@ -127,31 +157,22 @@ class NRGkickNumber(NRGkickEntity, NumberEntity):
         maximum so the UI slider reflects the currently allowed range.
 
         """
-        if self._key != "current_set":
-            return self._static_native_max_value
-
-        connector_max = self._connector_max_current()
-        if connector_max is None:
-            return self._static_native_max_value
+        path = self.entity_description.max_value_path
+        device_max: float | None = (
+            None if path is None else self.coordinator.decoded.get(path)
+        )
+        if device_max is None:
+            return self._static_max_value
 
-        effective_max = min(self._static_native_max_value, connector_max)
-        return max(self._attr_native_min_value, effective_max)
+        effective_max = min(self._static_max_value, device_max)
+        return max(self.native_min_value, effective_max)
 
     @property
     def native_value(self) -> float | None:
         """Return the value of the number entity."""
-        data: Any = self.coordinator.data
-        for key in self._value_path:
-            if data is None:
-                return None
-            data = data.get(key)
-        return float(data) if data is not None else None
+        value = self.coordinator.decoded.get(self.entity_description.value_path)
+        return float(value) if value is not None else None
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the value of the number entity."""
-        if self._key == "current_set":
-            await self.coordinator.async_set_current(value)
-        elif self._key == "energy_limit":
-            await self.coordinator.async_set_energy_limit(int(value))
-        elif self._key == "phase_count":
-            await self.coordinator.async_set_phase_count(int(value))
+        await self.entity_description.set_fn(self.coordinator, value)
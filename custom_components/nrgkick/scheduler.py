@@ -0,0 +1,181 @@
+"""Polling scheduler shared by all NRGkick config entries."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, FLEET_MAX_CONCURRENT_POLLS
+
+if TYPE_CHECKING:
+    from .coordinator import NRGkickDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SCHEDULER: HassKey[NRGkickPollScheduler] = HassKey(DOMAIN)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> NRGkickPollScheduler:
+    """Return the scheduler of all NRGkick devices, creating it if needed."""
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = NRGkickPollScheduler(hass)
+    return scheduler
+
+
+class NRGkickPollScheduler:
+    """Time the scheduled polls of all NRGkick devices with a single timer.
+
+    Every registered coordinator gets a slot. Slot i of n polls at offset
+    i / n of its scan interval, so devices with the same interval are spread
+    evenly instead of polling at the same moment. At most
+    FLEET_MAX_CONCURRENT_POLLS polls run at the same time.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_concurrent_polls: int = FLEET_MAX_CONCURRENT_POLLS,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self.max_concurrent_polls = max_concurrent_polls
+        self._semaphore = asyncio.Semaphore(max_concurrent_polls)
+        self._slots: list[NRGkickDataUpdateCoordinator] = []
+        # Loop time of the next scheduled poll of each coordinator.
+        self._due: dict[NRGkickDataUpdateCoordinator, float] = {}
+        self._polling: set[NRGkickDataUpdateCoordinator] = set()
+        self._timer: asyncio.TimerHandle | None = None
+        # Duration in seconds and number of polls of the last poll cycle, i.e.
+        # all polls that were due at the same time.
+        self.last_cycle_duration: float | None = None
+        self.last_cycle_polls = 0
+
+    @property
+    def device_count(self) -> int:
+        """Return the number of registered coordinators."""
+        return len(self._slots)
+
+    @callback
+    def async_register(
+        self, coordinator: NRGkickDataUpdateCoordinator
+    ) -> CALLBACK_TYPE:
+        """Give a coordinator a slot and return a callback to release it."""
+        self._slots.append(coordinator)
+
+        @callback
+        def _unregister() -> None:
+            self._slots.remove(coordinator)
+            self._async_unschedule(coordinator)
+
+        return _unregister
+
+    @callback
+    def async_schedule(
+        self, coordinator: NRGkickDataUpdateCoordinator
+    ) -> CALLBACK_TYPE:
+        """Schedule the next poll of a coordinator.
+
+        The poll is placed on the coordinator's slot at least half a scan
+        interval from now, so rescheduling after a manual refresh does not
+        poll again right away.
+
+        Returns:
+            Callback that cancels the scheduled poll.
+
+        """
+        if coordinator.update_interval is None:
+            raise ValueError("Coordinator has no update interval")
+        interval = coordinator.update_interval.total_seconds()
+        offset = 0.0
+        if coordinator in self._slots:
+            offset = interval * self._slots.index(coordinator) / len(self._slots)
+        earliest = self._hass.loop.time() + interval / 2
+        self._due[coordinator] = (
+            math.ceil((earliest - offset) / interval) * interval + offset
+        )
+        self._async_arm()
+
+        @callback
+        def _unschedule() -> None:
+            self._async_unschedule(coordinator)
+
+        return _unschedule
+
+    @callback
+    def _async_unschedule(self, coordinator: NRGkickDataUpdateCoordinator) -> None:
+        """Cancel the scheduled poll of a coordinator."""
+        if self._due.pop(coordinator, None) is not None:
+            self._async_arm()
+
+    @callback
+    def _async_arm(self) -> None:
+        """Set the timer to the earliest scheduled poll."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._due:
+            when = min(self._due.values())
+            self._timer = self._hass.loop.call_at(
+                when, self._async_start_due_polls, when
+            )
+
+    @callback
+    def _async_start_due_polls(self, scheduled_for: float) -> None:
+        """Start the polls that are due at the time the timer was set for."""
+        self._timer = None
+        now = max(self._hass.loop.time(), scheduled_for)
+        due = [coordinator for coordinator, when in self._due.items() if when <= now]
+        for coordinator in due:
+            del self._due[coordinator]
+        self._async_arm()
+
+        # A poll that is still waiting or running is not started twice.
+        if due := [
+            coordinator for coordinator in due if coordinator not in self._polling
+        ]:
+            self._hass.async_create_background_task(
+                self._async_run_cycle(due),
+                name=f"{DOMAIN} - poll cycle",
+                eager_start=True,
+            )
+
+    async def _async_run_cycle(
+        self, coordinators: list[NRGkickDataUpdateCoordinator]
+    ) -> None:
+        """Poll the coordinators and record how long it took."""
+        started = time.monotonic()
+        await asyncio.gather(
+            *(
+                coordinator.config_entry.async_create_background_task(
+                    self._hass,
+                    self._async_poll(coordinator),
+                    name=f"{DOMAIN} - {coordinator.config_entry.title} - refresh",
+                    eager_start=True,
+                )
+                for coordinator in coordinators
+            ),
+            return_exceptions=True,
+        )
+        self.last_cycle_duration = time.monotonic() - started
+        self.last_cycle_polls = len(coordinators)
+        _LOGGER.debug(
+            "Polled %d device(s) in %.3f seconds",
+            self.last_cycle_polls,
+            self.last_cycle_duration,
+        )
+
+    async def _async_poll(self, coordinator: NRGkickDataUpdateCoordinator) -> None:
+        """Poll a coordinator once a concurrency slot is free."""
+        self._polling.add(coordinator)
+        try:
+            async with self._semaphore:
+                await coordinator.async_scheduled_refresh()
+        finally:
+            self._polling.discard(coordinator)
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from dataclasses import dataclass, replace
+import time
 from typing import Any, cast
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.const import (
@@ -19,29 +21,617 @@ from homeassistant.const import (
     UnitOfElectricPotential,
     UnitOfEnergy,
     UnitOfFrequency,
+    UnitOfInformation,
     UnitOfPower,
     UnitOfReactivePower,
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import StateType
 
 from . import NRGkickConfigEntry, NRGkickDataUpdateCoordinator, NRGkickEntity
-from .const import (
-    CELLULAR_MODE_MAP,
-    CONNECTOR_TYPE_MAP,
-    ERROR_CODE_MAP,
-    GRID_PHASES_MAP,
-    RCD_TRIGGER_MAP,
-    RELAY_STATE_MAP,
-    STATUS_MAP,
-    WARNING_CODE_MAP,
-)
+from .const import CONF_DEADBANDS, CONF_MAX_STATE_AGE, DEFAULT_MAX_STATE_AGE
+from .coordinator import ENDPOINTS, STATS_KEY
+from .decoded import ValuePath
 
 PARALLEL_UPDATES = 0
 
+# Request statistics published as sensors: unit, device class and state class.
+_STATS_METRICS: dict[
+    str, tuple[str | None, SensorDeviceClass | None, SensorStateClass]
+] = {
+    "latency_p50": (
+        UnitOfTime.MILLISECONDS,
+        SensorDeviceClass.DURATION,
+        SensorStateClass.MEASUREMENT,
+    ),
+    "latency_p95": (
+        UnitOfTime.MILLISECONDS,
+        SensorDeviceClass.DURATION,
+        SensorStateClass.MEASUREMENT,
+    ),
+    "latency_max": (
+        UnitOfTime.MILLISECONDS,
+        SensorDeviceClass.DURATION,
+        SensorStateClass.MEASUREMENT,
+    ),
+    "failures": (None, None, SensorStateClass.TOTAL_INCREASING),
+    "payload_size": (
+        UnitOfInformation.BYTES,
+        SensorDeviceClass.DATA_SIZE,
+        SensorStateClass.MEASUREMENT,
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class SensorDeadband:
+    """Smallest change of a measurement that is published immediately.
+
+    A change is significant if it reaches both the absolute deadband and the
+    relative deadband, a fraction of the last published value.
+    """
+
+    absolute: float = 0.0
+    relative: float = 0.0
+
+    def is_significant(self, old: float, new: float) -> bool:
+        """Return if the change from old to new is significant."""
+        return abs(new - old) >= max(self.absolute, self.relative * abs(old))
+
+
+# Deadbands of measurement sensors by device class. They are larger than the
+# jitter between two polls and well below changes that matter for automations.
+# The absolute deadbands can be changed in the options.
+DEFAULT_DEADBANDS: dict[SensorDeviceClass, SensorDeadband] = {
+    SensorDeviceClass.APPARENT_POWER: SensorDeadband(absolute=10, relative=0.01),
+    SensorDeviceClass.CURRENT: SensorDeadband(absolute=0.05),
+    SensorDeviceClass.FREQUENCY: SensorDeadband(absolute=0.05),
+    SensorDeviceClass.POWER: SensorDeadband(absolute=10, relative=0.01),
+    SensorDeviceClass.POWER_FACTOR: SensorDeadband(absolute=0.05),
+    SensorDeviceClass.REACTIVE_POWER: SensorDeadband(absolute=10, relative=0.01),
+    SensorDeviceClass.TEMPERATURE: SensorDeadband(absolute=0.5),
+    SensorDeviceClass.VOLTAGE: SensorDeadband(absolute=0.5),
+}
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class NRGkickSensorEntityDescription(SensorEntityDescription):
+    """Describes an NRGkick sensor and where its value is read from.
+
+    Measurement sensors without a deadband use the deadband of their device
+    class.
+    """
+
+    value_path: ValuePath
+    deadband: SensorDeadband | None = None
+
+
+SENSORS: tuple[NRGkickSensorEntityDescription, ...] = (
+    # INFO - General
+    NRGkickSensorEntityDescription(
+        key="rated_current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("info", "general", "rated_current"),
+        suggested_display_precision=2,
+    ),
+    # INFO - Connector
+    NRGkickSensorEntityDescription(
+        key="connector_phase_count",
+        value_path=("info", "connector", "phase_count"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="connector_max_current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("info", "connector", "max_current"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="connector_type",
+        value_path=("info", "connector", "type"),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    NRGkickSensorEntityDescription(
+        key="connector_serial",
+        value_path=("info", "connector", "serial"),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    # INFO - Grid
+    NRGkickSensorEntityDescription(
+        key="grid_voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("info", "grid", "voltage"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="grid_frequency",
+        native_unit_of_measurement=UnitOfFrequency.HERTZ,
+        device_class=SensorDeviceClass.FREQUENCY,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("info", "grid", "frequency"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="grid_phases",
+        value_path=("info", "grid", "phases"),
+    ),
+    # INFO - Network
+    NRGkickSensorEntityDescription(
+        key="network_ip_address",
+        value_path=("info", "network", "ip_address"),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    NRGkickSensorEntityDescription(
+        key="network_mac_address",
+        value_path=("info", "network", "mac_address"),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    NRGkickSensorEntityDescription(
+        key="network_ssid",
+        value_path=("info", "network", "ssid"),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    NRGkickSensorEntityDescription(
+        key="network_rssi",
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("info", "network", "rssi"),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    # INFO - Cellular (optional, only if cellular module is available)
+    NRGkickSensorEntityDescription(
+        key="cellular_mode",
+        value_path=("info", "cellular", "mode"),
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    NRGkickSensorEntityDescription(
+        key="cellular_rssi",
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("info", "cellular", "rssi"),
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    NRGkickSensorEntityDescription(
+        key="cellular_operator",
+        value_path=("info", "cellular", "operator"),
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    # INFO - GPS (optional, only if GPS module is available)
+    NRGkickSensorEntityDescription(
+        key="gps_latitude",
+        native_unit_of_measurement="°",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("info", "gps", "latitude"),
+        suggested_display_precision=6,
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    NRGkickSensorEntityDescription(
+        key="gps_longitude",
+        native_unit_of_measurement="°",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("info", "gps", "longitude"),
+        suggested_display_precision=6,
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    NRGkickSensorEntityDescription(
+        key="gps_altitude",
+        native_unit_of_measurement="m",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("info", "gps", "altitude"),
+        suggested_display_precision=2,
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    NRGkickSensorEntityDescription(
+        key="gps_accuracy",
+        native_unit_of_measurement="m",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("info", "gps", "accuracy"),
+        suggested_display_precision=2,
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    # INFO - Versions
+    NRGkickSensorEntityDescription(
+        key="versions_sw_sm",
+        value_path=("info", "versions", "sw_sm"),
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    NRGkickSensorEntityDescription(
+        key="versions_hw_sm",
+        value_path=("info", "versions", "hw_sm"),
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    # Control
+    NRGkickSensorEntityDescription(
+        key="current_set",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("control", "current_set"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="charge_pause",
+        value_path=("control", "charge_pause"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="energy_limit",
+        native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL,
+        value_path=("control", "energy_limit"),
+        suggested_display_precision=3,
+        suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+    ),
+    NRGkickSensorEntityDescription(
+        key="phase_count",
+        value_path=("control", "phase_count"),
+    ),
+    # VALUES - Energy
+    NRGkickSensorEntityDescription(
+        key="total_charged_energy",
+        native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_path=("values", "energy", "total_charged_energy"),
+        suggested_display_precision=3,
+        suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+    ),
+    NRGkickSensorEntityDescription(
+        key="charged_energy",
+        native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_path=("values", "energy", "charged_energy"),
+        suggested_display_precision=3,
+        suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+    ),
+    # VALUES - Powerflow (Total)
+    NRGkickSensorEntityDescription(
+        key="charging_voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "charging_voltage"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="charging_current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "charging_current"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="powerflow_grid_frequency",
+        native_unit_of_measurement=UnitOfFrequency.HERTZ,
+        device_class=SensorDeviceClass.FREQUENCY,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "grid_frequency"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="peak_power",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "peak_power"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="total_active_power",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "total_active_power"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="total_reactive_power",
+        native_unit_of_measurement=UnitOfReactivePower.VOLT_AMPERE_REACTIVE,
+        device_class=SensorDeviceClass.REACTIVE_POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "total_reactive_power"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="total_apparent_power",
+        native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
+        device_class=SensorDeviceClass.APPARENT_POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "total_apparent_power"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="total_power_factor",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "total_power_factor"),
+    ),
+    # VALUES - Powerflow L1
+    NRGkickSensorEntityDescription(
+        key="l1_voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l1", "voltage"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="l1_current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l1", "current"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="l1_active_power",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l1", "active_power"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="l1_reactive_power",
+        native_unit_of_measurement=UnitOfReactivePower.VOLT_AMPERE_REACTIVE,
+        device_class=SensorDeviceClass.REACTIVE_POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l1", "reactive_power"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="l1_apparent_power",
+        native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
+        device_class=SensorDeviceClass.APPARENT_POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l1", "apparent_power"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="l1_power_factor",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l1", "power_factor"),
+    ),
+    # VALUES - Powerflow L2
+    NRGkickSensorEntityDescription(
+        key="l2_voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l2", "voltage"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="l2_current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l2", "current"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="l2_active_power",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l2", "active_power"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="l2_reactive_power",
+        native_unit_of_measurement=UnitOfReactivePower.VOLT_AMPERE_REACTIVE,
+        device_class=SensorDeviceClass.REACTIVE_POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l2", "reactive_power"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="l2_apparent_power",
+        native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
+        device_class=SensorDeviceClass.APPARENT_POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l2", "apparent_power"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="l2_power_factor",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l2", "power_factor"),
+    ),
+    # VALUES - Powerflow L3
+    NRGkickSensorEntityDescription(
+        key="l3_voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l3", "voltage"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="l3_current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l3", "current"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="l3_active_power",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l3", "active_power"),
+        suggested_display_precision=2,
+    ),
+    NRGkickSensorEntityDescription(
+        key="l3_reactive_power",
+        native_unit_of_measurement=UnitOfReactivePower.VOLT_AMPERE_REACTIVE,
+        device_class=SensorDeviceClass.REACTIVE_POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l3", "reactive_power"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="l3_apparent_power",
+        native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
+        device_class=SensorDeviceClass.APPARENT_POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l3", "apparent_power"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="l3_power_factor",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.POWER_FACTOR,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "l3", "power_factor"),
+    ),
+    # VALUES - Powerflow Neutral
+    NRGkickSensorEntityDescription(
+        key="n_current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "powerflow", "n", "current"),
+        suggested_display_precision=2,
+    ),
+    # VALUES - General
+    NRGkickSensorEntityDescription(
+        key="charging_rate",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "general", "charging_rate"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="vehicle_connect_time",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "general", "vehicle_connect_time"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="vehicle_charging_time",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "general", "vehicle_charging_time"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="status",
+        value_path=("values", "general", "status"),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    NRGkickSensorEntityDescription(
+        key="charge_permitted",
+        value_path=("values", "general", "charge_permitted"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="relay_state",
+        value_path=("values", "general", "relay_state"),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    NRGkickSensorEntityDescription(
+        key="charge_count",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_path=("values", "general", "charge_count"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="rcd_trigger",
+        value_path=("values", "general", "rcd_trigger"),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    NRGkickSensorEntityDescription(
+        key="warning_code",
+        value_path=("values", "general", "warning_code"),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    NRGkickSensorEntityDescription(
+        key="error_code",
+        value_path=("values", "general", "error_code"),
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    # VALUES - Temperatures
+    NRGkickSensorEntityDescription(
+        key="housing_temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "temperatures", "housing"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="connector_l1_temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "temperatures", "connector_l1"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="connector_l2_temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "temperatures", "connector_l2"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="connector_l3_temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "temperatures", "connector_l3"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="domestic_plug_1_temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "temperatures", "domestic_plug_1"),
+    ),
+    NRGkickSensorEntityDescription(
+        key="domestic_plug_2_temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_path=("values", "temperatures", "domestic_plug_2"),
+    ),
+)
+
+# Request statistics of each endpoint and of whole polls.
+STATS_SENSORS: tuple[NRGkickSensorEntityDescription, ...] = tuple(
+    NRGkickSensorEntityDescription(
+        key=f"{source}_{metric}",
+        translation_key=f"poll_{metric}" if source == "poll" else f"endpoint_{metric}",
+        translation_placeholders=(
+            None if source == "poll" else {"endpoint": f"/{source}"}
+        ),
+        native_unit_of_measurement=unit,
+        device_class=device_class,
+        state_class=state_class,
+        value_path=(STATS_KEY, source, metric),
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    )
+    for source in (*ENDPOINTS, "poll")
+    for metric, (unit, device_class, state_class) in _STATS_METRICS.items()
+)
+
 
 async def async_setup_entry(
     _hass: HomeAssistant,
@@ -52,726 +642,139 @@ async def async_setup_entry(
     coordinator: NRGkickDataUpdateCoordinator = entry.runtime_data
 
     entities: list[NRGkickSensor] = [
-        # INFO - General
-        NRGkickSensor(
-            coordinator,
-            key="rated_current",
-            unit=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["info", "general", "rated_current"],
-            precision=2,
-        ),
-        # INFO - Connector
-        NRGkickSensor(
-            coordinator,
-            key="connector_phase_count",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["info", "connector", "phase_count"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="connector_max_current",
-            unit=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["info", "connector", "max_current"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="connector_type",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["info", "connector", "type"],
-            value_fn=lambda x: (
-                CONNECTOR_TYPE_MAP.get(x, "unknown")
-                if isinstance(x, int)
-                else str(x).lower()
-            ),
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="connector_serial",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["info", "connector", "serial"],
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        # INFO - Grid
-        NRGkickSensor(
-            coordinator,
-            key="grid_voltage",
-            unit=UnitOfElectricPotential.VOLT,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["info", "grid", "voltage"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="grid_frequency",
-            unit=UnitOfFrequency.HERTZ,
-            device_class=SensorDeviceClass.FREQUENCY,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["info", "grid", "frequency"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="grid_phases",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["info", "grid", "phases"],
-            value_fn=lambda x: (
-                GRID_PHASES_MAP.get(x, "unknown")
-                if isinstance(x, int)
-                else str(x).lower().replace(", ", "_").replace(" ", "_")
-            ),
-        ),
-        # INFO - Network
-        NRGkickSensor(
-            coordinator,
-            key="network_ip_address",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["info", "network", "ip_address"],
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="network_mac_address",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["info", "network", "mac_address"],
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="network_ssid",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["info", "network", "ssid"],
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="network_rssi",
-            unit=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-            device_class=SensorDeviceClass.SIGNAL_STRENGTH,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["info", "network", "rssi"],
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        # INFO - Cellular (optional, only if cellular module is available)
-        NRGkickSensor(
-            coordinator,
-            key="cellular_mode",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["info", "cellular", "mode"],
-            value_fn=lambda x: (
-                CELLULAR_MODE_MAP.get(x, "unknown")
-                if isinstance(x, int)
-                else str(x).lower()
-            ),
-            enabled_default=False,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="cellular_rssi",
-            unit=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-            device_class=SensorDeviceClass.SIGNAL_STRENGTH,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["info", "cellular", "rssi"],
-            enabled_default=False,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="cellular_operator",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["info", "cellular", "operator"],
-            enabled_default=False,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        # INFO - GPS (optional, only if GPS module is available)
-        NRGkickSensor(
-            coordinator,
-            key="gps_latitude",
-            unit="°",
-            device_class=None,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["info", "gps", "latitude"],
-            precision=6,
-            enabled_default=False,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="gps_longitude",
-            unit="°",
-            device_class=None,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["info", "gps", "longitude"],
-            precision=6,
-            enabled_default=False,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="gps_altitude",
-            unit="m",
-            device_class=None,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["info", "gps", "altitude"],
-            precision=2,
-            enabled_default=False,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="gps_accuracy",
-            unit="m",
-            device_class=None,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["info", "gps", "accuracy"],
-            precision=2,
-            enabled_default=False,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        # INFO - Versions
-        NRGkickSensor(
-            coordinator,
-            key="versions_sw_sm",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["info", "versions", "sw_sm"],
-            enabled_default=False,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="versions_hw_sm",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["info", "versions", "hw_sm"],
-            enabled_default=False,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        # Control
-        NRGkickSensor(
-            coordinator,
-            key="current_set",
-            unit=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["control", "current_set"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="charge_pause",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["control", "charge_pause"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="energy_limit",
-            unit=UnitOfEnergy.WATT_HOUR,
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL,
-            value_path=["control", "energy_limit"],
-            precision=3,
-            suggested_unit=UnitOfEnergy.KILO_WATT_HOUR,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="phase_count",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["control", "phase_count"],
-        ),
-        # VALUES - Energy
-        NRGkickSensor(
-            coordinator,
-            key="total_charged_energy",
-            unit=UnitOfEnergy.WATT_HOUR,
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING,
-            value_path=["values", "energy", "total_charged_energy"],
-            precision=3,
-            suggested_unit=UnitOfEnergy.KILO_WATT_HOUR,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="charged_energy",
-            unit=UnitOfEnergy.WATT_HOUR,
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING,
-            value_path=["values", "energy", "charged_energy"],
-            precision=3,
-            suggested_unit=UnitOfEnergy.KILO_WATT_HOUR,
-        ),
-        # VALUES - Powerflow (Total)
-        NRGkickSensor(
-            coordinator,
-            key="charging_voltage",
-            unit=UnitOfElectricPotential.VOLT,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "charging_voltage"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="charging_current",
-            unit=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "charging_current"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="powerflow_grid_frequency",
-            unit=UnitOfFrequency.HERTZ,
-            device_class=SensorDeviceClass.FREQUENCY,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "grid_frequency"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="peak_power",
-            unit=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "peak_power"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="total_active_power",
-            unit=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "total_active_power"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="total_reactive_power",
-            unit=UnitOfReactivePower.VOLT_AMPERE_REACTIVE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "total_reactive_power"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="total_apparent_power",
-            unit=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "total_apparent_power"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="total_power_factor",
-            unit=PERCENTAGE,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "total_power_factor"],
-        ),
-        # VALUES - Powerflow L1
-        NRGkickSensor(
-            coordinator,
-            key="l1_voltage",
-            unit=UnitOfElectricPotential.VOLT,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l1", "voltage"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="l1_current",
-            unit=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l1", "current"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="l1_active_power",
-            unit=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l1", "active_power"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="l1_reactive_power",
-            unit=UnitOfReactivePower.VOLT_AMPERE_REACTIVE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l1", "reactive_power"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="l1_apparent_power",
-            unit=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l1", "apparent_power"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="l1_power_factor",
-            unit=PERCENTAGE,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l1", "power_factor"],
-        ),
-        # VALUES - Powerflow L2
-        NRGkickSensor(
-            coordinator,
-            key="l2_voltage",
-            unit=UnitOfElectricPotential.VOLT,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l2", "voltage"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="l2_current",
-            unit=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l2", "current"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="l2_active_power",
-            unit=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l2", "active_power"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="l2_reactive_power",
-            unit=UnitOfReactivePower.VOLT_AMPERE_REACTIVE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l2", "reactive_power"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="l2_apparent_power",
-            unit=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l2", "apparent_power"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="l2_power_factor",
-            unit=PERCENTAGE,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l2", "power_factor"],
-        ),
-        # VALUES - Powerflow L3
-        NRGkickSensor(
-            coordinator,
-            key="l3_voltage",
-            unit=UnitOfElectricPotential.VOLT,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l3", "voltage"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="l3_current",
-            unit=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l3", "current"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="l3_active_power",
-            unit=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l3", "active_power"],
-            precision=2,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="l3_reactive_power",
-            unit=UnitOfReactivePower.VOLT_AMPERE_REACTIVE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l3", "reactive_power"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="l3_apparent_power",
-            unit=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l3", "apparent_power"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="l3_power_factor",
-            unit=PERCENTAGE,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "l3", "power_factor"],
-        ),
-        # VALUES - Powerflow Neutral
-        NRGkickSensor(
-            coordinator,
-            key="n_current",
-            unit=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "powerflow", "n", "current"],
-            precision=2,
-        ),
-        # VALUES - General
-        NRGkickSensor(
-            coordinator,
-            key="charging_rate",
-            unit=None,
-            device_class=None,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "general", "charging_rate"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="vehicle_connect_time",
-            unit=UnitOfTime.SECONDS,
-            device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "general", "vehicle_connect_time"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="vehicle_charging_time",
-            unit=UnitOfTime.SECONDS,
-            device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "general", "vehicle_charging_time"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="status",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["values", "general", "status"],
-            value_fn=lambda x: (
-                STATUS_MAP.get(x, "unknown") if isinstance(x, int) else str(x).lower()
-            ),
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="charge_permitted",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["values", "general", "charge_permitted"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="relay_state",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["values", "general", "relay_state"],
-            value_fn=lambda x: (
-                RELAY_STATE_MAP.get(x, "unknown")
-                if isinstance(x, int)
-                else str(x).lower().replace(", ", "_").replace(" ", "_")
-            ),
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="charge_count",
-            unit=None,
-            device_class=None,
-            state_class=SensorStateClass.TOTAL_INCREASING,
-            value_path=["values", "general", "charge_count"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="rcd_trigger",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["values", "general", "rcd_trigger"],
-            value_fn=lambda x: (
-                RCD_TRIGGER_MAP.get(x, "unknown")
-                if isinstance(x, int)
-                else str(x).lower()
-            ),
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="warning_code",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["values", "general", "warning_code"],
-            value_fn=lambda x: (
-                WARNING_CODE_MAP.get(x, "unknown")
-                if isinstance(x, int)
-                else str(x).lower()
-            ),
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="error_code",
-            unit=None,
-            device_class=None,
-            state_class=None,
-            value_path=["values", "general", "error_code"],
-            value_fn=lambda x: (
-                ERROR_CODE_MAP.get(x, "unknown")
-                if isinstance(x, int)
-                else str(x).lower()
-            ),
-            entity_category=EntityCategory.DIAGNOSTIC,
-        ),
-        # VALUES - Temperatures
-        NRGkickSensor(
-            coordinator,
-            key="housing_temperature",
-            unit=UnitOfTemperature.CELSIUS,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "temperatures", "housing"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="connector_l1_temperature",
-            unit=UnitOfTemperature.CELSIUS,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "temperatures", "connector_l1"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="connector_l2_temperature",
-            unit=UnitOfTemperature.CELSIUS,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "temperatures", "connector_l2"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="connector_l3_temperature",
-            unit=UnitOfTemperature.CELSIUS,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "temperatures", "connector_l3"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="domestic_plug_1_temperature",
-            unit=UnitOfTemperature.CELSIUS,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "temperatures", "domestic_plug_1"],
-        ),
-        NRGkickSensor(
-            coordinator,
-            key="domestic_plug_2_temperature",
-            unit=UnitOfTemperature.CELSIUS,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_path=["values", "temperatures", "domestic_plug_2"],
-        ),
+        NRGkickSensor(coordinator, description) for description in SENSORS
     ]
-
+    entities.extend(
+        NRGkickStatsSensor(coordinator, description) for description in STATS_SENSORS
+    )
     async_add_entities(entities)
 
 
 class NRGkickSensor(NRGkickEntity, SensorEntity):
     """Representation of a NRGkick sensor."""
 
+    entity_description: NRGkickSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: NRGkickDataUpdateCoordinator,
+        description: NRGkickSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, description, [description.value_path])
+
+        deadband = description.deadband
+        if (
+            deadband is None
+            and description.device_class is not None
+            and description.state_class is SensorStateClass.MEASUREMENT
+        ):
+            deadband = DEFAULT_DEADBANDS.get(description.device_class)
+            absolute = coordinator.entry.options.get(CONF_DEADBANDS, {}).get(
+                description.device_class
+            )
+            if deadband is not None and absolute is not None:
+                deadband = replace(deadband, absolute=absolute)
+        self._max_state_age: float = coordinator.entry.options.get(
+            CONF_MAX_STATE_AGE, DEFAULT_MAX_STATE_AGE
+        )
+        self._deadband = deadband if self._max_state_age else None
+        self._published_value: StateType = None
+        self._published_available = False
+        self._published_stale = False
+        self._published_at = 0.0
+        self._unsub_heartbeat: CALLBACK_TYPE | None = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending heartbeat when the sensor is removed."""
+        await super().async_will_remove_from_hass()
+        self._cancel_heartbeat()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Publish the new state unless the change is insignificant."""
+        if self._is_insignificant_change():
+            if self._unsub_heartbeat is None:
+                delay = self._published_at + self._max_state_age - time.monotonic()
+                self._unsub_heartbeat = async_call_later(
+                    self.hass, max(delay, 0), self._async_heartbeat
+                )
+            return
+        self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and remember what was published."""
+        self._cancel_heartbeat()
+        self._published_value = self.native_value
+        self._published_available = self.available
+        self._published_stale = self.is_stale
+        self._published_at = time.monotonic()
+        super().async_write_ha_state()
+
+    @callback
+    def _async_heartbeat(self, _now: Any) -> None:
+        """Publish a held back change once the maximum state age expired."""
+        self._unsub_heartbeat = None
+        self.async_write_ha_state()
+
+    @callback
+    def _cancel_heartbeat(self) -> None:
+        """Cancel a pending heartbeat."""
+        if self._unsub_heartbeat is not None:
+            self._unsub_heartbeat()
+            self._unsub_heartbeat = None
+
+    def _is_insignificant_change(self) -> bool:
+        """Return if the current value is within the deadband of the published one.
+
+        Changes of availability, of the stale marker and of non-numeric values
+        are always significant.
+        """
+        if self._deadband is None or not self._published_available:
+            return False
+        if not self.available:
+            return False
+        if self._published_stale != self.is_stale:
+            return False
+        old, new = self._published_value, self.native_value
+        if not isinstance(old, int | float) or not isinstance(new, int | float):
+            return False
+        return not self._deadband.is_significant(old, new)
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the decoded value of the sensor."""
+        return cast(
+            StateType,
+            self.coordinator.decoded.get(self.entity_description.value_path),
+        )
+
+
+class NRGkickStatsSensor(NRGkickSensor):
+    """Diagnostic sensor for request statistics of an endpoint or of polls.
+
+    The statistics are collected by the coordinator, so the sensors stay
+    available while the device does not answer.
+    """
+
     def __init__(
         self,
         coordinator: NRGkickDataUpdateCoordinator,
-        *,
-        key: str,
-        unit: str | None,
-        device_class: SensorDeviceClass | None,
-        state_class: SensorStateClass | None,
-        value_path: list[str],
-        entity_category: EntityCategory | None = None,
-        value_fn: Callable[[Any], Any] | None = None,
-        precision: int | None = None,
-        suggested_unit: str | None = None,
-        enabled_default: bool = True,
+        description: NRGkickSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, key)
-        self._attr_native_unit_of_measurement = unit
-        self._attr_device_class = device_class
-        self._attr_state_class = state_class
-        self._value_path = value_path
-        self._attr_entity_category = entity_category
-        self._value_fn = value_fn
-        self._attr_entity_registry_enabled_default = enabled_default
-
-        if precision is not None:
-            self._attr_suggested_display_precision = precision
-        if suggested_unit is not None:
-            self._attr_suggested_unit_of_measurement = suggested_unit
+        super().__init__(coordinator, description)
+        _, self._source, self._metric = description.value_path
+
+    @property
+    def available(self) -> bool:
+        """Return True, the statistics are known without the device."""
+        return True
 
     @property
     def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        data: Any = self.coordinator.data
-        for key in self._value_path:
-            if data is None:
-                return None
-            data = data.get(key)
-
-        if self._value_fn and data is not None:
-            return cast(StateType, self._value_fn(data))
-        return cast(StateType, data)
+        """Return the metric from the request statistics."""
+        return cast(
+            StateType, self.coordinator.request_stats[self._source][self._metric]
+        )
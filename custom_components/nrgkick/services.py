@@ -0,0 +1,109 @@
+"""Service actions for the NRGkick integration."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, selector
+
+from .const import (
+    ATTR_CHARGE_PAUSE,
+    ATTR_CONFIG_ENTRY,
+    ATTR_CURRENT_SET,
+    ATTR_ENERGY_LIMIT,
+    ATTR_PHASE_COUNT,
+    DOMAIN,
+    MAX_ENERGY_LIMIT,
+    MIN_CURRENT_SET,
+    SERVICE_SET_CONTROL,
+)
+from .coordinator import NRGkickConfigEntry, NRGkickDataUpdateCoordinator
+
+SET_CONTROL_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_CONFIG_ENTRY): selector.ConfigEntrySelector(
+                {"integration": DOMAIN}
+            ),
+            # The maximum depends on the device, see _async_set_control.
+            vol.Optional(ATTR_CURRENT_SET): vol.All(
+                vol.Coerce(float), vol.Range(min=MIN_CURRENT_SET)
+            ),
+            vol.Optional(ATTR_CHARGE_PAUSE): cv.boolean,
+            vol.Optional(ATTR_ENERGY_LIMIT): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=MAX_ENERGY_LIMIT)
+            ),
+            vol.Optional(ATTR_PHASE_COUNT): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=3)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(
+        ATTR_CURRENT_SET, ATTR_CHARGE_PAUSE, ATTR_ENERGY_LIMIT, ATTR_PHASE_COUNT
+    ),
+)
+
+
+def _get_coordinator(call: ServiceCall) -> NRGkickDataUpdateCoordinator:
+    """Return the coordinator of the config entry selected in the call."""
+    entry_id: str = call.data[ATTR_CONFIG_ENTRY]
+    entry: NRGkickConfigEntry | None = call.hass.config_entries.async_get_entry(
+        entry_id
+    )
+
+    if entry is None or entry.domain != DOMAIN:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_config_entry",
+            translation_placeholders={"config_entry": entry_id},
+        )
+    if entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="unloaded_config_entry",
+            translation_placeholders={"config_entry": entry.title},
+        )
+
+    return entry.runtime_data
+
+
+async def _async_set_control(call: ServiceCall) -> None:
+    """Set several control parameters of a charger with a single command.
+
+    Raises:
+        ServiceValidationError: If the current exceeds the maximum of the
+            charger.
+
+    """
+    coordinator = _get_coordinator(call)
+    current: float | None = call.data.get(ATTR_CURRENT_SET)
+    if current is not None and current > (max_current := coordinator.max_current):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="current_above_maximum",
+            translation_placeholders={
+                "current": str(current),
+                "max_current": str(max_current),
+            },
+        )
+
+    await coordinator.async_set_control(
+        current=current,
+        charge_pause=call.data.get(ATTR_CHARGE_PAUSE),
+        energy_limit=call.data.get(ATTR_ENERGY_LIMIT),
+        phase_count=call.data.get(ATTR_PHASE_COUNT),
+    )
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the NRGkick service actions."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_CONTROL,
+        _async_set_control,
+        schema=SET_CONTROL_SCHEMA,
+    )
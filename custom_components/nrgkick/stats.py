@@ -0,0 +1,81 @@
+"""Request statistics collected by the NRGkick coordinator."""
+
+from __future__ import annotations
+
+from collections import deque
+import math
+from typing import Any
+
+from .const import STATS_SAMPLE_SIZE
+
+
+class RequestStats:
+    """Latencies, failures and payload size of one kind of request.
+
+    Percentiles are computed over the latencies of the last sample_size
+    requests, failed ones included, so a device that times out shows up in
+    the tail. Counters cover the lifetime of the config entry.
+    """
+
+    def __init__(self, sample_size: int = STATS_SAMPLE_SIZE) -> None:
+        """Initialize empty statistics."""
+        self._latencies: deque[float] = deque(maxlen=sample_size)
+        self.requests = 0
+        self.failures = 0
+        self.payload_size: int | None = None
+        # Statistics returned by as_dict() since the last recorded request.
+        self._as_dict: dict[str, Any] | None = None
+
+    def record(self, latency: float, payload_size: int | None = None) -> None:
+        """Record a successful request.
+
+        Args:
+            latency: Duration of the request in seconds.
+            payload_size: Size of the response in bytes, if known.
+
+        """
+        self.requests += 1
+        self._latencies.append(latency)
+        if payload_size is not None:
+            self.payload_size = payload_size
+        self._as_dict = None
+
+    def record_failure(self, latency: float) -> None:
+        """Record a failed request that took latency seconds."""
+        self.requests += 1
+        self.failures += 1
+        self._latencies.append(latency)
+        self._as_dict = None
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the latency percentile in seconds, None without samples.
+
+        Uses the nearest-rank method, so the result is always a measured
+        latency.
+        """
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics with latencies in milliseconds.
+
+        The result is kept until the next request is recorded, so reading it
+        again doesn't sort the latencies again.
+        """
+        if self._as_dict is None:
+            self._as_dict = {
+                "requests": self.requests,
+                "failures": self.failures,
+                "latency_p50": _milliseconds(self.percentile(0.5)),
+                "latency_p95": _milliseconds(self.percentile(0.95)),
+                "latency_max": _milliseconds(self.percentile(1.0)),
+                "payload_size": self.payload_size,
+            }
+        return self._as_dict
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    """Convert seconds to milliseconds rounded to a tenth."""
+    return None if seconds is None else round(seconds * 1000, 1)
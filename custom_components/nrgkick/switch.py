@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 import logging
 from typing import Any
 
-from homeassistant.components.switch import SwitchEntity
+from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from . import NRGkickConfigEntry, NRGkickDataUpdateCoordinator, NRGkickEntity
+from .decoded import ValuePath
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,6 +19,21 @@ _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = 0
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class NRGkickSwitchEntityDescription(SwitchEntityDescription):
+    """Describes an NRGkick switch and where its state is read from."""
+
+    value_path: ValuePath
+
+
+SWITCHES: tuple[NRGkickSwitchEntityDescription, ...] = (
+    NRGkickSwitchEntityDescription(
+        key="charge_pause",
+        value_path=("control", "charge_pause"),
+    ),
+)
+
+
 async def async_setup_entry(
     _hass: HomeAssistant,
     entry: NRGkickConfigEntry,
@@ -25,40 +42,28 @@ async def async_setup_entry(
     """Set up NRGkick switches based on a config entry."""
     coordinator: NRGkickDataUpdateCoordinator = entry.runtime_data
 
-    entities: list[NRGkickSwitch] = [
-        NRGkickSwitch(
-            coordinator,
-            key="charge_pause",
-            value_path=["control", "charge_pause"],
-        ),
-    ]
-
-    async_add_entities(entities)
+    async_add_entities(
+        NRGkickSwitch(coordinator, description) for description in SWITCHES
+    )
 
 
 class NRGkickSwitch(NRGkickEntity, SwitchEntity):
     """Representation of a NRGkick switch."""
 
+    entity_description: NRGkickSwitchEntityDescription
+
     def __init__(
         self,
         coordinator: NRGkickDataUpdateCoordinator,
-        *,
-        key: str,
-        value_path: list[str],
+        description: NRGkickSwitchEntityDescription,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator, key)
-        self._value_path = value_path
+        super().__init__(coordinator, description, [description.value_path])
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        data: Any = self.coordinator.data
-        for key in self._value_path:
-            if data is None:
-                return None
-            data = data.get(key)
-        return bool(data)
+        return bool(self.coordinator.decoded.get(self.entity_description.value_path))
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
@@ -69,6 +69,10 @@ def mock_nrgkick_api():
         api.set_charge_pause = AsyncMock(return_value={"charge_pause": 0})
         api.set_energy_limit = AsyncMock(return_value={"energy_limit": 0})
         api.set_phase_count = AsyncMock(return_value={"phase_count": 3})
+        api.host = "192.168.1.100"
+        api.request_count = 0
+        api.coalesced_count = 0
+        api.response_sizes = {}
         yield api
 
 
@@ -0,0 +1,537 @@
+"""Simulator of the NRGkick Gen2 local JSON API for load and latency tests.
+
+Serves /info, /control and /values as documented in
+"Documentation/NRGkick Gen2 Local API Documentation.html", including
+section filtering, raw mode and optional Basic Auth. Each charger follows a
+charging curve: constant power up to 80 % state of charge, then tapering
+until the battery is full. Latency, jitter, HTTP errors and dropped
+connections can be injected to test timeouts and error handling.
+
+Every simulated charger listens on its own port, so a single process can
+simulate a fleet of chargers:
+
+    python -m tests.simulator --devices 200 --base-port 18000
+
+Add the chargers to Home Assistant with host "127.0.0.1:<port>".
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+from collections import Counter
+from collections.abc import Awaitable, Callable
+import contextlib
+import random
+import time
+from typing import Any
+
+from aiohttp import hdrs, web
+
+GRID_VOLTAGE = 230.0
+# Power factor while charging and energy use of the vehicle per km.
+CHARGING_POWER_FACTOR = 0.99
+VEHICLE_CONSUMPTION_WH_PER_KM = 180.0
+# State of charge above which the vehicle reduces the charging power.
+TAPER_START_SOC = 0.8
+
+STATUS_STANDBY = 1
+STATUS_CONNECTED = 2
+STATUS_CHARGING = 3
+WARNING_ENERGY_LIMIT_REACHED = 3
+
+# Names of enum values outside of raw mode, as in the API documentation.
+_CONNECTOR_TYPES = {1: "CEE", 2: "DOMESTIC", 3: "TYPE2", 4: "WALL", 5: "AUS"}
+_STATUSES = {
+    STATUS_STANDBY: "STANDBY",
+    STATUS_CONNECTED: "CONNECTED",
+    STATUS_CHARGING: "CHARGING",
+    6: "ERROR",
+    7: "WAKEUP",
+}
+_RCD_TRIGGERS = {0: "NO_FAULT"}
+_WARNING_CODES = {0: "NO_WARNING", WARNING_ENERGY_LIMIT_REACHED: "ENERGY_LIMIT_REACHED"}
+_ERROR_CODES = {0: "NO_ERROR"}
+
+_INFO_SECTIONS = ("general", "connector", "grid", "network", "versions")
+_VALUES_SECTIONS = ("energy", "powerflow", "general", "temperatures")
+
+type Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+def _bit_names(value: int, names: tuple[str, ...], none: str) -> str:
+    """Return the names of the set bits, e.g. "L1, L2, L3" for phases."""
+    set_bits = [name for bit, name in enumerate(names) if value & (1 << bit)]
+    return ", ".join(set_bits) if set_bits else none
+
+
+class SimulatedCharger:
+    """State and charging curve of a simulated NRGkick with a vehicle.
+
+    The state advances with the time between requests, multiplied by
+    time_scale to run through a charging session faster than real time.
+    """
+
+    def __init__(
+        self,
+        serial_number: str = "T2332500000000000S1D2",
+        *,
+        device_name: str = "NRGkick SIM",
+        rated_current: int = 32,
+        battery_capacity: float = 60_000.0,
+        state_of_charge: float = 0.2,
+        vehicle_connected: bool = True,
+        time_scale: float = 1.0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize a charger with a connected vehicle that is charging."""
+        self.serial_number = serial_number
+        self.device_name = device_name
+        self.rated_current = rated_current
+        self.battery_capacity = battery_capacity
+        self.state_of_charge = state_of_charge
+        self.vehicle_connected = vehicle_connected
+        self.time_scale = time_scale
+        self.control: dict[str, Any] = {
+            "current_set": 16.0,
+            "charge_pause": 0,
+            "energy_limit": 0,
+            "phase_count": 3,
+        }
+        self.total_charged_energy = 1_000_000.0
+        self.charged_energy = 0.0
+        self.peak_power = 0.0
+        self.connect_time = 0.0
+        self.charging_time = 0.0
+        self.charge_count = 120
+        self._random = random.Random(seed)
+        self._updated_at = time.monotonic()
+
+    def plug_in(self, state_of_charge: float) -> None:
+        """Connect a vehicle and start a new charging session."""
+        self.advance()
+        self.vehicle_connected = True
+        self.state_of_charge = state_of_charge
+        self.charged_energy = self.peak_power = 0.0
+        self.connect_time = self.charging_time = 0.0
+        self.charge_count += 1
+
+    def unplug(self) -> None:
+        """Disconnect the vehicle."""
+        self.advance()
+        self.vehicle_connected = False
+
+    @property
+    def energy_limit_reached(self) -> bool:
+        """Return if the session reached the energy limit."""
+        limit = self.control["energy_limit"]
+        return bool(limit) and self.charged_energy >= limit
+
+    @property
+    def charge_permitted(self) -> bool:
+        """Return if the vehicle is allowed to charge."""
+        return (
+            self.vehicle_connected
+            and not self.control["charge_pause"]
+            and not self.energy_limit_reached
+        )
+
+    @property
+    def power(self) -> float:
+        """Return the charging power in W along the charging curve."""
+        if not self.charge_permitted or self.state_of_charge >= 1:
+            return 0.0
+        power = self.control["current_set"] * GRID_VOLTAGE * self.control["phase_count"]
+        if self.state_of_charge > TAPER_START_SOC:
+            # The vehicle reduces the power linearly down to 10 %.
+            remaining = (1 - self.state_of_charge) / (1 - TAPER_START_SOC)
+            power *= max(0.1, remaining)
+        return power
+
+    @property
+    def status(self) -> int:
+        """Return the charging status."""
+        if not self.vehicle_connected:
+            return STATUS_STANDBY
+        return STATUS_CHARGING if self.power else STATUS_CONNECTED
+
+    def advance(self) -> None:
+        """Charge with the current power since the last update."""
+        now = time.monotonic()
+        elapsed = (now - self._updated_at) * self.time_scale
+        self._updated_at = now
+        if not self.vehicle_connected:
+            return
+        self.connect_time += elapsed
+        if not (power := self.power):
+            return
+        energy = power * elapsed / 3600
+        if limit := self.control["energy_limit"]:
+            energy = min(energy, max(0.0, limit - self.charged_energy))
+        self.charged_energy += energy
+        self.total_charged_energy += energy
+        self.state_of_charge = min(
+            1.0, self.state_of_charge + energy / self.battery_capacity
+        )
+        self.charging_time += elapsed
+        self.peak_power = max(self.peak_power, power)
+
+    def info(self, sections: set[str], raw: bool) -> dict[str, Any]:
+        """Return the /info response."""
+        connector_type = 3
+        grid_phases = 7
+        info: dict[str, Any] = {
+            "general": {
+                "serial_number": self.serial_number,
+                "model_type": "NRGkick Gen2 SIM",
+                "device_name": self.device_name,
+                "rated_current": self.rated_current,
+            },
+            "connector": {
+                "phase_count": 3,
+                "max_current": float(self.rated_current),
+                "type": (
+                    connector_type
+                    if raw
+                    else _CONNECTOR_TYPES.get(connector_type, "UNKNOWN")
+                ),
+                "serial": "A1234567",
+            },
+            "grid": {
+                "voltage": 230,
+                "frequency": 50,
+                "phases": (
+                    grid_phases
+                    if raw
+                    else _bit_names(grid_phases, ("L1", "L2", "L3"), "UNKNOWN")
+                ),
+            },
+            "network": {
+                "ip_address": "192.168.0.10",
+                "mac_address": "AB:CD:12:34:56:78",
+                "ssid": "Simulated WiFi",
+                "rssi": -62 + self._random.randint(-3, 3),
+            },
+            "versions": {
+                "sw_sm": "4.0.0.33",
+                "hw_sm": "1.0.0.3",
+                "sw_ma": "3.1.4.5",
+                "hw_ma": "1.0.0.0",
+                "sw_to": "1.4.1.0",
+                "hw_to": "1.1.0.0",
+                "sw_st": "1.4.4.0",
+                "hw_st": "1.1.0.0",
+            },
+        }
+        return _select(info, sections)
+
+    def values(self, sections: set[str], raw: bool) -> dict[str, Any]:
+        """Return the /values response for the current point of the curve."""
+        self.advance()
+        power = self.power
+        phases = self.control["phase_count"] if power else 0
+        powerflow: dict[str, Any] = {}
+        voltages = []
+        for index, phase in enumerate(("l1", "l2", "l3")):
+            voltage = round(GRID_VOLTAGE + self._random.uniform(-2.0, 2.0), 2)
+            voltages.append(voltage)
+            active = power / phases if index < phases else 0.0
+            power_factor = CHARGING_POWER_FACTOR if active else 0.0
+            apparent = active / power_factor if active else 0.0
+            powerflow[phase] = {
+                "voltage": voltage,
+                "current": round(active / voltage, 3),
+                "active_power": round(active, 3),
+                "reactive_power": round((apparent**2 - active**2) ** 0.5, 3),
+                "apparent_power": round(apparent, 3),
+                "power_factor": power_factor,
+            }
+        apparent_total = power / CHARGING_POWER_FACTOR if power else 0.0
+        phase_current = max(phase["current"] for phase in powerflow.values())
+        relay_state = 1 | sum(2 << index for index in range(phases)) if phases else 0
+        status = self.status
+        warning_code = WARNING_ENERGY_LIMIT_REACHED if self.energy_limit_reached else 0
+
+        values: dict[str, Any] = {
+            "energy": {
+                "total_charged_energy": round(self.total_charged_energy),
+                "charged_energy": round(self.charged_energy),
+            },
+            "powerflow": {
+                "charging_voltage": round(sum(voltages) / len(voltages), 2),
+                "charging_current": (
+                    self.control["current_set"] if self.charge_permitted else 0
+                ),
+                "grid_frequency": round(50 + self._random.uniform(-0.05, 0.05), 2),
+                "peak_power": round(self.peak_power, 3),
+                "total_active_power": round(power, 3),
+                "total_reactive_power": round(
+                    sum(phase["reactive_power"] for phase in powerflow.values()), 3
+                ),
+                "total_apparent_power": round(apparent_total, 3),
+                "total_power_factor": CHARGING_POWER_FACTOR if power else 0.0,
+                **powerflow,
+                "n": {"current": 0.0},
+            },
+            "general": {
+                "charging_rate": round(power / VEHICLE_CONSUMPTION_WH_PER_KM, 2),
+                "vehicle_connect_time": round(self.connect_time),
+                "vehicle_charging_time": round(self.charging_time),
+                "status": status if raw else _STATUSES.get(status, "UNKNOWN"),
+                "charge_permitted": int(self.charge_permitted),
+                "relay_state": (
+                    relay_state
+                    if raw
+                    else _bit_names(relay_state, ("N", "L1", "L2", "L3"), "NO_RELAY")
+                ),
+                "charge_count": self.charge_count,
+                "rcd_trigger": 0 if raw else _RCD_TRIGGERS[0],
+                "warning_code": (
+                    warning_code if raw else _WARNING_CODES.get(warning_code, "UNKNOWN")
+                ),
+                "error_code": 0 if raw else _ERROR_CODES[0],
+            },
+            "temperatures": {
+                "housing": round(25 + phase_current * 0.3, 2),
+                "connector_l1": round(24 + powerflow["l1"]["current"] * 0.5, 2),
+                "connector_l2": round(24 + powerflow["l2"]["current"] * 0.5, 2),
+                "connector_l3": round(24 + powerflow["l3"]["current"] * 0.5, 2),
+                "domestic_plug_1": 0,
+                "domestic_plug_2": 0,
+            },
+        }
+        return _select(values, sections)
+
+    def set_control(self, params: dict[str, str]) -> dict[str, Any]:
+        """Apply control parameters and return the new values.
+
+        Raises:
+            ValueError: With the device's message if a value is invalid.
+
+        """
+        changes: dict[str, Any] = {}
+        if "current_set" in params:
+            current = round(float(params["current_set"]), 1)
+            if not 6.0 <= current <= self.rated_current:
+                raise ValueError(
+                    f"current_set must be between 6.0 and {self.rated_current}"
+                )
+            changes["current_set"] = current
+        if "charge_pause" in params:
+            if params["charge_pause"] not in ("0", "1"):
+                raise ValueError("charge_pause must be 0 or 1")
+            changes["charge_pause"] = int(params["charge_pause"])
+        if "energy_limit" in params:
+            energy_limit = int(params["energy_limit"])
+            if energy_limit < 0:
+                raise ValueError("energy_limit must not be negative")
+            changes["energy_limit"] = energy_limit
+        if "phase_count" in params:
+            phase_count = int(params["phase_count"])
+            if phase_count not in (1, 2, 3):
+                raise ValueError("phase_count must be between 1 and 3")
+            changes["phase_count"] = phase_count
+        self.advance()
+        self.control.update(changes)
+        return changes
+
+
+def _select(data: dict[str, Any], sections: set[str]) -> dict[str, Any]:
+    """Return the requested sections, all of them if none were requested."""
+    if not sections:
+        return data
+    return {section: value for section, value in data.items() if section in sections}
+
+
+class NRGkickSimulator:
+    """HTTP server of a single simulated charger.
+
+    Faults are injected per request: the response is delayed by latency
+    plus a uniformly distributed jitter, error_rate of the requests are
+    answered with HTTP 500 and drop_rate of them are closed without a
+    response.
+    """
+
+    def __init__(
+        self,
+        charger: SimulatedCharger | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        username: str | None = None,
+        password: str | None = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        drop_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the server of a charger."""
+        self.charger = charger or SimulatedCharger(seed=seed)
+        self.host = host
+        self.port = port
+        # Expected Authorization header, None if Basic Auth is disabled.
+        self.authorization = (
+            "Basic " + base64.b64encode(f"{username}:{password}".encode()).decode()
+            if username and password
+            else None
+        )
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        # Requests received per endpoint, including rejected ones.
+        self.requests: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def address(self) -> str:
+        """Return the host to configure in the integration."""
+        return f"{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        """Start listening, on a free port if none was given."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/info", self._handle_info)
+        app.router.add_get("/control", self._handle_control)
+        app.router.add_get("/values", self._handle_values)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if not self.port:
+            self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        """Stop the server and close all connections."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(
+        self, request: web.Request, handler: Handler
+    ) -> web.StreamResponse:
+        """Count the request, check the credentials and inject faults."""
+        self.requests[request.path] += 1
+        delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self._random.random() < self.drop_rate:
+            if request.transport is not None:
+                request.transport.close()
+            raise web.HTTPServiceUnavailable
+        if self._random.random() < self.error_rate:
+            raise web.HTTPInternalServerError
+        if (
+            self.authorization is not None
+            and request.headers.get(hdrs.AUTHORIZATION) != self.authorization
+        ):
+            raise web.HTTPUnauthorized(
+                headers={hdrs.WWW_AUTHENTICATE: 'Basic realm="NRGkick"'}
+            )
+        return await handler(request)
+
+    @staticmethod
+    def _request_options(request: web.Request) -> tuple[set[str], bool]:
+        """Return the requested sections and if raw mode is requested."""
+        sections = {key for key, value in request.query.items() if value == "1"}
+        raw = "raw" in sections
+        sections.discard("raw")
+        return sections, raw
+
+    async def _handle_info(self, request: web.Request) -> web.Response:
+        """Handle GET /info."""
+        sections, raw = self._request_options(request)
+        return web.json_response(self.charger.info(sections & set(_INFO_SECTIONS), raw))
+
+    async def _handle_values(self, request: web.Request) -> web.Response:
+        """Handle GET /values."""
+        sections, raw = self._request_options(request)
+        return web.json_response(
+            self.charger.values(sections & set(_VALUES_SECTIONS), raw)
+        )
+
+    async def _handle_control(self, request: web.Request) -> web.Response:
+        """Handle GET /control, which also sets the given parameters."""
+        if not request.query:
+            return web.json_response(self.charger.control)
+        try:
+            changes = self.charger.set_control(dict(request.query))
+        except ValueError as err:
+            return web.json_response({"Response": str(err)}, status=400)
+        return web.json_response(changes)
+
+
+async def start_fleet(
+    count: int, *, base_port: int = 0, **options: Any
+) -> list[NRGkickSimulator]:
+    """Start count simulated chargers with distinct serial numbers.
+
+    Args:
+        count: Number of chargers.
+        base_port: Port of the first charger, the others use the following
+            ports. With 0 every charger listens on a free port.
+        **options: Options of NRGkickSimulator, e.g. latency.
+
+    Returns:
+        The running simulators.
+
+    """
+    simulators = []
+    for index in range(count):
+        charger = SimulatedCharger(
+            f"SIM{index:018d}", device_name=f"NRGkick SIM {index}", seed=index
+        )
+        simulator = NRGkickSimulator(
+            charger, port=base_port + index if base_port else 0, seed=index, **options
+        )
+        await simulator.start()
+        simulators.append(simulator)
+    return simulators
+
+
+async def _run(args: argparse.Namespace) -> None:
+    """Run the simulated chargers until cancelled."""
+    simulators = await start_fleet(
+        args.devices,
+        base_port=args.base_port,
+        username=args.username,
+        password=args.password,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        drop_rate=args.drop_rate,
+    )
+    for simulator in simulators:
+        simulator.charger.time_scale = args.time_scale
+        print(f"{simulator.charger.serial_number} {simulator.address}")  # noqa: T201
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for simulator in simulators:
+            await simulator.stop()
+
+
+def main() -> None:
+    """Run simulated chargers from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=1)
+    parser.add_argument("--base-port", type=int, default=18000)
+    parser.add_argument("--username")
+    parser.add_argument("--password")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--time-scale", type=float, default=1.0, help="simulated seconds per second"
+    )
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Tests for the NRGkick control arbiter."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.nrgkick.arbiter import ControlArbiter, Priority
+
+
+async def test_commands_overtake_waiting_polls() -> None:
+    """Test waiting commands are granted before polls, each in arrival order."""
+    arbiter = ControlArbiter()
+    order: list[str] = []
+
+    async def _operation(name: str, priority: Priority) -> None:
+        async with arbiter.async_acquire(priority):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    async with arbiter.async_acquire(Priority.POLL):
+        tasks = [
+            asyncio.create_task(_operation(name, priority))
+            for name, priority in (
+                ("poll 1", Priority.POLL),
+                ("command 1", Priority.COMMAND),
+                ("poll 2", Priority.POLL),
+                ("command 2", Priority.COMMAND),
+            )
+        ]
+        await asyncio.sleep(0)
+        assert arbiter.waiting == 4
+        assert order == []
+    await asyncio.gather(*tasks)
+
+    assert order == ["command 1", "command 2", "poll 1", "poll 2"]
+    assert arbiter.waiting == 0
+
+
+async def test_cancelled_waiter_is_skipped() -> None:
+    """Test a cancelled operation neither runs nor blocks the next one."""
+    arbiter = ControlArbiter()
+    order: list[str] = []
+
+    async def _operation(name: str) -> None:
+        async with arbiter.async_acquire(Priority.COMMAND):
+            order.append(name)
+
+    async with arbiter.async_acquire(Priority.POLL):
+        cancelled = asyncio.create_task(_operation("cancelled"))
+        waiting = asyncio.create_task(_operation("waiting"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        assert arbiter.waiting == 1
+    await waiting
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    assert order == ["waiting"]
+    async with asyncio.timeout(1), arbiter.async_acquire(Priority.POLL):
+        pass
@@ -41,7 +41,6 @@ async def test_binary_sensors(
     # Setup entry
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
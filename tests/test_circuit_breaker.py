@@ -0,0 +1,65 @@
+"""Tests for the NRGkick circuit breaker."""
+
+from __future__ import annotations
+
+from custom_components.nrgkick.circuit_breaker import CircuitBreaker, CircuitState
+
+
+class _Clock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def test_opens_after_consecutive_failures() -> None:
+    """Test the circuit opens after the threshold of consecutive failures."""
+    breaker = CircuitBreaker(failure_threshold=3, initial_backoff=30, clock=_Clock())
+
+    assert not breaker.record_failure()
+    assert not breaker.record_failure()
+    breaker.record_success()
+    assert not breaker.record_failure()
+    assert not breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.retry_in is None
+
+    assert breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.retry_in == 30
+    assert not breaker.allow_request()
+
+
+def test_probe_backoff() -> None:
+    """Test failed probes double the backoff up to the maximum."""
+    clock = _Clock()
+    breaker = CircuitBreaker(
+        failure_threshold=1, initial_backoff=30, max_backoff=100, clock=clock
+    )
+    breaker.record_failure()
+
+    clock.now = 29
+    assert not breaker.allow_request()
+    assert breaker.retry_in == 1
+    clock.now = 30
+    assert breaker.allow_request()
+    assert breaker.state is CircuitState.HALF_OPEN
+
+    # A failed probe opens the circuit again but is no new outage.
+    assert not breaker.record_failure()
+    assert breaker.backoff == 60
+    clock.now = 90
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.backoff == 100
+
+    assert breaker.allow_request(force=True)
+    assert breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.consecutive_failures == 0
+    assert not breaker.record_success()
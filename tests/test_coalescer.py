@@ -0,0 +1,160 @@
+"""Tests for the NRGkick write coalescer."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from custom_components.nrgkick.coalescer import WriteCoalescer
+
+WINDOW = 0.05
+
+
+class _Device:
+    """Device whose writes block until released."""
+
+    def __init__(self, confirmed: float) -> None:
+        """Start with a confirmed value."""
+        self.confirmed = confirmed
+        self.writes: list[tuple[float, float]] = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.error: Exception | None = None
+
+    async def write(self, value: float) -> None:
+        """Record the write, wait for the release and confirm the value."""
+        self.writes.append((value, time.monotonic()))
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        self.confirmed = value
+
+    def is_current(self, value: float) -> bool:
+        """Return if value is the confirmed value."""
+        return value == self.confirmed
+
+    def coalescer(self, window: float = WINDOW) -> WriteCoalescer[float]:
+        """Return a coalescer writing to this device."""
+        return WriteCoalescer(window, self.write, self.is_current, asyncio.create_task)
+
+
+async def test_burst_sends_first_and_last_value() -> None:
+    """Test a burst sends the first value at once and only the last one later."""
+    device = _Device(16.0)
+    coalescer = device.coalescer()
+    device.release.clear()
+
+    first = asyncio.create_task(coalescer.async_write(10.0))
+    await asyncio.sleep(0)
+    burst = [
+        asyncio.create_task(coalescer.async_write(value))
+        for value in (11.0, 12.0, 13.0)
+    ]
+    await asyncio.sleep(0)
+    device.release.set()
+    await asyncio.gather(first, *burst)
+
+    assert [value for value, _ in device.writes] == [10.0, 13.0]
+    assert device.writes[1][1] - device.writes[0][1] >= WINDOW * 0.9
+    assert device.confirmed == 13.0
+    assert (coalescer.writes, coalescer.coalesced) == (2, 2)
+
+
+async def test_duplicate_and_confirmed_values_are_not_sent() -> None:
+    """Test values in flight or already confirmed are not sent again."""
+    device = _Device(16.0)
+    coalescer = device.coalescer(window=0)
+
+    await coalescer.async_write(16.0)
+    assert device.writes == []
+
+    device.release.clear()
+    first = asyncio.create_task(coalescer.async_write(10.0))
+    await asyncio.sleep(0)
+    duplicate = asyncio.create_task(coalescer.async_write(10.0))
+    await asyncio.sleep(0)
+    device.release.set()
+    await asyncio.gather(first, duplicate)
+
+    assert [value for value, _ in device.writes] == [10.0]
+    assert coalescer.coalesced == 2
+
+
+async def test_value_back_to_confirmed_is_skipped() -> None:
+    """Test a pending value that ends up at the confirmed value is not sent."""
+    device = _Device(16.0)
+    coalescer = device.coalescer()
+
+    await coalescer.async_write(10.0)
+    # Within the window, so both wait and the last one is the confirmed value.
+    await asyncio.gather(coalescer.async_write(12.0), coalescer.async_write(10.0))
+
+    assert [value for value, _ in device.writes] == [10.0]
+
+
+async def test_error_is_raised_to_all_coalesced_callers() -> None:
+    """Test callers whose value was replaced get the error of the write."""
+    device = _Device(16.0)
+    coalescer = device.coalescer()
+    await coalescer.async_write(10.0)
+    device.error = ValueError("rejected")
+
+    results = await asyncio.gather(
+        coalescer.async_write(11.0),
+        coalescer.async_write(12.0),
+        return_exceptions=True,
+    )
+
+    assert [value for value, _ in device.writes] == [10.0, 12.0]
+    assert all(isinstance(result, ValueError) for result in results)
+
+    # The coalescer is ready for the next write.
+    device.error = None
+    await coalescer.async_write(8.0)
+    assert device.confirmed == 8.0
+
+
+async def test_write_with_replaces_pending_value() -> None:
+    """Test a value sent with other settings drops the pending value."""
+    device = _Device(16.0)
+    coalescer = device.coalescer()
+    device.release.clear()
+
+    first = asyncio.create_task(coalescer.async_write(10.0))
+    await asyncio.sleep(0)
+    pending = asyncio.create_task(coalescer.async_write(11.0))
+    await asyncio.sleep(0)
+    sent: list[float] = []
+
+    async def _send() -> None:
+        # The write in flight finished before.
+        sent.append(device.confirmed)
+        device.confirmed = 12.0
+
+    command = asyncio.create_task(coalescer.async_write_with(_send))
+    await asyncio.sleep(0)
+    device.release.set()
+    await asyncio.gather(first, pending, command)
+    await asyncio.sleep(WINDOW * 2)
+
+    assert [value for value, _ in device.writes] == [10.0]
+    assert sent == [10.0]
+    assert device.confirmed == 12.0
+    assert (coalescer.writes, coalescer.coalesced) == (2, 1)
+
+
+async def test_cancelled_task_cancels_waiting_callers() -> None:
+    """Test callers don't wait forever if the writing task is cancelled."""
+    device = _Device(16.0)
+    coalescer = device.coalescer()
+    device.release.clear()
+
+    caller = asyncio.create_task(coalescer.async_write(10.0))
+    await asyncio.sleep(0)
+    assert coalescer._task is not None
+    coalescer._task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await caller
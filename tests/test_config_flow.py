@@ -11,7 +11,26 @@ from custom_components.nrgkick.api import (
     NRGkickApiClientAuthenticationError,
     NRGkickApiClientCommunicationError,
 )
-from custom_components.nrgkick.const import CONF_SCAN_INTERVAL
+from custom_components.nrgkick.const import (
+    CONF_CONTROL_INTERVAL,
+    CONF_CURRENT_WRITE_WINDOW,
+    CONF_DEADBANDS,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_INFO_INTERVAL,
+    CONF_MAX_STATE_AGE,
+    CONF_MODBUS_PORT,
+    CONF_SCAN_INTERVAL,
+    CONF_TRANSPORT,
+    DEFAULT_CONTROL_INTERVAL,
+    DEFAULT_CURRENT_WRITE_WINDOW,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_INFO_INTERVAL,
+    DEFAULT_MAX_STATE_AGE,
+    DEFAULT_MODBUS_PORT,
+    TRANSPORT_MODBUS,
+    TRANSPORT_REST,
+)
+from custom_components.nrgkick.sensor import DEFAULT_DEADBANDS
 from homeassistant import config_entries, data_entry_flow
 from homeassistant.components.zeroconf import ZeroconfServiceInfo
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
@@ -321,7 +340,20 @@ async def test_options_flow_success(hass: HomeAssistant, mock_nrgkick_api) -> No
         await hass.async_block_till_done()
 
         assert result2["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
-        assert result2["data"] == {CONF_SCAN_INTERVAL: 60}
+        assert result2["data"] == {
+            CONF_SCAN_INTERVAL: 60,
+            CONF_INFO_INTERVAL: DEFAULT_INFO_INTERVAL,
+            CONF_CONTROL_INTERVAL: DEFAULT_CONTROL_INTERVAL,
+            CONF_MAX_STATE_AGE: DEFAULT_MAX_STATE_AGE,
+            CONF_IDLE_SCAN_INTERVAL: DEFAULT_IDLE_SCAN_INTERVAL,
+            CONF_CURRENT_WRITE_WINDOW: DEFAULT_CURRENT_WRITE_WINDOW,
+            CONF_TRANSPORT: TRANSPORT_REST,
+            CONF_MODBUS_PORT: DEFAULT_MODBUS_PORT,
+            CONF_DEADBANDS: {
+                device_class.value: deadband.absolute
+                for device_class, deadband in DEFAULT_DEADBANDS.items()
+            },
+        }
 
         # Wait for config entry to be updated
         await hass.async_block_till_done()
@@ -335,6 +367,54 @@ async def test_options_flow_success(hass: HomeAssistant, mock_nrgkick_api) -> No
         mock_reload.assert_called_with(entry.entry_id)
 
 
+@pytest.mark.requires_integration
+async def test_options_flow_transport(hass: HomeAssistant, mock_nrgkick_api) -> None:
+    """Test Modbus TCP is validated and allows shorter scan intervals."""
+    entry = create_mock_config_entry(data={CONF_HOST: "192.168.1.100"})
+    entry.add_to_hass(hass)
+    with patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={CONF_SCAN_INTERVAL: 2}
+    )
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["errors"] == {CONF_SCAN_INTERVAL: "scan_interval_too_short"}
+
+    modbus_input = {
+        CONF_TRANSPORT: TRANSPORT_MODBUS,
+        CONF_MODBUS_PORT: 5020,
+        CONF_SCAN_INTERVAL: 2,
+    }
+    with patch(
+        "custom_components.nrgkick.config_flow.NRGkickModbusAPI", autospec=True
+    ) as modbus_api:
+        modbus_api.return_value.test_connection.side_effect = (
+            NRGkickApiClientCommunicationError
+        )
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"], user_input=modbus_input
+        )
+        assert result["type"] == data_entry_flow.FlowResultType.FORM
+        assert result["errors"] == {"base": "modbus_cannot_connect"}
+        modbus_api.assert_called_once_with(host="192.168.1.100", port=5020)
+        modbus_api.return_value.close.assert_awaited_once()
+
+        modbus_api.return_value.test_connection.side_effect = None
+        with patch("homeassistant.config_entries.ConfigEntries.async_reload"):
+            result = await hass.config_entries.options.async_configure(
+                result["flow_id"], user_input=modbus_input
+            )
+            await hass.async_block_till_done()
+
+    assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_TRANSPORT] == TRANSPORT_MODBUS
+    assert entry.options[CONF_MODBUS_PORT] == 5020
+    assert entry.options[CONF_SCAN_INTERVAL] == 2
+
+
 @pytest.mark.requires_integration
 async def test_reconfigure_flow(hass: HomeAssistant, mock_nrgkick_api) -> None:
     """Test reconfigure flow."""
@@ -0,0 +1,671 @@
+"""Tests for the NRGkick data update coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.nrgkick.api import (
+    NRGkickApiClientAuthenticationError,
+    NRGkickApiClientCommunicationError,
+)
+from custom_components.nrgkick.circuit_breaker import CircuitState
+from custom_components.nrgkick.const import (
+    COMMAND_ACTIVITY_WINDOW,
+    CONF_CONTROL_INTERVAL,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_INFO_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    STATUS_CHARGING,
+    STATUS_CONNECTED,
+    STATUS_STANDBY,
+)
+from custom_components.nrgkick.coordinator import (
+    STATS_KEY,
+    NRGkickDataUpdateCoordinator,
+)
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from . import create_mock_config_entry
+
+
+@pytest.fixture
+def coordinator(hass: HomeAssistant, mock_nrgkick_api) -> NRGkickDataUpdateCoordinator:
+    """Return a coordinator backed by the mocked API."""
+    entry = create_mock_config_entry(data={CONF_HOST: "192.168.1.100"})
+    entry.add_to_hass(hass)
+    return NRGkickDataUpdateCoordinator(hass, mock_nrgkick_api, entry)
+
+
+async def test_update_fetches_endpoints_concurrently(
+    coordinator: NRGkickDataUpdateCoordinator, mock_nrgkick_api
+) -> None:
+    """Test all endpoints are requested before any of them completes."""
+    started: list[str] = []
+    all_started = asyncio.Event()
+    release = asyncio.Event()
+
+    def _slow(name: str, result: dict):
+        async def _fetch(*args, **kwargs):
+            started.append(name)
+            if len(started) == 3:
+                all_started.set()
+            await release.wait()
+            return result
+
+        return _fetch
+
+    mock_nrgkick_api.get_info.side_effect = _slow("info", {"general": {}})
+    mock_nrgkick_api.get_control.side_effect = _slow("control", {"current_set": 6})
+    mock_nrgkick_api.get_values.side_effect = _slow("values", {"general": {}})
+
+    task = asyncio.create_task(coordinator._async_update_data())
+    await asyncio.wait_for(all_started.wait(), 1)
+    assert sorted(started) == ["control", "info", "values"]
+
+    release.set()
+    data = await task
+    assert data == {
+        "info": {"general": {}},
+        "control": {"current_set": 6},
+        "values": {"general": {}},
+    }
+
+
+async def test_update_keeps_last_known_section_on_partial_failure(
+    coordinator: NRGkickDataUpdateCoordinator, mock_nrgkick_api
+) -> None:
+    """Test a failing endpoint keeps its previous data."""
+    coordinator.data = await coordinator._async_update_data()
+    previous_info = coordinator.data["info"]
+
+    mock_nrgkick_api.get_info.side_effect = NRGkickApiClientCommunicationError
+    mock_nrgkick_api.get_values.return_value = {"general": {"status": 3}}
+
+    data = await coordinator._async_update_data()
+
+    assert data["info"] is previous_info
+    assert data["values"] == {"general": {"status": 3}}
+
+
+async def test_update_fails_without_previous_section(
+    coordinator: NRGkickDataUpdateCoordinator, mock_nrgkick_api
+) -> None:
+    """Test a failing endpoint without earlier data fails the update."""
+    mock_nrgkick_api.get_info.side_effect = NRGkickApiClientCommunicationError
+
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+
+async def test_update_fails_when_all_endpoints_fail(
+    coordinator: NRGkickDataUpdateCoordinator, mock_nrgkick_api
+) -> None:
+    """Test the update fails when no endpoint returns data."""
+    coordinator.data = await coordinator._async_update_data()
+
+    error = NRGkickApiClientCommunicationError
+    mock_nrgkick_api.get_info.side_effect = error
+    mock_nrgkick_api.get_control.side_effect = error
+    mock_nrgkick_api.get_values.side_effect = error
+
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    poll_stats = coordinator.request_stats["poll"]
+    assert poll_stats["requests"] == 2
+    assert poll_stats["failures"] == 1
+    assert coordinator.request_stats["control"]["failures"] == 1
+
+
+async def test_update_auth_error_wins_over_partial_data(
+    coordinator: NRGkickDataUpdateCoordinator, mock_nrgkick_api
+) -> None:
+    """Test an authentication error is never masked by stale data."""
+    coordinator.data = await coordinator._async_update_data()
+    mock_nrgkick_api.get_control.side_effect = NRGkickApiClientAuthenticationError
+
+    with pytest.raises(ConfigEntryAuthFailed):
+        await coordinator._async_update_data()
+
+
+async def test_update_request_timeout(
+    coordinator: NRGkickDataUpdateCoordinator, mock_nrgkick_api
+) -> None:
+    """Test a hanging endpoint is bounded by the request timeout."""
+    mock_nrgkick_api.response_sizes["values"] = 512
+    coordinator.data = await coordinator._async_update_data()
+    previous_values = coordinator.data["values"]
+
+    async def _hang(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    mock_nrgkick_api.get_values.side_effect = _hang
+
+    with patch("custom_components.nrgkick.coordinator.REQUEST_TIMEOUT", 0.01):
+        data = await coordinator._async_update_data()
+
+    assert data["values"] is previous_values
+    values_stats = coordinator.request_stats["values"]
+    assert values_stats["requests"] == 2
+    assert values_stats["failures"] == 1
+    assert values_stats["payload_size"] == 512
+
+
+async def test_update_skipped_while_device_unreachable(
+    coordinator: NRGkickDataUpdateCoordinator,
+    mock_nrgkick_api,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test polls of an unreachable device are skipped until a probe succeeds."""
+    coordinator.data = await coordinator._async_update_data()
+    error = NRGkickApiClientCommunicationError
+    mock_nrgkick_api.get_info.side_effect = error
+    mock_nrgkick_api.get_control.side_effect = error
+    mock_nrgkick_api.get_values.side_effect = error
+    coordinator._endpoint_fetched_at.clear()
+
+    for _ in range(coordinator.breaker.failure_threshold):
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update(scheduled=True)
+    assert coordinator.breaker.state is CircuitState.OPEN
+    assert caplog.text.count("is unreachable, pausing polls for 30 seconds") == 1
+
+    # Polls are skipped without a request while the circuit is open.
+    mock_nrgkick_api.reset_mock()
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update(scheduled=True)
+    assert not mock_nrgkick_api.mock_calls
+
+    # Once the backoff has elapsed, only /control is requested as probe.
+    coordinator.breaker._probe_at = 0
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update(scheduled=True)
+    mock_nrgkick_api.get_control.assert_awaited_once()
+    mock_nrgkick_api.get_info.assert_not_called()
+    assert coordinator.breaker.backoff == 60
+
+    # A successful probe resumes polling all due endpoints in the same poll.
+    for fetch in (
+        mock_nrgkick_api.get_info,
+        mock_nrgkick_api.get_control,
+        mock_nrgkick_api.get_values,
+    ):
+        fetch.side_effect = None
+        fetch.reset_mock()
+    coordinator.breaker._probe_at = 0
+    await coordinator._async_update(scheduled=True)
+
+    assert coordinator.breaker.state is CircuitState.CLOSED
+    mock_nrgkick_api.get_control.assert_awaited_once()
+    mock_nrgkick_api.get_info.assert_awaited_once()
+    mock_nrgkick_api.get_values.assert_awaited_once()
+    assert "is reachable again" in caplog.text
+
+
+async def test_manual_refresh_probes_unreachable_device(
+    coordinator: NRGkickDataUpdateCoordinator, mock_nrgkick_api
+) -> None:
+    """Test a refresh requested by the user does not wait for the backoff."""
+    coordinator.data = await coordinator._async_update_data()
+    for _ in range(coordinator.breaker.failure_threshold):
+        coordinator.breaker.record_failure()
+
+    await coordinator._async_update_data()
+
+    assert coordinator.breaker.state is CircuitState.CLOSED
+
+
+async def test_manual_refresh_during_scheduled_poll(
+    coordinator: NRGkickDataUpdateCoordinator, mock_nrgkick_api
+) -> None:
+    """Test a manual refresh is not taken for the scheduled poll in flight."""
+    coordinator.data = await coordinator._async_update_data()
+    values = mock_nrgkick_api.get_values.return_value
+    polling = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _slow_values(*args, **kwargs):
+        mock_nrgkick_api.get_values.side_effect = None
+        polling.set()
+        await release.wait()
+        return values
+
+    mock_nrgkick_api.get_values.side_effect = _slow_values
+    scheduled = asyncio.create_task(coordinator.async_scheduled_refresh())
+    await asyncio.wait_for(polling.wait(), 1)
+    # The scheduled poll only fetches /values, the others are not due.
+    mock_nrgkick_api.get_info.reset_mock()
+    mock_nrgkick_api.get_control.reset_mock()
+
+    await coordinator._async_update_data()
+
+    mock_nrgkick_api.get_info.assert_awaited_once()
+    mock_nrgkick_api.get_control.assert_awaited_once()
+    release.set()
+    await scheduled
+    mock_nrgkick_api.get_info.assert_awaited_once()
+
+
+async def test_update_fetches_slow_endpoints_on_their_own_schedule(
+    hass: HomeAssistant, mock_nrgkick_api
+) -> None:
+    """Test info and control are only fetched when their interval is due."""
+    entry = create_mock_config_entry(
+        data={CONF_HOST: "192.168.1.100"},
+        options={
+            CONF_SCAN_INTERVAL: 30,
+            CONF_INFO_INTERVAL: 600,
+            CONF_CONTROL_INTERVAL: 60,
+        },
+    )
+    entry.add_to_hass(hass)
+    coordinator = NRGkickDataUpdateCoordinator(hass, mock_nrgkick_api, entry)
+
+    async def _poll_at(now: float) -> None:
+        with patch(
+            "custom_components.nrgkick.coordinator.time.monotonic",
+            return_value=now,
+        ):
+            await coordinator._handle_refresh_interval()
+
+    await _poll_at(1000.0)
+    info = coordinator.data["info"]
+    assert mock_nrgkick_api.get_info.call_count == 1
+    assert mock_nrgkick_api.get_control.call_count == 1
+    assert mock_nrgkick_api.get_values.call_count == 1
+
+    # Scan ticks may fire slightly early; the schedule tolerates that.
+    for tick in range(1, 20):
+        await _poll_at(1000.0 + tick * 30 - 0.5)
+
+    assert mock_nrgkick_api.get_info.call_count == 1
+    assert mock_nrgkick_api.get_control.call_count == 10
+    assert mock_nrgkick_api.get_values.call_count == 20
+    assert coordinator.data["info"] is info
+
+    await _poll_at(1600.0)
+    assert mock_nrgkick_api.get_info.call_count == 2
+
+    # A manual refresh always fetches every endpoint.
+    await coordinator.async_refresh()
+    assert mock_nrgkick_api.get_info.call_count == 3
+
+
+async def test_listeners_only_updated_for_changed_values(
+    coordinator: NRGkickDataUpdateCoordinator,
+) -> None:
+    """Test listeners are only updated when a value they depend on changed."""
+    updates: dict[str, int] = {"voltage": 0, "current_set": 0, "all": 0}
+
+    def _listener(name: str):
+        def _update() -> None:
+            updates[name] += 1
+
+        return _update
+
+    voltage = ("values", "powerflow", "l1", "voltage")
+    current_set = ("control", "current_set")
+    unsubscribe = [
+        coordinator.async_add_listener(_listener("voltage"), frozenset({voltage})),
+        coordinator.async_add_listener(
+            _listener("current_set"), frozenset({current_set})
+        ),
+        coordinator.async_add_listener(_listener("all")),
+    ]
+
+    data = {
+        "control": {"current_set": 16.0},
+        "values": {"powerflow": {"l1": {"voltage": 230.1}}},
+    }
+    coordinator.async_set_updated_data(data)
+    assert updates == {"voltage": 1, "current_set": 1, "all": 1}
+
+    # Data is replaced copy-on-write, the control section is kept.
+    data = {**data, "values": {"powerflow": {"l1": {"voltage": 231.0}}}}
+    coordinator.async_set_updated_data(data)
+    assert updates == {"voltage": 2, "current_set": 1, "all": 2}
+
+    # A replaced section with equal values is not a change.
+    data = {**data, "values": {"powerflow": {"l1": {"voltage": 231.0}}}}
+    coordinator.async_set_updated_data(data)
+    assert updates == {"voltage": 2, "current_set": 1, "all": 3}
+
+    data = {**data, "control": {"current_set": 10.0}}
+    coordinator.async_set_updated_data(data)
+    assert updates == {"voltage": 2, "current_set": 2, "all": 4}
+
+    # Removed values are a change.
+    coordinator.async_set_updated_data({"control": {"current_set": 10.0}})
+    assert updates == {"voltage": 3, "current_set": 2, "all": 5}
+
+    # Availability changes update every listener.
+    coordinator.last_update_success = False
+    coordinator.async_update_listeners()
+    assert updates == {"voltage": 4, "current_set": 3, "all": 6}
+
+    for remove_listener in unsubscribe:
+        remove_listener()
+
+
+async def test_stats_only_compared_while_read(
+    coordinator: NRGkickDataUpdateCoordinator,
+) -> None:
+    """Test the request statistics are only compared while a listener reads them."""
+    updates = 0
+
+    def _update() -> None:
+        nonlocal updates
+        updates += 1
+
+    coordinator.data = await coordinator._async_update_data()
+    coordinator.async_update_listeners()
+    assert coordinator._notified is not None
+    assert coordinator._notified[1] == {}
+
+    requests = (STATS_KEY, "values", "requests")
+    remove_listener = coordinator.async_add_listener(_update, frozenset({requests}))
+    coordinator.async_update_listeners()
+    assert coordinator._notified[1][requests] == 1
+    assert updates == 1
+
+    coordinator.data = await coordinator._async_update_data()
+    coordinator.async_update_listeners()
+    assert coordinator._notified[1][requests] == 2
+    assert updates == 2
+
+    remove_listener()
+    coordinator.async_update_listeners()
+    assert coordinator._notified[1] == {}
+
+
+async def test_scan_interval_adapts_to_charging_state(
+    hass: HomeAssistant, mock_nrgkick_api
+) -> None:
+    """Test the idle scan interval is used while nothing is expected to change."""
+    entry = create_mock_config_entry(
+        data={CONF_HOST: "192.168.1.100"},
+        options={CONF_SCAN_INTERVAL: 10, CONF_IDLE_SCAN_INTERVAL: 120},
+    )
+    entry.add_to_hass(hass)
+    coordinator = NRGkickDataUpdateCoordinator(hass, mock_nrgkick_api, entry)
+    active = timedelta(seconds=10)
+    idle = timedelta(seconds=120)
+
+    async def _update(status: int, charge_permitted: int) -> timedelta | None:
+        mock_nrgkick_api.get_values.return_value = {
+            "general": {"status": status, "charge_permitted": charge_permitted}
+        }
+        await coordinator._async_update_data()
+        return coordinator.update_interval
+
+    assert await _update(STATUS_STANDBY, 0) == idle
+    assert await _update(STATUS_CONNECTED, 0) == idle
+    assert await _update(STATUS_CONNECTED, 1) == active
+    assert await _update(STATUS_CHARGING, 1) == active
+
+    # A command keeps the charger active for a while.
+    mock_nrgkick_api.get_values.return_value = {"general": {"status": STATUS_STANDBY}}
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator.update_interval == idle
+    mock_nrgkick_api.set_charge_pause.return_value = {"charge_pause": 1}
+    await coordinator.async_set_charge_pause(True)
+    assert coordinator.update_interval == active
+    assert await _update(STATUS_STANDBY, 0) == active
+
+    # Move the command back instead of patching the clock of the event loop.
+    coordinator._last_command_at -= COMMAND_ACTIVITY_WINDOW
+    assert await _update(STATUS_STANDBY, 0) == idle
+
+
+async def test_failed_command_reschedules_refresh(
+    hass: HomeAssistant, mock_nrgkick_api
+) -> None:
+    """Test a failed command still moves the next poll to the active interval."""
+    entry = create_mock_config_entry(
+        data={CONF_HOST: "192.168.1.100"},
+        options={CONF_SCAN_INTERVAL: 10, CONF_IDLE_SCAN_INTERVAL: 120},
+    )
+    entry.add_to_hass(hass)
+    coordinator = NRGkickDataUpdateCoordinator(hass, mock_nrgkick_api, entry)
+    mock_nrgkick_api.get_values.return_value = {"general": {"status": STATUS_STANDBY}}
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=120)
+    remove_listener = coordinator.async_add_listener(lambda: None)
+    assert coordinator._scheduler._due[coordinator] - hass.loop.time() >= 60
+
+    mock_nrgkick_api.set_charge_pause.side_effect = NRGkickApiClientCommunicationError
+    with pytest.raises(HomeAssistantError):
+        await coordinator.async_set_charge_pause(True)
+
+    assert coordinator.update_interval == timedelta(seconds=10)
+    assert coordinator._scheduler._due[coordinator] - hass.loop.time() <= 15
+    remove_listener()
+
+
+async def test_command_confirmed_by_polling_control(
+    coordinator: NRGkickDataUpdateCoordinator, mock_nrgkick_api
+) -> None:
+    """Test a response without the new value is confirmed via /control only."""
+    coordinator.data = await coordinator._async_update_data()
+    mock_nrgkick_api.get_info.reset_mock()
+    mock_nrgkick_api.get_control.reset_mock()
+    mock_nrgkick_api.get_values.reset_mock()
+
+    mock_nrgkick_api.set_current.return_value = {}
+    mock_nrgkick_api.get_control.side_effect = [
+        {"current_set": 16.0},
+        {"current_set": 16.0},
+        {"current_set": 10.0, "charge_pause": 0},
+    ]
+
+    with patch(
+        "custom_components.nrgkick.coordinator.COMMAND_CONFIRM_INITIAL_DELAY", 0.001
+    ):
+        await coordinator.async_set_current(10.0)
+
+    assert mock_nrgkick_api.get_control.call_count == 3
+    mock_nrgkick_api.get_info.assert_not_called()
+    mock_nrgkick_api.get_values.assert_not_called()
+    assert coordinator.data["control"] == {"current_set": 10.0, "charge_pause": 0}
+    assert coordinator.last_confirmation_latency is not None
+
+
+async def test_command_replaces_control_section(
+    coordinator: NRGkickDataUpdateCoordinator, mock_nrgkick_api
+) -> None:
+    """Test a command replaces the control section and keeps the others."""
+    previous = coordinator.data = await coordinator._async_update_data()
+    previous_control = dict(previous["control"])
+    mock_nrgkick_api.set_current.return_value = {"current_set": 10.0}
+
+    await coordinator.async_set_current(10.0)
+
+    assert coordinator.data is not previous
+    assert coordinator.data["control"] == {**previous_control, "current_set": 10.0}
+    # Readers of the previous data never see the new value.
+    assert previous["control"] == previous_control
+    assert coordinator.data["info"] is previous["info"]
+    assert coordinator.data["values"] is previous["values"]
+
+
+async def test_current_writes_are_coalesced(
+    coordinator: NRGkickDataUpdateCoordinator, mock_nrgkick_api
+) -> None:
+    """Test a burst of current changes sends the first and the last value."""
+    coordinator.data = await coordinator._async_update_data()
+    coordinator.current_writer.window = 0.01
+
+    async def _set_current(current: float) -> dict:
+        return {"current_set": current}
+
+    mock_nrgkick_api.set_current.side_effect = _set_current
+
+    await asyncio.gather(
+        *(coordinator.async_set_current(current) for current in (10.0, 11.0, 12.0))
+    )
+    # The confirmed value is not sent again.
+    await coordinator.async_set_current(12.0)
+
+    assert [call.args for call in mock_nrgkick_api.set_current.await_args_list] == [
+        (10.0,),
+        (12.0,),
+    ]
+    assert coordinator.data["control"]["current_set"] == 12.0
+
+
+async def test_poll_reuses_control_confirmed_by_command(
+    coordinator: NRGkickDataUpdateCoordinator, mock_nrgkick_api
+) -> None:
+    """Test a poll waits for a command and reuses its confirmed settings."""
+    coordinator.data = await coordinator._async_update_data()
+    mock_nrgkick_api.get_control.reset_mock()
+    sent = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _set_current(current: float) -> dict:
+        sent.set()
+        await release.wait()
+        return {"current_set": current}
+
+    mock_nrgkick_api.set_current.side_effect = _set_current
+
+    command = asyncio.create_task(coordinator.async_set_current(10.0))
+    await sent.wait()
+    poll = asyncio.create_task(coordinator._async_update_data())
+    async with asyncio.timeout(1):
+        while not coordinator.arbiter.waiting:
+            await asyncio.sleep(0)
+    release.set()
+    await command
+    data = await poll
+
+    mock_nrgkick_api.get_control.assert_not_called()
+    assert data["control"]["current_set"] == 10.0
+    assert coordinator.control_reads_saved == 1
+
+
+async def test_scheduled_poll_skips_control_after_command(
+    coordinator: NRGkickDataUpdateCoordinator, mock_nrgkick_api
+) -> None:
+    """Test the confirmed response of a command counts as a /control read."""
+    coordinator.data = await coordinator._async_update_data()
+    coordinator._endpoint_fetched_at.clear()
+    mock_nrgkick_api.set_current.return_value = {"current_set": 10.0}
+    await coordinator.async_set_current(10.0)
+    mock_nrgkick_api.get_control.reset_mock()
+
+    data = await coordinator._async_update(scheduled=True)
+
+    mock_nrgkick_api.get_control.assert_not_called()
+    assert data["control"]["current_set"] == 10.0
+
+
+async def test_poll_keeps_control_confirmed_after_its_read(
+    coordinator: NRGkickDataUpdateCoordinator, mock_nrgkick_api
+) -> None:
+    """Test control settings read before a command don't overwrite it."""
+    coordinator.data = await coordinator._async_update_data()
+    values = mock_nrgkick_api.get_values.return_value
+    release = asyncio.Event()
+
+    async def _get_values(*args, **kwargs) -> dict:
+        await release.wait()
+        return values
+
+    mock_nrgkick_api.get_values.side_effect = _get_values
+    mock_nrgkick_api.set_current.return_value = {"current_set": 10.0}
+
+    poll = asyncio.create_task(coordinator._async_update_data())
+    await asyncio.sleep(0)
+    mock_nrgkick_api.get_control.assert_awaited()
+    await coordinator.async_set_current(10.0)
+    release.set()
+    data = await poll
+
+    assert data["control"]["current_set"] == 10.0
+
+
+async def test_command_not_confirmed(
+    coordinator: NRGkickDataUpdateCoordinator, mock_nrgkick_api
+) -> None:
+    """Test the command fails if /control never reports the new value."""
+    coordinator.data = await coordinator._async_update_data()
+
+    mock_nrgkick_api.set_phase_count.return_value = {}
+    mock_nrgkick_api.get_control.return_value = {"phase_count": 3}
+
+    with (
+        patch(
+            "custom_components.nrgkick.coordinator.COMMAND_CONFIRM_INITIAL_DELAY",
+            0.001,
+        ),
+        patch("custom_components.nrgkick.coordinator.COMMAND_CONFIRM_TIMEOUT", 0.05),
+        pytest.raises(HomeAssistantError) as exc_info,
+    ):
+        await coordinator.async_set_phase_count(1)
+
+    assert exc_info.value.translation_key == "set_failed_unexpected_value"
+    assert mock_nrgkick_api.get_control.call_count > 2
+
+
+async def test_update_fetches_sections_of_enabled_entities(
+    coordinator: NRGkickDataUpdateCoordinator, mock_nrgkick_api
+) -> None:
+    """Test only sections read by the registered entities are requested."""
+    # Without entities everything is fetched.
+    mock_nrgkick_api.get_values.return_value = {
+        "general": {"status": 1},
+        "temperatures": {"housing": 30.0},
+    }
+    coordinator.data = await coordinator._async_update_data()
+    mock_nrgkick_api.get_info.assert_awaited_with(None)
+    mock_nrgkick_api.get_values.assert_awaited_with(None)
+
+    unsubscribe = [
+        coordinator.async_add_listener(
+            lambda: None, frozenset({("values", "powerflow", "l1", "voltage")})
+        ),
+        coordinator.async_add_listener(
+            lambda: None,
+            frozenset({("info", "network", "ip_address"), ("control", "current_set")}),
+        ),
+    ]
+
+    mock_nrgkick_api.get_values.return_value = {
+        "general": {"status": 3},
+        "powerflow": {"l1": {"voltage": 230.0}},
+    }
+    coordinator.data = await coordinator._async_update_data()
+    mock_nrgkick_api.get_info.assert_awaited_with(["general", "network", "versions"])
+    mock_nrgkick_api.get_values.assert_awaited_with(["general", "powerflow"])
+    # Sections that are no longer fetched keep their last known data.
+    assert coordinator.data["values"] == {
+        "general": {"status": 3},
+        "powerflow": {"l1": {"voltage": 230.0}},
+        "temperatures": {"housing": 30.0},
+    }
+
+    # A newly enabled entity makes its endpoint due right away.
+    mock_nrgkick_api.get_info.reset_mock()
+    coordinator.data = await coordinator._async_update(scheduled=True)
+    mock_nrgkick_api.get_info.assert_not_called()
+
+    unsubscribe.append(
+        coordinator.async_add_listener(
+            lambda: None, frozenset({("info", "cellular", "rssi")})
+        )
+    )
+    coordinator.data = await coordinator._async_update(scheduled=True)
+    mock_nrgkick_api.get_info.assert_awaited_once_with(
+        ["cellular", "general", "network", "versions"]
+    )
+
+    for remove_listener in unsubscribe:
+        remove_listener()
@@ -0,0 +1,110 @@
+"""Tests for the decoded view of the NRGkick coordinator data."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.nrgkick.const import STATUS_CHARGING, STATUS_STANDBY
+from custom_components.nrgkick.decoded import (
+    CHARGING_PATH,
+    CURRENT_LIMIT_PATH,
+    decode_data,
+    flatten_data,
+    source_paths,
+)
+
+
+def test_flatten_data() -> None:
+    """Test nested data is flattened into leaf values keyed by path."""
+    assert flatten_data(
+        {
+            "control": {"current_set": 16.0},
+            "values": {"powerflow": {"l1": {"voltage": 230.1}, "n": {}}},
+        }
+    ) == {
+        ("control", "current_set"): 16.0,
+        ("values", "powerflow", "l1", "voltage"): 230.1,
+    }
+    assert flatten_data(None) == {}
+
+
+@pytest.mark.parametrize(
+    ("status", "decoded", "charging"),
+    [
+        (STATUS_CHARGING, "charging", True),
+        (STATUS_STANDBY, "standby", False),
+        ("CHARGING", "charging", True),
+        (99, "unknown", False),
+    ],
+)
+def test_decode_status(status: object, decoded: str, charging: bool) -> None:
+    """Test raw and text status values are decoded once with derived values."""
+    data = decode_data({"values": {"general": {"status": status}}})
+
+    assert data.get(("values", "general", "status")) == decoded
+    assert data.get(CHARGING_PATH) is charging
+
+
+def test_decode_words_and_limits() -> None:
+    """Test text enums become translation keys and limits become floats."""
+    data = decode_data(
+        {
+            "info": {
+                "connector": {"max_current": "16"},
+                "grid": {"phases": "L1, L2"},
+            },
+            "values": {"general": {"relay_state": "N, L1"}},
+        }
+    )
+
+    assert data.get(("info", "grid", "phases")) == "l1_l2"
+    assert data.get(("values", "general", "relay_state")) == "n_l1"
+    assert data.get(("info", "connector", "max_current")) == "16"
+    assert data.get(CURRENT_LIMIT_PATH) == 16.0
+
+
+def test_decode_missing_values() -> None:
+    """Test missing and invalid values stay None, also in derived values."""
+    data = decode_data({"info": {"connector": {"max_current": "n/a"}}})
+
+    assert data.get(CURRENT_LIMIT_PATH) is None
+    assert data.get(CHARGING_PATH) is None
+    assert data.get(("values", "general", "status")) is None
+    assert decode_data(None).values == {}
+
+
+def test_decoded_data_is_read_only() -> None:
+    """Test the decoded values cannot be changed by entities."""
+    data = decode_data({"control": {"current_set": 16.0}})
+
+    with pytest.raises(TypeError):
+        data.values[("control", "current_set")] = 6.0  # type: ignore[index]
+
+
+def test_source_paths() -> None:
+    """Test derived values depend on the value they are computed from."""
+    assert source_paths(CHARGING_PATH) == (
+        CHARGING_PATH,
+        ("values", "general", "status"),
+    )
+    assert source_paths(("control", "current_set")) == (("control", "current_set"),)
+
+
+def test_unchanged_sections_are_reused() -> None:
+    """Test sections kept from the previous data are not decoded or compared."""
+    data = {
+        "control": {"current_set": 16.0},
+        "values": {"general": {"status": STATUS_CHARGING}},
+    }
+    previous = decode_data(data)
+    decoded = decode_data({**data, "control": {"current_set": 10.0}}, previous)
+
+    assert decoded.sections["values"] is previous.sections["values"]
+    assert decoded.sections["control"] is not previous.sections["control"]
+    assert decoded.get(CHARGING_PATH) is True
+    assert decoded.changed_paths(previous) == {("control", "current_set")}
+    assert decode_data({"control": {}}, previous).changed_paths(previous) == {
+        ("control", "current_set"),
+        ("values", "general", "status"),
+        CHARGING_PATH,
+    }
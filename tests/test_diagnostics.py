@@ -27,7 +27,6 @@ async def test_diagnostics(
 
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
@@ -51,7 +50,14 @@ async def test_diagnostics(
     assert "entry" in diag_data
     assert "config" in diag_data
     assert "coordinator" in diag_data
+    assert diag_data["coordinator"]["stale"] is False
+    assert diag_data["circuit_breaker"]["state"] == "closed"
+    assert set(diag_data["request_stats"]) == {"info", "control", "values", "poll"}
     assert "data" in diag_data
+    assert diag_data["scheduler"]["devices"] == 1
+    assert diag_data["api"] == {"requests": 0, "coalesced_requests": 0}
+    assert diag_data["coordinator"]["control_reads_saved"] == 0
+    assert diag_data["current_writes"] == {"window": 1.0, "sent": 0, "coalesced": 0}
 
     assert diag_data["entry"]["title"] == "NRGkick Test"
     assert diag_data["data"]["info"] == mock_info_data
@@ -2,18 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import timedelta
+from typing import Any
 from unittest.mock import patch
 
 import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
 from custom_components.nrgkick.api import (
     NRGkickApiClientAuthenticationError,
     NRGkickApiClientCommunicationError,
 )
+from custom_components.nrgkick.const import (
+    ATTR_STALE,
+    CONF_MODBUS_PORT,
+    CONF_SCAN_INTERVAL,
+    CONF_TRANSPORT,
+    TRANSPORT_MODBUS,
+)
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
-from homeassistant.const import CONF_HOST
+from homeassistant.const import (
+    CONF_HOST,
+    EVENT_HOMEASSISTANT_CLOSE,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
 
 from . import async_setup_entry_with_return, create_mock_config_entry
 
@@ -27,7 +43,6 @@ async def test_setup_entry(
 
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         # Use the config_entries.async_setup to properly set entry state
         assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
@@ -37,6 +52,38 @@ async def test_setup_entry(
     assert mock_config_entry.runtime_data is not None
 
 
+@pytest.mark.requires_integration
+async def test_setup_entry_modbus(hass: HomeAssistant, mock_nrgkick_api) -> None:
+    """Test the device is polled over Modbus TCP if selected in the options."""
+    entry = create_mock_config_entry(
+        data={CONF_HOST: "192.168.1.100"},
+        options={
+            CONF_TRANSPORT: TRANSPORT_MODBUS,
+            CONF_MODBUS_PORT: 5020,
+            CONF_SCAN_INTERVAL: 2,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    with (
+        patch("custom_components.nrgkick.NRGkickAPI") as rest_api,
+        patch(
+            "custom_components.nrgkick.NRGkickModbusAPI",
+            return_value=mock_nrgkick_api,
+        ) as modbus_api,
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    modbus_api.assert_called_once_with(host="192.168.1.100", port=5020)
+    rest_api.assert_not_called()
+    assert entry.runtime_data.update_interval == timedelta(seconds=2)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    mock_nrgkick_api.close.assert_awaited_once()
+
+
 async def test_setup_entry_failed_connection(
     hass: HomeAssistant, mock_config_entry: ConfigEntry, mock_nrgkick_api
 ) -> None:
@@ -47,12 +94,12 @@ async def test_setup_entry_failed_connection(
 
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         assert not await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
 
     assert mock_config_entry.state is ConfigEntryState.SETUP_RETRY
+    mock_nrgkick_api.close.assert_awaited_once()
 
 
 @pytest.mark.requires_integration
@@ -64,7 +111,6 @@ async def test_unload_entry(
 
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         # Use proper setup to set entry state
         assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
@@ -75,6 +121,25 @@ async def test_unload_entry(
     await hass.async_block_till_done()
 
     assert mock_config_entry.state is ConfigEntryState.NOT_LOADED
+    mock_nrgkick_api.close.assert_awaited_once()
+
+
+async def test_session_closed_when_home_assistant_stops(
+    hass: HomeAssistant, mock_config_entry: ConfigEntry, mock_nrgkick_api
+) -> None:
+    """Test the device session is closed on shutdown, which doesn't unload."""
+    mock_config_entry.add_to_hass(hass)
+
+    with patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+    mock_nrgkick_api.close.assert_not_awaited()
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    mock_nrgkick_api.close.assert_awaited_once()
 
 
 @pytest.mark.requires_integration
@@ -86,7 +151,6 @@ async def test_reload_entry(
 
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         # Use proper setup to set entry state
         assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
@@ -95,12 +159,212 @@ async def test_reload_entry(
     # Test that reload calls the config_entries.async_reload
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         assert await hass.config_entries.async_reload(mock_config_entry.entry_id)
         await hass.async_block_till_done()
 
 
+def _snapshot(serial: str = "TEST123456") -> dict[str, Any]:
+    """Return stored snapshot data for the test entry."""
+    return {
+        "version": 1,
+        "minor_version": 1,
+        "key": "nrgkick.test_entry_id",
+        "data": {
+            "info": {
+                "general": {
+                    "serial_number": serial,
+                    "device_name": "NRGkick Test",
+                    "model_type": "Gen2",
+                    "rated_current": 32.0,
+                }
+            },
+            "control": {
+                "current_set": 10.0,
+                "charge_pause": 1,
+                "energy_limit": 0,
+                "phase_count": 3,
+            },
+            "values": {},
+        },
+    }
+
+
+async def test_setup_entry_from_snapshot(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: ConfigEntry,
+    mock_nrgkick_api,
+) -> None:
+    """Test setup uses the stored snapshot, marked stale, until the device answers."""
+    hass_storage["nrgkick.test_entry_id"] = _snapshot()
+    mock_config_entry.add_to_hass(hass)
+    device_answers = asyncio.Event()
+    info = mock_nrgkick_api.get_info.return_value
+    info_failures = [NRGkickApiClientCommunicationError()]
+
+    async def get_info(*_: Any) -> dict[str, Any]:
+        await device_answers.wait()
+        if info_failures:
+            raise info_failures.pop()
+        return info
+
+    mock_nrgkick_api.get_info.side_effect = get_info
+
+    with patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert mock_config_entry.state is ConfigEntryState.LOADED
+        coordinator = mock_config_entry.runtime_data
+        assert coordinator.is_stale
+        assert coordinator.data["control"]["current_set"] == 10.0
+        state = hass.states.get("switch.nrgkick_test_charge_pause")
+        assert state.state == "on"
+        assert state.attributes[ATTR_STALE] is True
+        state = hass.states.get("sensor.nrgkick_test_rated_current")
+        assert state.attributes[ATTR_STALE] is True
+
+        # /info fails, so only its entities keep showing restored values.
+        device_answers.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        assert coordinator.restored_endpoints == {"info"}
+        assert coordinator.data["control"]["current_set"] == 16.0
+        state = hass.states.get("switch.nrgkick_test_charge_pause")
+        assert state.state == "off"
+        assert ATTR_STALE not in state.attributes
+        state = hass.states.get("sensor.nrgkick_test_rated_current")
+        assert state.attributes[ATTR_STALE] is True
+
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    assert not coordinator.is_stale
+    # The unchanged value is updated too, to drop the marker.
+    state = hass.states.get("sensor.nrgkick_test_rated_current")
+    assert state.state == "32.0"
+    assert ATTR_STALE not in state.attributes
+
+
+async def test_setup_entry_snapshot_of_other_device(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: ConfigEntry,
+    mock_nrgkick_api,
+) -> None:
+    """Test a snapshot of another device is ignored."""
+    hass_storage["nrgkick.test_entry_id"] = _snapshot("OTHER")
+    mock_config_entry.add_to_hass(hass)
+    mock_nrgkick_api.get_info.side_effect = NRGkickApiClientCommunicationError
+
+    with patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api):
+        assert not await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert mock_config_entry.state is ConfigEntryState.SETUP_RETRY
+
+
+async def test_snapshot_saved_and_removed(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: ConfigEntry,
+    mock_nrgkick_api,
+) -> None:
+    """Test the snapshot is saved while polling and removed with the entry."""
+    mock_config_entry.add_to_hass(hass)
+
+    with patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+        assert "nrgkick.test_entry_id" not in hass_storage
+
+        # Polls every 30 seconds don't postpone the save.
+        now = dt_util.utcnow()
+        polls = mock_nrgkick_api.get_values.await_count
+        for step in range(1, 11):
+            assert "nrgkick.test_entry_id" not in hass_storage
+            async_fire_time_changed(hass, now + timedelta(seconds=30 * step))
+            await hass.async_block_till_done(wait_background_tasks=True)
+        assert mock_nrgkick_api.get_values.await_count > polls + 3
+
+    stored = hass_storage["nrgkick.test_entry_id"]["data"]
+    assert stored["control"]["current_set"] == 16.0
+    assert stored["info"]["general"]["serial_number"] == "TEST123456"
+
+    assert await hass.config_entries.async_remove(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert "nrgkick.test_entry_id" not in hass_storage
+
+
+async def test_snapshot_saved_after_command(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: ConfigEntry,
+    mock_nrgkick_api,
+) -> None:
+    """Test confirmed control settings are persisted without waiting for a poll."""
+    mock_config_entry.add_to_hass(hass)
+
+    with patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        stored = hass_storage["nrgkick.test_entry_id"]["data"]
+        assert stored["control"]["charge_pause"] == 0
+
+        mock_nrgkick_api.set_charge_pause.return_value = {"charge_pause": 1}
+        await mock_config_entry.runtime_data.async_set_charge_pause(True)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+    stored = hass_storage["nrgkick.test_entry_id"]["data"]
+    assert stored["control"]["charge_pause"] == 1
+
+
+async def test_snapshot_written_on_unload(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: ConfigEntry,
+    mock_nrgkick_api,
+) -> None:
+    """Test unloading writes the pending snapshot instead of leaving it behind.
+
+    The store of the unloaded coordinator must not write its older data over
+    the snapshot of the reloaded entry when Home Assistant stops.
+    """
+    mock_config_entry.add_to_hass(hass)
+
+    with patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+        assert "nrgkick.test_entry_id" not in hass_storage
+
+        assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+        stored = hass_storage["nrgkick.test_entry_id"]["data"]
+        assert stored["control"]["current_set"] == 16.0
+
+        mock_nrgkick_api.get_control.return_value = {
+            **mock_nrgkick_api.get_control.return_value,
+            "current_set": 10.0,
+        }
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=301))
+        await hass.async_block_till_done()
+        assert hass_storage["nrgkick.test_entry_id"]["data"]["control"] == {
+            **stored["control"],
+            "current_set": 10.0,
+        }
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+    stored = hass_storage["nrgkick.test_entry_id"]["data"]
+    assert stored["control"]["current_set"] == 10.0
+
+
 @pytest.mark.requires_integration
 async def test_coordinator_update_success(
     hass: HomeAssistant,
@@ -119,7 +383,6 @@ async def test_coordinator_update_success(
 
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         # Use proper setup to set entry state
         assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
@@ -181,7 +444,6 @@ async def test_coordinator_async_set_current(
 
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
@@ -206,7 +468,6 @@ async def test_coordinator_async_set_charge_pause(
 
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
@@ -231,7 +492,6 @@ async def test_coordinator_async_set_energy_limit(
 
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
@@ -256,7 +516,6 @@ async def test_coordinator_async_set_phase_count(
 
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
@@ -283,7 +542,6 @@ async def test_coordinator_command_blocked_by_solar(
 
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
@@ -310,7 +568,6 @@ async def test_coordinator_command_unexpected_value(
 
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
@@ -0,0 +1,373 @@
+"""Tests for the NRGkick Modbus TCP client."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+import logging
+import struct
+
+import pytest
+
+from custom_components.nrgkick.api import NRGkickApiClientCommunicationError
+from custom_components.nrgkick.modbus import (
+    NRGkickModbusAPI,
+    bytes_to_registers,
+    registers_to_bytes,
+)
+
+# The stand-in server listens on a local TCP port.
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+_MBAP = struct.Struct(">HHHB")
+
+
+class ModbusStandIn:
+    """Minimal Modbus TCP server with the NRGkick register layout."""
+
+    def __init__(self) -> None:
+        """Initialize the register space."""
+        self.registers = [0] * 264
+        # Register ranges that answer with an illegal data address exception.
+        self.missing: list[range] = []
+        self.requests: list[tuple[int, int, int]] = []
+        self.connections = 0
+        self._writers: set[asyncio.StreamWriter] = set()
+        self.server: asyncio.Server | None = None
+        self.port = 0
+
+    def put(self, address: int, fmt: str, value: object) -> None:
+        """Store a little-endian value starting at address."""
+        data = struct.pack(f"<{fmt}", value)
+        if len(data) % 2:
+            data += b"\0"
+        registers = bytes_to_registers(data)
+        self.registers[address : address + len(registers)] = registers
+
+    def put_string(self, address: int, count: int, value: str) -> None:
+        """Store a NUL padded string16 value."""
+        self.put(address, f"{count * 2}s", value.encode())
+
+    def _readable(self, start: int, count: int) -> bool:
+        """Return if the range is provided by the device."""
+        if start + count > len(self.registers):
+            return False
+        return not any(
+            start < block.stop and block.start < start + count for block in self.missing
+        )
+
+    def _handle(self, function: int, data: bytes) -> bytes:
+        """Return the response PDU for a request PDU."""
+        if function == 0x03:
+            start, count = struct.unpack(">HH", data)
+            self.requests.append((function, start, count))
+            if not self._readable(start, count):
+                return bytes((function | 0x80, 0x02))
+            values = self.registers[start : start + count]
+            return bytes((function, count * 2)) + struct.pack(f">{count}H", *values)
+        if function == 0x06:
+            address, value = struct.unpack(">HH", data)
+            self.requests.append((function, address, 1))
+            if address == 198 and value not in (1, 2, 3):
+                return bytes((function | 0x80, 0x03))
+            self.registers[address] = value
+            return bytes((function,)) + data
+        if function == 0x10:
+            address, count, _ = struct.unpack(">HHB", data[:5])
+            self.requests.append((function, address, count))
+            values = struct.unpack(f">{count}H", data[5:])
+            self.registers[address : address + count] = values
+            return bytes((function,)) + data[:4]
+        return bytes((function | 0x80, 0x01))
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve requests of a single client connection."""
+        self.connections += 1
+        self._writers.add(writer)
+        try:
+            while True:
+                transaction, protocol, length, unit = _MBAP.unpack(
+                    await reader.readexactly(_MBAP.size)
+                )
+                pdu = await reader.readexactly(length - 1)
+                response = self._handle(pdu[0], pdu[1:])
+                writer.write(
+                    _MBAP.pack(transaction, protocol, len(response) + 1, unit)
+                    + response
+                )
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def start(self) -> None:
+        """Start listening on a free local port."""
+        self.server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop the server and drop all client connections."""
+        assert self.server is not None
+        self.server.close()
+        for writer in list(self._writers):
+            writer.close()
+            await writer.wait_closed()
+        await self.server.wait_closed()
+
+
+@pytest.fixture
+async def device() -> AsyncGenerator[ModbusStandIn]:
+    """Return a running Modbus stand-in with example data."""
+    device = ModbusStandIn()
+    device.put_string(0, 11, "T2332500000000000S1D2")
+    device.put_string(11, 16, "NRGkick Gen2 SIM")
+    device.put_string(27, 8, "NRGkick 🔌")
+    device.put(35, "H", 32)
+    device.put(36, "H", 3)
+    device.put(37, "H", 320)
+    device.put(38, "H", 1)
+    device.put(45, "H", 7)
+    device.put_string(46, 8, "192.168.0.10")
+    device.put(79, "h", -62)
+    device.put(114, "f", 46.5)
+    device.put_string(122, 8, "4.0.0.33")
+    device.put(194, "H", 160)
+    device.put(196, "I", 100_000)
+    device.put(198, "H", 3)
+    device.put(199, "Q", 14_187_000)
+    device.put(205, "H", 23_427)
+    device.put(210, "i", -11_040_500)
+    device.put(217, "H", 23_788)
+    device.put(226, "i", 3_680_000)
+    device.put(243, "h", -999)
+    device.put(251, "H", 3)
+    device.put(258, "h", 2833)
+    device.put(259, "h", -512)
+    await device.start()
+    yield device
+    await device.stop()
+
+
+@pytest.fixture
+async def client(device: ModbusStandIn) -> AsyncGenerator[NRGkickModbusAPI]:
+    """Return a Modbus client connected to the stand-in."""
+    api = NRGkickModbusAPI("127.0.0.1", port=device.port)
+    yield api
+    await api.close()
+
+
+def test_register_byte_order() -> None:
+    """Test multi-register values use little-endian register and byte order."""
+    registers = bytes_to_registers(struct.pack("<I", 0x12345678))
+    assert registers == [0x5678, 0x1234]
+    assert registers_to_bytes(registers) == b"\x78\x56\x34\x12"
+
+
+async def test_get_info(client: NRGkickModbusAPI, device: ModbusStandIn) -> None:
+    """Test info is decoded into the REST API structure."""
+    device.missing = [range(80, 114), range(186, 194)]
+
+    info = await client.get_info()
+
+    assert info["general"] == {
+        "serial_number": "T2332500000000000S1D2",
+        "model_type": "NRGkick Gen2 SIM",
+        "device_name": "NRGkick 🔌",
+        "rated_current": 32,
+    }
+    assert info["connector"]["max_current"] == 32.0
+    assert info["connector"]["type"] == 1
+    assert info["grid"]["phases"] == 7
+    assert info["network"]["ip_address"] == "192.168.0.10"
+    assert info["network"]["rssi"] == -62
+    assert info["gps"]["latitude"] == 46.5
+    assert info["versions"]["sw_sm"] == "4.0.0.33"
+    assert "sw_cm" not in info["versions"]
+    assert "cellular" not in info
+
+    # Unavailable optional blocks are not requested again.
+    device.requests.clear()
+    await client.get_info()
+    assert [start for _, start, _ in device.requests] == [0, 114, 122]
+
+
+async def test_get_info_sections(
+    client: NRGkickModbusAPI, device: ModbusStandIn
+) -> None:
+    """Test only the blocks of the requested sections are read."""
+    info = await client.get_info(["general", "grid"])
+
+    assert set(info) == {"general", "grid"}
+    assert device.requests == [(0x03, 0, 80)]
+
+
+async def test_get_values(client: NRGkickModbusAPI, device: ModbusStandIn) -> None:
+    """Test values are read with a single request and scaled."""
+    values = await client.get_values()
+
+    assert device.requests == [(0x03, 199, 65)]
+    assert client.response_sizes["values"] == 130
+    assert values["energy"]["total_charged_energy"] == 14_187_000
+    assert values["powerflow"]["charging_voltage"] == 234.27
+    assert values["powerflow"]["total_active_power"] == -11_040.5
+    assert values["powerflow"]["l1"]["voltage"] == 237.88
+    assert values["powerflow"]["l2"]["active_power"] == 3680.0
+    assert values["powerflow"]["l2"]["power_factor"] == -0.999
+    assert values["powerflow"]["n"] == {"current": 0.0}
+    assert values["general"]["status"] == 3
+    assert values["temperatures"]["housing"] == 28.33
+    assert values["temperatures"]["connector_l1"] == -5.12
+
+    assert set(await client.get_values(["energy"])) == {"energy"}
+
+
+async def test_get_control(client: NRGkickModbusAPI) -> None:
+    """Test control values are decoded."""
+    assert await client.get_control() == {
+        "current_set": 16.0,
+        "charge_pause": 0,
+        "energy_limit": 100_000,
+        "phase_count": 3,
+    }
+
+
+async def test_set_control(client: NRGkickModbusAPI, device: ModbusStandIn) -> None:
+    """Test control writes return the value read back from the device."""
+    assert await client.set_current(6.7) == {"current_set": 6.7}
+    assert device.registers[194] == 67
+    assert await client.set_charge_pause(True) == {"charge_pause": 1}
+    assert await client.set_energy_limit(250_000) == {"energy_limit": 250_000}
+    assert (0x10, 196, 2) in device.requests
+    assert await client.set_phase_count(1) == {"phase_count": 1}
+
+    with pytest.raises(ValueError):
+        await client.set_phase_count(4)
+
+
+async def test_set_control_batch(
+    client: NRGkickModbusAPI, device: ModbusStandIn
+) -> None:
+    """Test adjacent control registers are written with a single request."""
+    assert await client.set_control(
+        current=10.0, charge_pause=True, energy_limit=5000, phase_count=1
+    ) == {
+        "current_set": 10.0,
+        "charge_pause": 1,
+        "energy_limit": 5000,
+        "phase_count": 1,
+    }
+    assert device.requests == [(0x10, 194, 5), (0x03, 194, 5)]
+
+    device.requests.clear()
+    await client.set_control(current=12.0, phase_count=3)
+    assert device.requests == [(0x06, 194, 1), (0x06, 198, 1), (0x03, 194, 5)]
+
+
+async def test_set_control_rejected(
+    client: NRGkickModbusAPI, device: ModbusStandIn
+) -> None:
+    """Test a rejected write is reported in the response like the REST API."""
+    device.registers[198] = 3
+    response = await client._async_write_control("phase_count", 198, [5])
+
+    assert "Response" in response
+    assert device.registers[198] == 3
+
+
+async def test_connection_is_reused(
+    client: NRGkickModbusAPI, device: ModbusStandIn
+) -> None:
+    """Test all requests share a single TCP connection."""
+    await client.get_info()
+    await client.get_control()
+    await client.get_values()
+
+    assert device.connections == 1
+    assert await client.test_connection()
+
+
+async def test_reconnect_after_connection_loss(
+    client: NRGkickModbusAPI, device: ModbusStandIn
+) -> None:
+    """Test a connection closed by the device is reopened transparently."""
+    await client.get_control()
+    await device.stop()
+    await device.start()
+    client.port = device.port
+
+    assert (await client.get_control())["phase_count"] == 3
+    assert device.connections == 2
+
+
+async def test_communication_error(
+    device: ModbusStandIn, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an unreachable device raises a communication error.
+
+    The error is only logged at debug level, the coordinator reports polls
+    that fail.
+    """
+    await device.stop()
+    api = NRGkickModbusAPI("127.0.0.1", port=device.port)
+    await device.start()
+
+    with (
+        caplog.at_level(logging.DEBUG),
+        pytest.raises(NRGkickApiClientCommunicationError),
+    ):
+        await api.get_values()
+
+    assert "Communication error with NRGkick device" in caplog.text
+    assert not [
+        record
+        for record in caplog.records
+        if record.name.startswith("custom_components")
+        and record.levelno > logging.DEBUG
+    ]
+
+
+async def test_concurrent_reads_share_one_request(
+    client: NRGkickModbusAPI, device: ModbusStandIn
+) -> None:
+    """Test concurrent reads of the same registers are sent once."""
+    results = await asyncio.gather(
+        client.get_values(),
+        client.get_values(["energy"]),
+        client.get_control(),
+        client.get_control(),
+    )
+
+    assert device.requests == [(0x03, 199, 65), (0x03, 194, 5)]
+    assert set(results[1]) == {"energy"}
+    assert results[2] == results[3]
+    assert client.request_count == 2
+    assert client.coalesced_count == 2
+
+    # The value read back after a write is not shared with a read in progress.
+    device.requests.clear()
+    _, written = await asyncio.gather(client.get_control(), client.set_current(10.0))
+    assert written == {"current_set": 10.0}
+    assert device.requests.count((0x03, 194, 5)) == 2
+    assert client.coalesced_count == 2
+
+    device.requests.clear()
+    _, written = await asyncio.gather(
+        client.get_control(), client.set_control(current=12.0, charge_pause=True)
+    )
+    assert written == {"current_set": 12.0, "charge_pause": 1}
+    assert device.requests.count((0x03, 194, 5)) == 2
+    assert client.coalesced_count == 2
+
+
+async def test_missing_required_block(
+    client: NRGkickModbusAPI, device: ModbusStandIn
+) -> None:
+    """Test an exception response for required registers is an error."""
+    device.missing = [range(199, 264)]
+
+    with pytest.raises(NRGkickApiClientCommunicationError):
+        await client.get_values()
@@ -7,7 +7,12 @@ import pytest
 from custom_components.nrgkick import NRGkickEntity
 from custom_components.nrgkick.const import DOMAIN
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers import (
+    device_registry as dr,
+    entity_platform,
+    entity_registry as er,
+)
+from homeassistant.helpers.entity import EntityDescription
 
 
 @pytest.mark.requires_integration
@@ -30,7 +35,6 @@ async def test_device_name_fallback(
 
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
@@ -75,7 +79,6 @@ async def test_device_name_custom(
 
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
@@ -100,6 +103,60 @@ async def test_device_name_custom(
     assert entry.translation_key == "total_active_power"
 
 
+@pytest.mark.requires_integration
+async def test_device_info_shared_and_updated(
+    hass: HomeAssistant,
+    mock_config_entry,
+    mock_nrgkick_api,
+    mock_info_data,
+    mock_control_data,
+    mock_values_data,
+) -> None:
+    """Test entities share one DeviceInfo and the registry follows /info."""
+    mock_config_entry.add_to_hass(hass)
+
+    mock_info_data["versions"] = {"sw_sm": "1.0.0"}
+    mock_nrgkick_api.get_info.return_value = mock_info_data
+    mock_nrgkick_api.get_control.return_value = mock_control_data
+    mock_nrgkick_api.get_values.return_value = mock_values_data
+
+    with (
+        patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
+    ):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = mock_config_entry.runtime_data
+    entities = [
+        entity
+        for platform in entity_platform.async_get_platforms(hass, DOMAIN)
+        for entity in platform.entities.values()
+    ]
+    assert entities
+    assert all(entity.device_info is coordinator.device_info for entity in entities)
+
+    device_registry = dr.async_get(hass)
+    identifiers = {(DOMAIN, mock_info_data["general"]["serial_number"])}
+    device = device_registry.async_get_device(identifiers=identifiers)
+    assert device
+    assert device.sw_version == "1.0.0"
+
+    # A firmware update and a new name are applied to the existing device.
+    mock_nrgkick_api.get_info.return_value = {
+        **mock_info_data,
+        "general": {**mock_info_data["general"], "device_name": "Garage Charger"},
+        "versions": {"sw_sm": "1.1.0"},
+    }
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    updated = device_registry.async_get_device(identifiers=identifiers)
+    assert updated
+    assert updated.id == device.id
+    assert updated.name == "Garage Charger"
+    assert updated.sw_version == "1.1.0"
+
+
 @pytest.mark.requires_integration
 async def test_entity_id_uses_english_key(
     hass: HomeAssistant,
@@ -125,7 +182,6 @@ async def test_entity_id_uses_english_key(
 
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
@@ -174,7 +230,9 @@ def test_suggested_object_id_returns_key() -> None:
     }
 
     # Create entity with a specific key
-    entity = NRGkickEntity(mock_coordinator, "total_active_power")
+    entity = NRGkickEntity(
+        mock_coordinator, EntityDescription(key="total_active_power")
+    )
 
     # Verify suggested_object_id returns the key
     assert entity.suggested_object_id == "total_active_power"
@@ -0,0 +1,119 @@
+"""Tests for the NRGkick polling scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.nrgkick.const import CONF_SCAN_INTERVAL
+from custom_components.nrgkick.coordinator import NRGkickDataUpdateCoordinator
+from custom_components.nrgkick.scheduler import (
+    NRGkickPollScheduler,
+    async_get_scheduler,
+)
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from . import create_mock_config_entry
+
+
+def _create_coordinator(
+    hass: HomeAssistant, index: int, api: MagicMock | None = None
+) -> NRGkickDataUpdateCoordinator:
+    """Create a coordinator for an additional device."""
+    entry = create_mock_config_entry(
+        data={CONF_HOST: f"192.168.1.{100 + index}"},
+        options={CONF_SCAN_INTERVAL: 30},
+        entry_id=f"entry_{index}",
+        unique_id=f"TEST{index}",
+    )
+    entry.add_to_hass(hass)
+    return NRGkickDataUpdateCoordinator(hass, api or MagicMock(), entry)
+
+
+async def test_polls_are_spread_over_the_interval(hass: HomeAssistant) -> None:
+    """Test devices with the same interval poll at evenly spaced offsets."""
+    coordinators = [_create_coordinator(hass, index) for index in range(3)]
+    scheduler = async_get_scheduler(hass)
+    assert scheduler.device_count == 3
+
+    cancel = [scheduler.async_schedule(coordinator) for coordinator in coordinators]
+    offsets = sorted(scheduler._due[coordinator] % 30 for coordinator in coordinators)
+    assert offsets == [0, 10, 20]
+    now = hass.loop.time()
+    assert all(15 <= when - now <= 45 for when in scheduler._due.values())
+
+    for cancel_poll in cancel:
+        cancel_poll()
+    assert scheduler._timer is None
+
+
+async def test_concurrent_polls_are_capped(hass: HomeAssistant) -> None:
+    """Test due polls wait for a free slot and the cycle duration is recorded."""
+    scheduler = hass.data.setdefault(
+        "nrgkick", NRGkickPollScheduler(hass, max_concurrent_polls=1)
+    )
+    running = 0
+    max_running = 0
+    release = asyncio.Event()
+
+    async def _refresh() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await release.wait()
+        running -= 1
+
+    coordinators = []
+    for index in range(3):
+        coordinator = _create_coordinator(hass, index)
+        coordinator.async_scheduled_refresh = AsyncMock(side_effect=_refresh)
+        coordinators.append(coordinator)
+        scheduler._due[coordinator] = hass.loop.time() - 1
+
+    scheduler._async_start_due_polls(hass.loop.time())
+    await asyncio.sleep(0)
+    assert running == 1
+
+    # A poll that is still pending is not started again.
+    scheduler._due[coordinators[0]] = hass.loop.time() - 1
+    scheduler._async_start_due_polls(hass.loop.time())
+
+    release.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert max_running == 1
+    for coordinator in coordinators:
+        coordinator.async_scheduled_refresh.assert_awaited_once()
+    assert scheduler.last_cycle_polls == 3
+    assert scheduler.last_cycle_duration is not None
+
+
+@pytest.mark.requires_integration
+async def test_entry_is_polled_by_scheduler(
+    hass: HomeAssistant, mock_config_entry, mock_nrgkick_api
+) -> None:
+    """Test a set up entry is polled when its slot is due."""
+    mock_config_entry.add_to_hass(hass)
+    with patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    scheduler = async_get_scheduler(hass)
+    coordinator = mock_config_entry.runtime_data
+    assert coordinator in scheduler._due
+    calls = mock_nrgkick_api.get_values.call_count
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=60))
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert mock_nrgkick_api.get_values.call_count == calls + 1
+    assert coordinator in scheduler._due
+
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    assert scheduler.device_count == 0
+    assert scheduler._timer is None
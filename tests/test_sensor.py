@@ -1,12 +1,18 @@
 """Tests for the NRGkick sensor platform."""
 
+from copy import deepcopy
+from datetime import timedelta
+import time
 from unittest.mock import patch
 
 import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
+from custom_components.nrgkick.const import CONF_DEADBANDS, DEFAULT_MAX_STATE_AGE
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import UnitOfPower, UnitOfTemperature
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 
 
 @pytest.fixture
@@ -95,7 +101,6 @@ async def test_sensor_entities(
     # Setup entry
     with (
         patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
-        patch("custom_components.nrgkick.async_get_clientsession"),
     ):
         assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
@@ -148,3 +153,172 @@ async def test_sensor_entities(
         state = get_state_by_key(key)
         assert state is not None, f"{key}: state not found"
         assert float(state.state) == expected, f"{key}: expected {expected}"
+
+
+@pytest.mark.requires_integration
+async def test_sensor_deadband(
+    hass: HomeAssistant,
+    mock_config_entry,
+    mock_nrgkick_api,
+    mock_info_data,
+    mock_control_data,
+    mock_values_data_sensor,
+) -> None:
+    """Test insignificant changes are held back until the maximum state age."""
+    mock_config_entry.add_to_hass(hass)
+    mock_nrgkick_api.get_info.return_value = mock_info_data
+    mock_nrgkick_api.get_control.return_value = mock_control_data
+    mock_nrgkick_api.get_values.return_value = mock_values_data_sensor
+
+    with (
+        patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
+    ):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    from homeassistant.helpers import entity_registry as er
+
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", "nrgkick", "TEST123456_l1_voltage"
+    )
+    assert entity_id is not None
+    coordinator = mock_config_entry.runtime_data
+
+    def _set_voltage(voltage: float) -> None:
+        data = deepcopy(coordinator.data)
+        data["values"]["powerflow"]["l1"]["voltage"] = voltage
+        coordinator.async_set_updated_data(data)
+
+    assert float(hass.states.get(entity_id).state) == 230.0
+
+    # A change within the deadband is not written.
+    _set_voltage(230.2)
+    await hass.async_block_till_done()
+    assert float(hass.states.get(entity_id).state) == 230.0
+
+    # A significant change is written immediately.
+    _set_voltage(231.0)
+    await hass.async_block_till_done()
+    assert float(hass.states.get(entity_id).state) == 231.0
+
+    # A held back change is written once the maximum state age expired.
+    _set_voltage(231.3)
+    await hass.async_block_till_done()
+    assert float(hass.states.get(entity_id).state) == 231.0
+
+    with patch(
+        "custom_components.nrgkick.sensor.time.monotonic",
+        return_value=time.monotonic() + DEFAULT_MAX_STATE_AGE,
+    ):
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=DEFAULT_MAX_STATE_AGE)
+        )
+        await hass.async_block_till_done()
+    assert float(hass.states.get(entity_id).state) == 231.3
+
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+
+
+@pytest.mark.requires_integration
+async def test_sensor_deadband_options(
+    hass: HomeAssistant,
+    mock_config_entry,
+    mock_nrgkick_api,
+    mock_info_data,
+    mock_control_data,
+    mock_values_data_sensor,
+) -> None:
+    """Test the absolute deadbands of device classes can be changed."""
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={CONF_DEADBANDS: {"voltage": 2.0, "power": 0.0}}
+    )
+    mock_nrgkick_api.get_info.return_value = mock_info_data
+    mock_nrgkick_api.get_control.return_value = mock_control_data
+    mock_nrgkick_api.get_values.return_value = mock_values_data_sensor
+
+    with (
+        patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
+    ):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    from homeassistant.helpers import entity_registry as er
+
+    registry = er.async_get(hass)
+    voltage_id = registry.async_get_entity_id(
+        "sensor", "nrgkick", "TEST123456_l1_voltage"
+    )
+    power_id = registry.async_get_entity_id(
+        "sensor", "nrgkick", "TEST123456_total_active_power"
+    )
+    coordinator = mock_config_entry.runtime_data
+
+    def _set_values(voltage: float, power: float) -> None:
+        data = deepcopy(coordinator.data)
+        data["values"]["powerflow"]["l1"]["voltage"] = voltage
+        data["values"]["powerflow"]["total_active_power"] = power
+        coordinator.async_set_updated_data(data)
+
+    # Within the larger voltage deadband and the remaining relative power one.
+    _set_values(231.5, 11050)
+    await hass.async_block_till_done()
+    assert float(hass.states.get(voltage_id).state) == 230.0
+    assert float(hass.states.get(power_id).state) == 11000
+
+    _set_values(232.0, 11200)
+    await hass.async_block_till_done()
+    assert float(hass.states.get(voltage_id).state) == 232.0
+    assert float(hass.states.get(power_id).state) == 11200
+
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+
+
+@pytest.mark.requires_integration
+async def test_request_stats_sensors(
+    hass: HomeAssistant,
+    mock_config_entry,
+    mock_nrgkick_api,
+    mock_info_data,
+    mock_control_data,
+    mock_values_data_sensor,
+) -> None:
+    """Test request statistics are disabled diagnostic sensors."""
+    from homeassistant.helpers import entity_registry as er
+
+    mock_config_entry.add_to_hass(hass)
+    mock_nrgkick_api.get_info.return_value = mock_info_data
+    mock_nrgkick_api.get_control.return_value = mock_control_data
+    mock_nrgkick_api.get_values.return_value = mock_values_data_sensor
+    entity_registry = er.async_get(hass)
+    entity_registry.async_get_or_create(
+        "sensor",
+        "nrgkick",
+        "TEST123456_values_latency_p95",
+        suggested_object_id="nrgkick_test_values_latency_p95",
+        config_entry=mock_config_entry,
+    )
+
+    with (
+        patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api),
+    ):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    entity_id = entity_registry.async_get_entity_id(
+        "sensor", "nrgkick", "TEST123456_poll_failures"
+    )
+    assert entity_id is not None
+    assert entity_registry.async_get(entity_id).disabled_by is (
+        er.RegistryEntryDisabler.INTEGRATION
+    )
+
+    state = hass.states.get("sensor.nrgkick_test_values_latency_p95")
+    assert state is not None
+    assert float(state.state) >= 0
+    assert state.attributes["unit_of_measurement"] == "ms"
+    assert state.attributes["friendly_name"] == (
+        "NRGkick Test /values latency (95th percentile)"
+    )
+
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
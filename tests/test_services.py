@@ -0,0 +1,178 @@
+"""Tests for the NRGkick service actions."""
+
+from unittest.mock import patch
+
+import pytest
+import voluptuous as vol
+
+from custom_components.nrgkick.const import DOMAIN, SERVICE_SET_CONTROL
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import entity_registry as er
+
+
+@pytest.fixture
+async def setup_integration(
+    hass: HomeAssistant,
+    mock_config_entry,
+    mock_nrgkick_api,
+    mock_info_data,
+    mock_control_data,
+    mock_values_data,
+):
+    """Set up the integration with mocked device data."""
+    mock_config_entry.add_to_hass(hass)
+    mock_nrgkick_api.get_info.return_value = mock_info_data
+    mock_nrgkick_api.get_control.return_value = mock_control_data
+    mock_nrgkick_api.get_values.return_value = mock_values_data
+
+    with patch("custom_components.nrgkick.NRGkickAPI", return_value=mock_nrgkick_api):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+    return mock_config_entry
+
+
+@pytest.mark.requires_integration
+async def test_set_control(
+    hass: HomeAssistant, setup_integration, mock_nrgkick_api
+) -> None:
+    """Test several control values are set with a single command."""
+    mock_nrgkick_api.set_control.return_value = {
+        "current_set": 10.0,
+        "charge_pause": 1,
+        "phase_count": 1,
+    }
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_CONTROL,
+        {
+            "config_entry": setup_integration.entry_id,
+            "current_set": 10,
+            "charge_pause": True,
+            "phase_count": 1,
+        },
+        blocking=True,
+    )
+
+    mock_nrgkick_api.set_control.assert_awaited_once_with(
+        current=10.0, charge_pause=True, energy_limit=None, phase_count=1
+    )
+    mock_nrgkick_api.set_current.assert_not_called()
+    mock_nrgkick_api.set_phase_count.assert_not_called()
+    assert setup_integration.runtime_data.current_writer.writes == 1
+
+    entity_registry = er.async_get(hass)
+    for key, expected in (("current_set", 10.0), ("phase_count", 1.0)):
+        entity_id = entity_registry.async_get_entity_id(
+            "number", DOMAIN, f"TEST123456_{key}"
+        )
+        assert float(hass.states.get(entity_id).state) == expected
+
+
+@pytest.mark.requires_integration
+async def test_set_control_unexpected_value(
+    hass: HomeAssistant, setup_integration, mock_nrgkick_api
+) -> None:
+    """Test a value the device did not accept fails the action."""
+    mock_nrgkick_api.set_control.return_value = {
+        "charge_pause": 1,
+        "phase_count": 3,
+    }
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_CONTROL,
+            {
+                "config_entry": setup_integration.entry_id,
+                "charge_pause": True,
+                "phase_count": 1,
+            },
+            blocking=True,
+        )
+
+
+@pytest.mark.requires_integration
+async def test_set_control_current_above_maximum(
+    hass: HomeAssistant, setup_integration, mock_nrgkick_api
+) -> None:
+    """Test the current is limited to the maximum of the charger."""
+    coordinator = setup_integration.runtime_data
+    coordinator.async_set_updated_data(
+        {
+            **coordinator.data,
+            "info": {
+                **coordinator.data["info"],
+                "connector": {"max_current": 16.0},
+            },
+        }
+    )
+    assert coordinator.max_current == 16.0
+
+    with pytest.raises(
+        ServiceValidationError,
+        match=r"Charging current 20.0 A is above the maximum of 16.0 A",
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_CONTROL,
+            {
+                "config_entry": setup_integration.entry_id,
+                "current_set": 20,
+                "phase_count": 1,
+            },
+            blocking=True,
+        )
+
+    mock_nrgkick_api.set_control.assert_not_called()
+
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_CONTROL,
+            {"config_entry": setup_integration.entry_id, "current_set": 5},
+            blocking=True,
+        )
+
+
+@pytest.mark.requires_integration
+async def test_set_control_requires_a_value(
+    hass: HomeAssistant, setup_integration
+) -> None:
+    """Test the action needs at least one control value."""
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_CONTROL,
+            {"config_entry": setup_integration.entry_id},
+            blocking=True,
+        )
+
+
+@pytest.mark.requires_integration
+async def test_set_control_invalid_config_entry(
+    hass: HomeAssistant, setup_integration
+) -> None:
+    """Test unknown and unloaded config entries are rejected."""
+    with pytest.raises(
+        ServiceValidationError,
+        match=r"Config entry unknown is not an NRGkick config entry",
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_CONTROL,
+            {"config_entry": "unknown", "phase_count": 1},
+            blocking=True,
+        )
+
+    assert await hass.config_entries.async_unload(setup_integration.entry_id)
+    with pytest.raises(
+        ServiceValidationError, match=r"NRGkick NRGkick Test is not loaded"
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_CONTROL,
+            {"config_entry": setup_integration.entry_id, "phase_count": 1},
+            blocking=True,
+        )
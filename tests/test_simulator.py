@@ -0,0 +1,163 @@
+"""Tests of the integration against the simulated NRGkick JSON API."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+import json
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.nrgkick.api import (
+    NRGkickAPI,
+    NRGkickApiClientAuthenticationError,
+    NRGkickApiClientCommunicationError,
+)
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from . import create_mock_config_entry
+from .simulator import NRGkickSimulator, SimulatedCharger, start_fleet
+
+# The simulators listen on local TCP ports.
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+@pytest.fixture
+async def simulator() -> AsyncGenerator[NRGkickSimulator]:
+    """Return a running simulated charger."""
+    simulator = NRGkickSimulator(seed=1)
+    await simulator.start()
+    yield simulator
+    await simulator.stop()
+
+
+@pytest.fixture
+async def api(simulator: NRGkickSimulator) -> AsyncGenerator[NRGkickAPI]:
+    """Return an API client for the simulated charger."""
+    api = NRGkickAPI(simulator.address)
+    yield api
+    await api.close()
+
+
+async def test_read_endpoints(api: NRGkickAPI, simulator: NRGkickSimulator) -> None:
+    """Test sections and raw mode of the read endpoints."""
+    info = await api.get_info(["general", "grid"], raw=False)
+    assert set(info) == {"general", "grid"}
+    assert info["general"]["serial_number"] == simulator.charger.serial_number
+    assert info["grid"]["phases"] == "L1, L2, L3"
+
+    values = await api.get_values()
+    assert set(values) == {"energy", "powerflow", "general", "temperatures"}
+    assert values["general"]["status"] == 3
+    assert values["general"]["relay_state"] == 15
+    assert values["powerflow"]["total_active_power"] == 16 * 230 * 3
+    assert (await api.get_values(raw=False))["general"]["status"] == "CHARGING"
+
+    assert await api.get_control() == simulator.charger.control
+    assert api.response_sizes["control"] == len(json.dumps(simulator.charger.control))
+    assert simulator.requests["/values"] == 2
+
+
+async def test_set_control(api: NRGkickAPI, simulator: NRGkickSimulator) -> None:
+    """Test control values are set and invalid ones reported by the device."""
+    assert await api.set_control(current=10.5, charge_pause=True) == {
+        "current_set": 10.5,
+        "charge_pause": 1,
+    }
+    values = await api.get_values(["general"])
+    assert values["general"]["status"] == 2
+    assert values["general"]["charge_permitted"] == 0
+
+    response = await api.set_current(40)
+    assert "Response" in response
+    assert simulator.charger.control["current_set"] == 10.5
+
+
+async def test_charging_curve() -> None:
+    """Test the power tapers off near a full battery and stops at the limit."""
+    charger = SimulatedCharger(state_of_charge=0.9, seed=1)
+    tapered = charger.values({"powerflow"}, raw=True)["powerflow"]
+    assert 0 < tapered["total_active_power"] < 16 * 230 * 3
+
+    charger.control["energy_limit"] = 100
+    charger.time_scale = 3600
+    charger._updated_at -= 1
+    values = charger.values(set(), raw=True)
+    assert values["energy"]["charged_energy"] == 100
+    assert values["general"]["status"] == 2
+    assert values["general"]["warning_code"] == 3
+
+    charger.unplug()
+    assert charger.values({"general"}, raw=True)["general"]["status"] == 1
+
+
+async def test_basic_auth(simulator: NRGkickSimulator) -> None:
+    """Test requests with wrong credentials are rejected."""
+    simulator.authorization = NRGkickSimulator(
+        username="admin", password="secret"
+    ).authorization
+    api = NRGkickAPI(simulator.address, username="admin", password="wrong")
+    with pytest.raises(NRGkickApiClientAuthenticationError):
+        await api.get_control()
+    await api.close()
+
+    api = NRGkickAPI(simulator.address, username="admin", password="secret")
+    assert (await api.get_control())["phase_count"] == 3
+    await api.close()
+
+
+@pytest.mark.parametrize(("error_rate", "drop_rate"), [(1.0, 0.0), (0.0, 1.0)])
+async def test_injected_faults(
+    api: NRGkickAPI, simulator: NRGkickSimulator, error_rate: float, drop_rate: float
+) -> None:
+    """Test HTTP errors and dropped connections are communication errors."""
+    simulator.error_rate = error_rate
+    simulator.drop_rate = drop_rate
+
+    with (
+        patch("nrgkick_api.api.MAX_RETRIES", 1),
+        pytest.raises(NRGkickApiClientCommunicationError),
+    ):
+        await api.get_values()
+
+
+async def test_integration_with_simulated_fleet(hass: HomeAssistant) -> None:
+    """Test config entries set up against simulated chargers."""
+    simulators = await start_fleet(3, username="admin", password="secret")
+    entries = []
+    for index, simulator in enumerate(simulators):
+        entry = create_mock_config_entry(
+            data={
+                CONF_HOST: simulator.address,
+                CONF_USERNAME: "admin",
+                CONF_PASSWORD: "secret",
+            },
+            entry_id=f"entry_{index}",
+            unique_id=simulator.charger.serial_number,
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+
+    # Setting up the integration sets up all of its config entries.
+    assert await hass.config_entries.async_setup(entries[0].entry_id)
+    await hass.async_block_till_done()
+
+    entity_registry = er.async_get(hass)
+    for entry, simulator in zip(entries, simulators, strict=True):
+        assert entry.state is ConfigEntryState.LOADED
+        entity_id = entity_registry.async_get_entity_id(
+            "sensor",
+            "nrgkick",
+            f"{simulator.charger.serial_number}_total_active_power",
+        )
+        assert entity_id is not None
+        assert float(hass.states.get(entity_id).state) == 16 * 230 * 3
+        assert simulator.requests["/info"] == 1
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    for simulator in simulators:
+        await simulator.stop()
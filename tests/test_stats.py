@@ -0,0 +1,39 @@
+"""Tests for the NRGkick request statistics."""
+
+from __future__ import annotations
+
+from custom_components.nrgkick.stats import RequestStats
+
+
+def test_request_stats() -> None:
+    """Test percentiles use the latest samples including failures."""
+    stats = RequestStats(sample_size=20)
+    assert stats.as_dict() == {
+        "requests": 0,
+        "failures": 0,
+        "latency_p50": None,
+        "latency_p95": None,
+        "latency_max": None,
+        "payload_size": None,
+    }
+
+    for latency in range(1, 20):
+        stats.record(latency / 1000, 512)
+    stats.record_failure(20.0)
+
+    assert stats.percentile(0.5) == 0.010
+    assert stats.percentile(0.95) == 0.019
+    assert stats.as_dict() == {
+        "requests": 20,
+        "failures": 1,
+        "latency_p50": 10.0,
+        "latency_p95": 19.0,
+        "latency_max": 20000.0,
+        "payload_size": 512,
+    }
+
+    # Only the latest samples are kept.
+    for _ in range(20):
+        stats.record(0.001)
+    assert stats.as_dict()["latency_max"] == 1.0
+    assert stats.requests == 40